@@ -1000,6 +1000,8 @@ function Home() {
                               ? "bg-green-100 text-green-800"
                               : test.status === "failed"
                               ? "bg-red-100 text-red-800"
+                              : test.status === "timeout"
+                              ? "bg-purple-100 text-purple-800"
                               : test.status === "running"
                               ? "bg-yellow-100 text-yellow-800"
                               : "bg-gray-100 text-gray-800"
@@ -1007,6 +1009,7 @@ function Home() {
                         >
                           {test.status === "completed" && "✅ 완료"}
                           {test.status === "failed" && "❌ 실패"}
+                          {test.status === "timeout" && "⏱️ 시간 초과"}
                           {test.status === "running" && "🔄 실행 중"}
                           {test.status === "pending" && "⏳ 대기"}
                         </span>
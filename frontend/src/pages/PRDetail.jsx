@@ -48,6 +48,8 @@ function PRDetail() {
       completed:
         "bg-gradient-to-r from-green-500 to-emerald-500 text-white shadow-lg",
       failed: "bg-gradient-to-r from-red-500 to-rose-500 text-white shadow-lg",
+      timeout:
+        "bg-gradient-to-r from-purple-500 to-fuchsia-500 text-white shadow-lg",
       running:
         "bg-gradient-to-r from-yellow-400 to-orange-400 text-white shadow-lg animate-pulse",
       pending:
@@ -56,6 +58,7 @@ function PRDetail() {
     const labels = {
       completed: "✅ 완료",
       failed: "❌ 실패",
+      timeout: "⏱️ 시간 초과",
       running: "🔄 실행 중",
       pending: "⏳ 대기",
     };
@@ -128,6 +131,14 @@ function PRDetail() {
                       )}
                     </div>
                     <div className="flex items-center gap-3">
+                      {scenario.carried_forward_from && (
+                        <span
+                          className="px-3 py-1 text-xs font-medium rounded-full bg-gray-100 text-gray-600 whitespace-nowrap"
+                          title="관련 파일이 바뀌지 않아 이전 커밋의 결과를 그대로 사용"
+                        >
+                          ↩️ {scenario.carried_forward_from.slice(0, 7)} 결과
+                        </span>
+                      )}
                       {scenario.success !== undefined && (
                         <div
                           className={`flex items-center gap-2 px-3 py-1.5 rounded-lg font-semibold text-sm ${
@@ -273,8 +284,8 @@ function PRDetail() {
       );
 
       if (response.data.success) {
-        alert(`✅ 시나리오 ${scenarioIndex + 1} 재실행이 완료되었습니다!`);
-        // 테스트 정보 새로고침
+        // 실행은 백그라운드에서 진행 - running 상태인 동안 주기적으로 다시 조회
+        alert(`✅ 시나리오 ${scenarioIndex + 1} 재실행을 시작했습니다.`);
         fetchTestDetail();
       } else {
         alert(`❌ 재실행 실패: ${response.data.error}`);
@@ -307,13 +318,8 @@ function PRDetail() {
       );
 
       if (response.data.success) {
-        alert(
-          `✅ ${
-            response.data.message ||
-            `${response.data.scenarios_count}개의 시나리오가 실행되었습니다!`
-          }`
-        );
-        // 테스트 정보 새로고침
+        // 실행은 백그라운드에서 진행 - running 상태인 동안 주기적으로 다시 조회
+        alert(`✅ ${response.data.message || "시나리오 재생성을 시작했습니다."}`);
         fetchTestDetail();
       } else {
         alert(`❌ 시나리오 생성 실패: ${response.data.error}`);
@@ -399,6 +405,35 @@ function PRDetail() {
             <p className="text-xs text-gray-400 mt-4">
               분석이 완료되면 자동으로 결과가 표시됩니다...
             </p>
+            {test.scenarios_total > 0 && (
+              <div className="mt-8 text-left max-w-xl mx-auto">
+                <p className="text-sm font-semibold text-gray-700 mb-2">
+                  시나리오 진행: {test.scenarios_completed || 0} /{" "}
+                  {test.scenarios_total}
+                </p>
+                <div className="w-full bg-gray-200 rounded-full h-2 mb-4">
+                  <div
+                    className="bg-blue-600 h-2 rounded-full transition-all"
+                    style={{
+                      width: `${Math.round(
+                        ((test.scenarios_completed || 0) /
+                          test.scenarios_total) *
+                          100
+                      )}%`,
+                    }}
+                  ></div>
+                </div>
+                {Array.isArray(test.test_results) && (
+                  <ul className="space-y-1">
+                    {test.test_results.map((result, idx) => (
+                      <li key={idx} className="text-sm text-gray-600">
+                        {result.success ? "✅" : "❌"} {result.scenario_name}
+                      </li>
+                    ))}
+                  </ul>
+                )}
+              </div>
+            )}
           </div>
         </div>
       </div>
@@ -195,6 +195,8 @@ function RepositoryDetail() {
       completed:
         "bg-gradient-to-r from-green-500 to-emerald-500 text-white shadow-lg",
       failed: "bg-gradient-to-r from-red-500 to-rose-500 text-white shadow-lg",
+      timeout:
+        "bg-gradient-to-r from-purple-500 to-fuchsia-500 text-white shadow-lg",
       running:
         "bg-gradient-to-r from-yellow-400 to-orange-400 text-white shadow-lg animate-pulse",
       pending:
@@ -203,6 +205,7 @@ function RepositoryDetail() {
     const labels = {
       completed: "✅ 완료",
       failed: "❌ 실패",
+      timeout: "⏱️ 시간 초과",
       running: "🔄 실행 중",
       pending: "⏳ 대기",
     };
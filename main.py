@@ -19,6 +19,10 @@ if __name__ == "__main__":
     # 데이터베이스 초기화
     init_db()
     
+    # 저장된 Webhook 이벤트/테스트 작업을 처리할 파이프라인 워커 시작 (재시작 전에 남은 작업 포함)
+    from server.services.pipeline_worker_pool import pipeline_worker_pool
+    pipeline_worker_pool.start()
+    
     vertex_ready = os.getenv('VERTEX_PROJECT_ID') and (
         os.getenv('GOOGLE_APPLICATION_CREDENTIALS') or
         os.path.exists(os.path.join(os.path.dirname(__file__), 'credentials', 'vertex_service_account.json'))
@@ -0,0 +1,41 @@
+# main_worker.py
+"""
+파이프라인 워커 프로세스 - 작업 대기열(pipeline_jobs)에서 PR 테스트와 Webhook 이벤트를 가져와 실행
+
+API/Polling 서버와 같은 DB를 사용하며, 여러 프로세스로 실행해도 작업은 Lease로 한 번씩만 실행된다.
+API/Polling 서버에서는 PIPELINE_IN_PROCESS_WORKERS=false로 설정하면 이 프로세스만 테스트를 실행한다.
+"""
+import os
+import time
+from dotenv import load_dotenv
+
+# .env를 먼저 로드하여 이후 임포트되는 모듈들이 환경변수에 접근할 수 있게 함
+load_dotenv()
+
+from server.models import init_db
+from server.services.polling_service import PollingService
+from server.services.webhook_event_service import WebhookEventService
+
+if __name__ == "__main__":
+    # 필수 디렉토리 생성
+    from server.config import VIDEOS_DIR, SCREENSHOTS_DIR, REPORTS_DIR
+    os.makedirs(VIDEOS_DIR, exist_ok=True)
+    os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    
+    init_db()
+    
+    print("🌙 NightWatch Pipeline Worker Starting...")
+    
+    # PollingService / WebhookEventService가 PR 테스트, Webhook 이벤트 처리 함수를 워커 풀에 등록
+    polling_service = PollingService()
+    WebhookEventService(polling_service)
+    worker_pool = polling_service.worker_pool
+    worker_pool.claim_jobs = True
+    worker_pool.start()
+    
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("🛑 Pipeline worker stopped")
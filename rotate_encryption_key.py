@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+PAT 암호화 키 교체 스크립트
+
+1. 새 키를 ENCRYPTION_KEYS 맨 앞에 추가 (예: ENCRYPTION_KEYS=새키,이전키)
+2. 이 스크립트로 저장된 모든 PAT를 새 키로 다시 암호화 (한 트랜잭션)
+3. 서버를 재시작하고 ENCRYPTION_KEYS에서 이전 키를 제거
+"""
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from server.models import init_db
+from server.services.pat_auth_service import PATAuthService
+from server.utils.crypto import get_encryption_keys
+
+if __name__ == "__main__":
+    init_db()
+    
+    keys = get_encryption_keys()
+    print(f"🔑 Using {len(keys)} key(s), re-encrypting with the first key...")
+    
+    try:
+        rotated = PATAuthService().reencrypt_all_credentials()
+    except Exception as e:
+        print(f"❌ Re-encryption failed, no credentials were changed: {str(e)}")
+        sys.exit(1)
+    
+    print(f"✅ Re-encrypted {rotated} credential(s)")
+    if len(keys) > 1:
+        print("💡 Restart the servers, then remove the old key(s) from ENCRYPTION_KEYS")
@@ -7,6 +7,7 @@ from flask_cors import CORS
 from .routes.api_routes import api_bp
 from .routes.webhook_routes import webhook_bp
 from .models import init_db
+from .services.webhook_event_service import WebhookEventService
 
 def create_app():
     """Flask 앱 생성"""
@@ -26,6 +27,9 @@ def create_app():
     app.register_blueprint(api_bp)
     app.register_blueprint(webhook_bp)
     
+    # Webhook 이벤트 저장/처리 서비스 (워커 풀에 Webhook 이벤트 처리 함수를 등록, 이벤트는 워커가 비동기로 처리)
+    app.extensions['webhook_event_service'] = WebhookEventService()
+    
     # 헬스 체크
     @app.route('/health', methods=['GET'])
     def health_check():
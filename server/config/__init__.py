@@ -4,6 +4,65 @@ import os
 BASE_URL = os.getenv('BASE_URL', 'localhost:5173')
 API_PORT = int(os.getenv('API_PORT', 5001))
 POLLING_INTERVAL_MINUTES = int(os.getenv('POLLING_INTERVAL_MINUTES', 5))
+# 구독별 적응형 Polling 간격 범위 (PR 활동이 있으면 최소 간격, 조용하면 최대 간격까지 지수적으로 증가)
+POLLING_MIN_INTERVAL_MINUTES = int(os.getenv('POLLING_MIN_INTERVAL_MINUTES', 1))
+POLLING_MAX_INTERVAL_MINUTES = int(os.getenv('POLLING_MAX_INTERVAL_MINUTES', 60))
+# 스케줄러가 Polling 시점이 된 구독을 확인하는 주기 (초)
+POLLING_TICK_SECONDS = int(os.getenv('POLLING_TICK_SECONDS', 30))
+# 여러 인스턴스를 실행할 때 Polling 스케줄러 리더 Lease 유지 시간 (초, 1/3 주기로 갱신)
+# 리더 인스턴스가 죽으면 이 시간이 지난 뒤 다른 인스턴스가 Polling을 이어받음
+SCHEDULER_LEASE_SECONDS = int(os.getenv('SCHEDULER_LEASE_SECONDS', 90))
+
+# Polling 동시성 설정 (1이면 순차 실행)
+POLLING_MAX_WORKERS = int(os.getenv('POLLING_MAX_WORKERS', 8))
+# 레포지토리 하나(구독자 전체 포함)를 Polling할 때 허용하는 최대 시간 (초)
+POLLING_SUBSCRIPTION_TIMEOUT_SECONDS = int(os.getenv('POLLING_SUBSCRIPTION_TIMEOUT_SECONDS', 120))
+# PAT가 있는 구독은 GraphQL로 여러 레포지토리의 PR을 한 번에 조회
+# (GraphQL에는 조건부 요청이 없어 변경이 없어도 매번 Rate Limit을 소모하므로, 기본값은 ETag 캐시를 쓰는 REST 조회)
+POLLING_USE_GRAPHQL = os.getenv('POLLING_USE_GRAPHQL', 'false').lower() == 'true'
+# GraphQL 쿼리 하나에 묶을 레포지토리 수
+GRAPHQL_BATCH_SIZE = int(os.getenv('GRAPHQL_BATCH_SIZE', 20))
+# 이 시간(분) 안에 Webhook을 받은 구독은 Webhook으로 PR 변경을 받는 것으로 보고 Polling을 줄임
+# (Webhook이 끊기면 이 시간이 지난 뒤 자동으로 적응형 Polling으로 돌아감)
+WEBHOOK_FRESHNESS_MINUTES = int(os.getenv('WEBHOOK_FRESHNESS_MINUTES', 120))
+# Webhook이 정상인 구독의 안전망 Polling 간격 (분, 누락된 이벤트 보정용)
+WEBHOOK_SAFETY_POLL_INTERVAL_MINUTES = int(os.getenv('WEBHOOK_SAFETY_POLL_INTERVAL_MINUTES', 60))
+
+# GitHub Rate Limit 예산 중 우선순위별로 남겨둘 비율
+# (스케줄된 Polling은 20%, 일반 작업은 5%를 남기고 멈추며, 수동 재실행만 나머지를 사용)
+RATE_LIMIT_LOW_PRIORITY_RESERVE = float(os.getenv('RATE_LIMIT_LOW_PRIORITY_RESERVE', 0.2))
+RATE_LIMIT_NORMAL_PRIORITY_RESERVE = float(os.getenv('RATE_LIMIT_NORMAL_PRIORITY_RESERVE', 0.05))
+
+# 복호화된 PAT와 GitHub 클라이언트를 인증 정보 ID별로 메모리에 유지하는 시간 (초)
+CREDENTIAL_CACHE_TTL_SECONDS = int(os.getenv('CREDENTIAL_CACHE_TTL_SECONDS', 300))
+
+# 테스트 파이프라인(브라우저 + Vision 검증) 동시 실행 수와 대기열 최대 길이
+PIPELINE_MAX_WORKERS = int(os.getenv('PIPELINE_MAX_WORKERS', 2))
+PIPELINE_MAX_QUEUE_SIZE = int(os.getenv('PIPELINE_MAX_QUEUE_SIZE', 20))
+# 작업 Lease 유지 시간 (워커가 Heartbeat 없이 이 시간이 지나면 다른 워커가 작업을 다시 가져감)
+PIPELINE_JOB_LEASE_SECONDS = int(os.getenv('PIPELINE_JOB_LEASE_SECONDS', 300))
+# 작업 최대 시도 횟수 (Lease 만료로 재시도되는 횟수 포함)
+PIPELINE_JOB_MAX_ATTEMPTS = int(os.getenv('PIPELINE_JOB_MAX_ATTEMPTS', 3))
+# 대기 중인 작업이 없을 때 작업 테이블을 다시 확인하는 주기 (초)
+PIPELINE_WORKER_POLL_SECONDS = int(os.getenv('PIPELINE_WORKER_POLL_SECONDS', 5))
+# API/Polling 프로세스 안에서도 작업을 실행할지 여부 (false면 main_worker.py 프로세스만 실행)
+PIPELINE_IN_PROCESS_WORKERS = os.getenv('PIPELINE_IN_PROCESS_WORKERS', 'true').lower() == 'true'
+# PR 하나의 시나리오를 동시에 실행할 수 (1이면 Browser MCP로 순차 실행, 2 이상이면 Playwright 브라우저 하나의 독립된 컨텍스트에서 병렬 실행)
+SCENARIO_CONCURRENCY = int(os.getenv('SCENARIO_CONCURRENCY', 1))
+# 브라우저 실행과 동시에 스크린샷을 검증하는 Vision 검증 워커 수
+VISION_VALIDATION_WORKERS = int(os.getenv('VISION_VALIDATION_WORKERS', 2))
+# PR 테스트 실행 방식 ('thread': 워커 스레드마다 파이프라인 하나, 'asyncio': 이벤트 루프 하나에서 여러 PR 파이프라인을 동시에 실행)
+PIPELINE_ENGINE = os.getenv('PIPELINE_ENGINE', 'thread').lower()
+# PIPELINE_ENGINE=asyncio일 때 프로세스 하나가 동시에 실행할 PR 파이프라인 수
+ASYNC_PIPELINE_CONCURRENCY = int(os.getenv('ASYNC_PIPELINE_CONCURRENCY', 20))
+# 파이프라인 실행 하나의 전체 제한 시간 (초, 구독의 test_options.deadline_seconds로 변경 가능)
+PIPELINE_DEADLINE_SECONDS = int(os.getenv('PIPELINE_DEADLINE_SECONDS', 1800))
+# 단계별 기본 제한 시간 (초, test_options.stage_deadlines로 단계별 변경 가능, 0이면 전체 제한 시간만 적용)
+PIPELINE_STAGE_DEADLINE_SECONDS = int(os.getenv('PIPELINE_STAGE_DEADLINE_SECONDS', 600))
+# 후속 커밋에서 관련 파일이 바뀐 시나리오만 다시 실행할지 여부 (구독의 test_options.incremental로 변경 가능)
+INCREMENTAL_TESTS = os.getenv('INCREMENTAL_TESTS', 'true').lower() == 'true'
+# 실패/시간 초과한 커밋의 파이프라인 체크포인트 보관 시간 (이 시간 안에 같은 커밋을 다시 테스트하면 끝난 단계를 이어받음)
+PIPELINE_CHECKPOINT_TTL_HOURS = int(os.getenv('PIPELINE_CHECKPOINT_TTL_HOURS', 24))
 
 # 출력 디렉토리 설정
 OUTPUT_DIR = os.getenv('OUTPUT_DIR', 'output')
@@ -2,6 +2,7 @@
 from .subscription_controller import SubscriptionController
 from .pat_controller import PATController
 from .test_controller import TestController
+from .pipeline_controller import PipelineController
 
-__all__ = ['SubscriptionController', 'PATController', 'TestController']
+__all__ = ['SubscriptionController', 'PATController', 'TestController', 'PipelineController']
 
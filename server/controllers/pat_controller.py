@@ -4,6 +4,7 @@ PAT 인증 컨트롤러
 """
 from flask import request, jsonify
 from ..services.pat_auth_service import PATAuthService
+from ..services.rate_limit_tracker import rate_limit_tracker
 
 class PATController:
     """PAT 인증 컨트롤러"""
@@ -72,4 +73,10 @@ class PATController:
                 'success': False,
                 'error': str(e)
             }), 500
-
+    
+    def get_rate_limits(self):
+        """토큰별 GitHub Rate Limit 예산 조회 (토큰은 해시로만 표시)"""
+        return jsonify({
+            'success': True,
+            'rate_limits': rate_limit_tracker.snapshot()
+        }), 200
@@ -0,0 +1,24 @@
+# server/controllers/pipeline_controller.py
+"""
+테스트 파이프라인 상태 컨트롤러
+"""
+from flask import jsonify
+from ..services.pipeline_worker_pool import pipeline_worker_pool
+from ..services.run_registry import run_registry
+
+class PipelineController:
+    """테스트 파이프라인 상태 컨트롤러"""
+    
+    def get_stats(self):
+        """워커 풀 대기열 길이 및 워커 사용률 조회"""
+        try:
+            return jsonify({
+                'success': True,
+                'stats': pipeline_worker_pool.stats(),
+                'active_runs': run_registry.snapshot()
+            }), 200
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
@@ -5,6 +5,7 @@
 from flask import request, jsonify
 from ..services.subscription_service import SubscriptionService
 from ..services.polling_service import PollingService
+from ..services.rate_limit_tracker import PRIORITY_HIGH, PRIORITY_NORMAL
 from ..models import Subscription, get_db
 
 class SubscriptionController:
@@ -115,34 +116,28 @@ class SubscriptionController:
             
             try:
                 # PAT 가져오기
-                pat = None
-                if subscription.user_credential_id:
-                    credential = self.polling_service.pat_auth.get_credential_by_id(subscription.user_credential_id)
-                    if credential:
-                        pat = self.polling_service.pat_auth.get_decrypted_pat(credential.user_id)
+                pat = self.polling_service.pat_auth.get_pat_by_credential_id(subscription.user_credential_id)
                 
-                # GitHub API로 PR 목록 가져오기
-                from github import Github
-                if pat:
-                    g = Github(pat)
-                else:
-                    g = Github()
-                
-                repo = g.get_repo(subscription.repo_full_name)
-                pulls = repo.get_pulls(state='open', sort='updated', direction='desc')
+                # GitHub API로 PR 목록 가져오기 (ETag 조건부 요청 캐시 사용)
+                listing = self.polling_service.pr_fetcher.list_open_pulls(
+                    subscription.repo_full_name,
+                    pat=pat,
+                    credential_id=subscription.user_credential_id,
+                    priority=PRIORITY_NORMAL
+                )
                 
-                for pr in pulls:
+                for pr in listing['pulls']:
                     pr_info = {
-                        'number': pr.number,
-                        'title': pr.title,
-                        'branch': pr.head.ref,
-                        'url': pr.html_url,
-                        'created_at': pr.created_at.isoformat() if pr.created_at else None,
-                        'updated_at': pr.updated_at.isoformat() if pr.updated_at else None,
+                        'number': pr['number'],
+                        'title': pr['title'],
+                        'branch': pr['branch'],
+                        'url': pr['url'],
+                        'created_at': pr['created_at'],
+                        'updated_at': pr['updated_at'],
                     }
                     
                     # 테스트 대상 확인: 정확히 "preview" 브랜치
-                    if pr.head.ref == "preview":
+                    if pr['branch'] == "preview":
                         all_prs.append(pr_info)
                     else:
                         # 제외 브랜치가 아닌 경우만 미대상 목록에 추가
@@ -151,10 +146,10 @@ class SubscriptionController:
                         for exclude_branch in exclude_branches:
                             if exclude_branch.endswith('*'):
                                 pattern = exclude_branch.replace('*', '')
-                                if pr.head.ref.startswith(pattern):
+                                if pr['branch'].startswith(pattern):
                                     should_exclude = True
                                     break
-                            elif pr.head.ref == exclude_branch:
+                            elif pr['branch'] == exclude_branch:
                                 should_exclude = True
                                 break
                         
@@ -222,7 +217,11 @@ class SubscriptionController:
             
             # 즉시 polling 실행
             try:
-                detected_count, detected_pr_list, non_target_pr_list = self.polling_service._poll_subscription(subscription)
+                # 사용자가 직접 요청한 Polling은 예약된 Rate Limit 여유분까지 사용
+                detected_count, detected_pr_list, non_target_pr_list = self.polling_service._poll_subscription(
+                    subscription,
+                    priority=PRIORITY_HIGH
+                )
                 return jsonify({
                     'success': True,
                     'message': f'Polling completed for {subscription.repo_full_name}',
@@ -257,7 +256,7 @@ class SubscriptionController:
     def trigger_all_polling(self):
         """모든 활성 구독에 대해 즉시 PR 감지 실행"""
         try:
-            self.polling_service.poll_all_subscriptions()
+            self.polling_service.poll_all_subscriptions(priority=PRIORITY_NORMAL)
             return jsonify({
                 'success': True,
                 'message': 'Polling completed for all active subscriptions'
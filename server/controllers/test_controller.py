@@ -6,8 +6,11 @@ from flask import request, jsonify
 from ..models import Test, Subscription, get_db
 from ..services.test_pipeline_service import TestPipelineService
 from ..services.pat_auth_service import PATAuthService
-from github import Github
-from datetime import datetime
+from ..services.rate_limit_tracker import rate_limit_tracker, RateLimitError, PRIORITY_HIGH
+from ..services.pipeline_worker_pool import pipeline_worker_pool
+from ..services.stage_timer import aggregate_stage_timings
+from ..services.test_progress_recorder import TestProgressRecorder
+from datetime import datetime, timedelta
 import os
 
 class TestController:
@@ -49,9 +52,12 @@ class TestController:
                     'pr_title': test.pr_title,
                     'pr_url': test.pr_url,
                     'branch_name': test.branch_name,
+                    'head_sha': test.head_sha,
                     'repo_full_name': test.repo_full_name,
                     'status': test.status,
-                    'test_results': test.test_results,
+                    'test_results': TestProgressRecorder.results_for(test),
+                    'scenarios_total': test.scenarios_total,
+                    'scenarios_completed': test.scenarios_completed,
                     'created_at': test.created_at.isoformat() if test.created_at else None,
                     'completed_at': test.completed_at.isoformat() if test.completed_at else None
                 })
@@ -84,9 +90,13 @@ class TestController:
                         'pr_title': test.pr_title,
                         'pr_url': test.pr_url,
                         'branch_name': test.branch_name,
+                        'head_sha': test.head_sha,
                         'repo_full_name': test.repo_full_name,
                         'status': test.status,
-                        'test_results': test.test_results,
+                        'test_results': TestProgressRecorder.results_for(test),
+                        'scenarios_total': test.scenarios_total,
+                        'scenarios_completed': test.scenarios_completed,
+                        'stage_timings': test.stage_timings,
                         'report_path': test.report_path,
                         'created_at': test.created_at.isoformat() if test.created_at else None,
                         'completed_at': test.completed_at.isoformat() if test.completed_at else None
@@ -105,6 +115,33 @@ class TestController:
         finally:
             db.close()
     
+    def get_stage_timing_stats(self):
+        """레포지토리/단계별 소요 시간 p50/p95 조회 (최근 days일 동안 끝난 테스트 기준)"""
+        repo_full_name = request.args.get('repo')
+        days = request.args.get('days', 7, type=int)
+        
+        db = next(get_db())
+        try:
+            query = db.query(Test.repo_full_name, Test.stage_timings).filter(
+                Test.stage_timings.isnot(None),
+                Test.completed_at >= datetime.utcnow() - timedelta(days=days)
+            )
+            if repo_full_name:
+                query = query.filter(Test.repo_full_name == repo_full_name)
+            
+            return jsonify({
+                'success': True,
+                'days': days,
+                'repos': aggregate_stage_timings(query.all())
+            }), 200
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+        finally:
+            db.close()
+    
     def rerun_scenario(self, test_id):
         """특정 시나리오 재실행"""
         data = request.json or {}
@@ -120,6 +157,12 @@ class TestController:
                     'error': 'Test not found'
                 }), 404
             
+            if test.status in ['pending', 'running']:
+                return jsonify({
+                    'success': False,
+                    'error': 'Test is already running'
+                }), 409
+            
             # 테스트 결과에서 시나리오 가져오기
             test_results = test.test_results
             if not test_results:
@@ -151,23 +194,21 @@ class TestController:
                 Subscription.id == test.subscription_id
             ).first()
             
-            pat = None
-            pat_auth = PATAuthService()
-            if subscription and subscription.user_credential_id:
-                credential = pat_auth.get_credential_by_id(subscription.user_credential_id)
-                if credential:
-                    pat = pat_auth.get_decrypted_pat(credential.user_id)
+            # PAT가 없으면 Public 저장소로 접근 시도 (익명 클라이언트)
+            pat, g = PATAuthService().get_github_client(subscription.user_credential_id if subscription else None)
             
             # GitHub에서 PR 정보 가져오기
             try:
-                if pat:
-                    g = Github(pat)
-                else:
-                    # PAT가 없으면 Public 저장소로 접근 시도
-                    g = Github()
-                
+                # 수동 재실행은 스케줄된 Polling을 위해 남겨둔 예산까지 사용 가능
+                rate_limit_tracker.check(pat, PRIORITY_HIGH)
                 repo = g.get_repo(repo_name)
                 pr = repo.get_pull(pr_number)
+                rate_limit_tracker.record_github_client(pat, g)
+            except RateLimitError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 429
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -178,78 +219,35 @@ class TestController:
             # preview 브랜치만 테스트 대상이므로 항상 preview-dev.oliveyoung.com 사용
             pr_url = "preview-dev.oliveyoung.com"
             pr_full_url = f"https://{pr_url}"
-            base_url = None  # preview 브랜치는 고정 URL 사용
+            # 시나리오를 복원하려고 다시 생성할 때는 구독의 기본 URL 사용 (테스트 URL은 preview 고정)
+            base_url = subscription.base_url if subscription else None
             
             # 시나리오 재실행
             pipeline_service = TestPipelineService(base_url=base_url or os.getenv('BASE_URL', 'localhost:5173'))
             
-            # 결과 객체에서 원본 시나리오 정보 복원
-            # scenario_result가 결과 형태인 경우 원본 형태로 변환
-            if 'actions' in scenario_result:
-                # 이미 원본 시나리오 형태
-                scenario = scenario_result
-            else:
-                # 결과 형태에서 원본 형태로 복원 시도
-                # actions_executed에서 원본 actions 추출 시도
-                scenario = {
-                    'name': scenario_result.get('scenario_name', f'Scenario {scenario_index + 1}'),
-                    'description': scenario_result.get('description', ''),
-                    'expected_result': scenario_result.get('expected_result', ''),
-                    'actions': []
-                }
-                
-                # actions_executed에서 원본 actions 추출
-                actions_executed = scenario_result.get('actions_executed', [])
-                for action_result in actions_executed:
-                    if 'action' in action_result:
-                        scenario['actions'].append(action_result['action'])
-                    elif 'type' in action_result:
-                        # action_result 자체가 action 형태일 수 있음
-                        scenario['actions'].append({
-                            'type': action_result.get('type'),
-                            **{k: v for k, v in action_result.items() if k not in ['success', 'error', 'screenshot']}
-                        })
-                
-                # actions가 비어있으면 PR diff를 다시 분석하여 시나리오 재생성
-                if not scenario['actions']:
-                    pr_diff = pipeline_service.get_pr_diff(pr)
-                    from ..services.pr_analyzer_service import PRAnalyzerService
-                    analyzer = PRAnalyzerService(base_url=base_url)
-                    all_scenarios = analyzer.analyze_and_generate_scenarios(pr_diff, pr_url=pr_url)
-                    
-                    # 해당 인덱스의 시나리오 찾기 (이름으로 매칭)
-                    scenario_name = scenario_result.get('scenario_name', '')
-                    matching_scenario = None
-                    for s in all_scenarios:
-                        if s.get('name') == scenario_name or s.get('description') == scenario_result.get('description', ''):
-                            matching_scenario = s
-                            break
-                    
-                    if matching_scenario:
-                        scenario = matching_scenario
-                    elif scenario_index < len(all_scenarios):
-                        # 이름 매칭 실패 시 인덱스로 매칭
-                        scenario = all_scenarios[scenario_index]
-                    else:
-                        return jsonify({
-                            'success': False,
-                            'error': '원본 시나리오를 복원할 수 없습니다.'
-                        }), 400
-            
-            result = pipeline_service.rerun_scenario(scenario, pr_url=pr_url)
-            
-            # 테스트 결과 업데이트
-            test_results[scenario_index] = result
-            
-            # DB 업데이트
-            test.test_results = test_results
+            # 브라우저 실행(시나리오 복원을 위한 재생성 포함)은 파이프라인 워커 풀에서 (수동 재실행은 대기 중인 자동 테스트보다 먼저 실행)
+            # 실행이 끝날 때까지 기다리지 않고 바로 응답 - 결과는 작업이 끝나면 기록되고, 화면은 running 상태인 동안 테스트를 다시 조회
+            previous_status = test.status
+            test.status = 'running'
             db.commit()
+            future = pipeline_worker_pool.submit(
+                self._rerun_scenario_job,
+                pipeline_service,
+                pr,
+                scenario_result,
+                scenario_index,
+                pr_url
+            )
+            future.add_done_callback(
+                lambda done: self._record_rerun(test_id, scenario_index, previous_status, done)
+            )
             
             return jsonify({
                 'success': True,
-                'result': result,
-                'message': f'Scenario {scenario_index + 1} rerun completed'
-            }), 200
+                'test_id': test_id,
+                'scenario_index': scenario_index,
+                'message': f'Scenario {scenario_index + 1} rerun queued'
+            }), 202
             
         except Exception as e:
             db.rollback()
@@ -260,6 +258,90 @@ class TestController:
         finally:
             db.close()
     
+    def _rerun_scenario_job(self, pipeline_service, pr, scenario_result, scenario_index, pr_url):
+        """시나리오 재실행 작업 (파이프라인 워커에서 실행)"""
+        # 결과 객체에서 원본 시나리오 정보 복원
+        # scenario_result가 결과 형태인 경우 원본 형태로 변환
+        if 'actions' in scenario_result:
+            # 이미 원본 시나리오 형태
+            scenario = scenario_result
+        else:
+            # 결과 형태에서 원본 형태로 복원 시도
+            # actions_executed에서 원본 actions 추출 시도
+            scenario = {
+                'name': scenario_result.get('scenario_name', f'Scenario {scenario_index + 1}'),
+                'description': scenario_result.get('description', ''),
+                'expected_result': scenario_result.get('expected_result', ''),
+                'actions': []
+            }
+            
+            # actions_executed에서 원본 actions 추출
+            actions_executed = scenario_result.get('actions_executed', [])
+            for action_result in actions_executed:
+                if 'action' in action_result:
+                    scenario['actions'].append(action_result['action'])
+                elif 'type' in action_result:
+                    # action_result 자체가 action 형태일 수 있음
+                    scenario['actions'].append({
+                        'type': action_result.get('type'),
+                        **{k: v for k, v in action_result.items() if k not in ['success', 'error', 'screenshot']}
+                    })
+            
+            # actions가 비어있으면 PR diff를 다시 분석하여 시나리오 재생성
+            if not scenario['actions']:
+                pr_diff = pipeline_service.get_pr_diff(pr)
+                from ..services.pr_analyzer_service import PRAnalyzerService
+                analyzer = PRAnalyzerService(base_url=pipeline_service.base_url)
+                all_scenarios = analyzer.analyze_and_generate_scenarios(pr_diff, pr_url=pr_url)
+                
+                # 해당 인덱스의 시나리오 찾기 (이름으로 매칭)
+                scenario_name = scenario_result.get('scenario_name', '')
+                matching_scenario = None
+                for s in all_scenarios:
+                    if s.get('name') == scenario_name or s.get('description') == scenario_result.get('description', ''):
+                        matching_scenario = s
+                        break
+                
+                if matching_scenario:
+                    scenario = matching_scenario
+                elif scenario_index < len(all_scenarios):
+                    # 이름 매칭 실패 시 인덱스로 매칭
+                    scenario = all_scenarios[scenario_index]
+                else:
+                    raise ValueError('원본 시나리오를 복원할 수 없습니다.')
+        
+        return pipeline_service.rerun_scenario(scenario, pr_url=pr_url)
+    
+    def _record_rerun(self, test_id, scenario_index, previous_status, future):
+        """재실행 결과 기록 (작업이 끝나면 호출, 실행 중 새 커밋으로 대체된 테스트는 상태 유지)"""
+        db = next(get_db())
+        try:
+            test = db.query(Test).filter(Test.id == test_id).first()
+            if not test:
+                return
+            
+            error = future.exception()
+            test_results = list(test.test_results or [])
+            if scenario_index < len(test_results):
+                if error:
+                    # 실패한 재실행도 화면에서 보이도록 시나리오 결과에 오류 기록 (액션 목록은 다시 재실행할 수 있게 유지)
+                    print(f"❌ Scenario {scenario_index + 1} rerun failed for test {test_id}: {str(error)}")
+                    failed_result = {
+                        key: value for key, value in test_results[scenario_index].items()
+                        if key not in ['screenshot', 'screenshot_path', 'validation']
+                    }
+                    failed_result.update({'success': False, 'error': f'재실행 실패: {str(error)}'})
+                    test_results[scenario_index] = failed_result
+                else:
+                    test_results[scenario_index] = future.result()
+                test.test_results = test_results
+            
+            if test.status == 'running':
+                test.status = previous_status
+            db.commit()
+        finally:
+            db.close()
+    
     def regenerate_scenarios(self, test_id):
         """시나리오 재생성 (실행 없이 시나리오만 생성)"""
         db = next(get_db())
@@ -272,6 +354,12 @@ class TestController:
                     'error': 'Test not found'
                 }), 404
             
+            if test.status in ['pending', 'running']:
+                return jsonify({
+                    'success': False,
+                    'error': 'Test is already running'
+                }), 409
+            
             # 구독 정보 가져오기
             subscription = db.query(Subscription).filter(
                 Subscription.id == test.subscription_id
@@ -284,82 +372,38 @@ class TestController:
                 }), 404
             
             # PAT 가져오기
-            pat = None
-            pat_auth = PATAuthService()
-            if subscription.user_credential_id:
-                credential = pat_auth.get_credential_by_id(subscription.user_credential_id)
-                if credential:
-                    pat = pat_auth.get_decrypted_pat(credential.user_id)
+            pat, g = PATAuthService().get_github_client(subscription.user_credential_id)
             
             # GitHub에서 PR 정보 가져오기
             try:
-                if pat:
-                    g = Github(pat)
-                else:
-                    g = Github()
-                
+                rate_limit_tracker.check(pat, PRIORITY_HIGH)
                 repo = g.get_repo(test.repo_full_name)
                 pr = repo.get_pull(test.pr_number)
-            except Exception as e:
-                return jsonify({
-                    'success': False,
-                    'error': f'GitHub API error: {str(e)}. PAT가 필요할 수 있습니다.'
-                }), 401
-            
-            # PR diff 가져오기
-            pipeline_service = TestPipelineService(base_url=subscription.base_url)
-            pr_diff = pipeline_service.get_pr_diff(pr)
-            
-            # PR 배포 URL 생성
-            # preview 브랜치만 테스트 대상이므로 항상 preview-dev.oliveyoung.com 사용
-            pr_url = "preview-dev.oliveyoung.com"
-            pr_full_url = f"https://{pr_url}"
-            print(f"🌐 Using fixed preview URL for preview branch: {pr_full_url}")
-            
-            # 시나리오 재생성
-            from ..services.pr_analyzer_service import PRAnalyzerService
-            analyzer = PRAnalyzerService(base_url=None)
-            try:
-                scenarios = analyzer.analyze_and_generate_scenarios(pr_diff, pr_url=pr_full_url)
-            except ValueError as e:
-                # API 키 관련 에러 등 명시적인 에러
+                rate_limit_tracker.record_github_client(pat, g)
+            except RateLimitError as e:
                 return jsonify({
                     'success': False,
                     'error': str(e)
-                }), 400
+                }), 429
             except Exception as e:
-                # 기타 예상치 못한 에러
                 return jsonify({
                     'success': False,
-                    'error': f'시나리오 생성 중 오류가 발생했습니다: {str(e)}'
-                }), 500
+                    'error': f'GitHub API error: {str(e)}. PAT가 필요할 수 있습니다.'
+                }), 401
             
-            # 새 시나리오 실행
+            # diff 조회, 시나리오 생성, 실행은 파이프라인 워커 풀에서 (대기 중인 자동 테스트보다 먼저 실행)
+            # 실행이 끝날 때까지 기다리지 않고 바로 응답 - 화면은 running 상태인 동안 테스트를 다시 조회
+            pipeline_service = TestPipelineService(base_url=subscription.base_url)
             test.status = 'running'
             db.commit()
-            try:
-                execution_results = pipeline_service.run_existing_scenarios(
-                    scenarios,
-                    pr_url=pr_full_url
-                )
-            except Exception as exec_err:
-                test.status = 'failed'
-                db.commit()
-                raise exec_err
-            
-            # 실행 결과 저장
-            test.test_results = execution_results
-            all_success = all(result.get('success') for result in execution_results)
-            test.status = 'completed' if all_success else 'failed'
-            test.completed_at = datetime.utcnow()
-            db.commit()
+            future = pipeline_worker_pool.submit(self._regenerate_scenarios_job, pipeline_service, pr)
+            future.add_done_callback(lambda done: self._record_regeneration(test_id, done))
             
             return jsonify({
                 'success': True,
-                'message': f'{len(execution_results)}개의 시나리오 실행이 완료되었습니다.',
-                'scenarios_count': len(execution_results),
-                'test_results': execution_results
-            }), 200
+                'test_id': test_id,
+                'message': '시나리오 재생성 및 실행을 시작했습니다.'
+            }), 202
             
         except Exception as e:
             db.rollback()
@@ -369,4 +413,59 @@ class TestController:
             return jsonify({'success': False, 'error': str(e)}), 500
         finally:
             db.close()
+    
+    def _regenerate_scenarios_job(self, pipeline_service, pr):
+        """시나리오 재생성 및 실행 작업 (파이프라인 워커에서 실행)"""
+        pr_diff = pipeline_service.get_pr_diff(pr)
+        
+        # PR 배포 URL 생성
+        # preview 브랜치만 테스트 대상이므로 항상 preview-dev.oliveyoung.com 사용
+        pr_url = "preview-dev.oliveyoung.com"
+        pr_full_url = f"https://{pr_url}"
+        print(f"🌐 Using fixed preview URL for preview branch: {pr_full_url}")
+        
+        # 시나리오 재생성 (API 키 관련 에러 등은 ValueError로 전달됨)
+        from ..services.pr_analyzer_service import PRAnalyzerService
+        analyzer = PRAnalyzerService(base_url=pipeline_service.base_url)
+        scenarios = analyzer.analyze_and_generate_scenarios(pr_diff, pr_url=pr_full_url)
+        
+        # 새 시나리오 실행
+        return pipeline_service.run_existing_scenarios(scenarios, pr_url=pr_full_url)
+    
+    def _record_regeneration(self, test_id, future):
+        """재생성 실행 결과 기록 (작업이 끝나면 호출, 실행 중 새 커밋으로 대체된 테스트는 상태 유지)"""
+        db = next(get_db())
+        try:
+            test = db.query(Test).filter(Test.id == test_id).first()
+            if not test or test.status != 'running':
+                return
+            
+            error = future.exception()
+            if error:
+                # 실패 원인이 PR 상세 화면에 보이도록 오류 결과로 기록 (재생성은 이전 결과를 대체함)
+                print(f"❌ Error regenerating scenarios for test {test_id}: {str(error)}")
+                test.test_results = [{
+                    'scenario_name': '시나리오 재생성',
+                    'description': '시나리오 재생성 및 실행에 실패했습니다.',
+                    'actions': [],
+                    'actions_executed': [],
+                    'success': False,
+                    'error': str(error)
+                }]
+                test.scenarios_total = 1
+                test.scenarios_completed = 1
+                test.status = 'failed'
+                test.completed_at = datetime.utcnow()
+            else:
+                # 실행 결과 저장
+                execution_results = future.result()
+                test.test_results = execution_results
+                test.scenarios_total = len(execution_results)
+                test.scenarios_completed = len(execution_results)
+                all_success = all(result.get('success') for result in execution_results)
+                test.status = 'completed' if all_success else 'failed'
+                test.completed_at = datetime.utcnow()
+            db.commit()
+        finally:
+            db.close()
 
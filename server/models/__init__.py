@@ -3,6 +3,12 @@ from .database import Base, engine, SessionLocal, get_db, init_db
 from .user_credential import UserCredential
 from .subscription import Subscription
 from .test import Test
+from .test_summary import TestSummary
+from .github_cache import GitHubCache
+from .pipeline_job import PipelineJob
+from .webhook_event import WebhookEvent
+from .scheduler_lease import SchedulerLease
+from .pipeline_checkpoint import PipelineCheckpoint
 
 __all__ = [
     'Base',
@@ -12,6 +18,12 @@ __all__ = [
     'init_db',
     'UserCredential',
     'Subscription',
-    'Test'
+    'Test',
+    'TestSummary',
+    'GitHubCache',
+    'PipelineJob',
+    'WebhookEvent',
+    'SchedulerLease',
+    'PipelineCheckpoint'
 ]
 
@@ -2,7 +2,7 @@
 """
 데이터베이스 설정 및 세션 관리
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 from .base import Base
 import os
@@ -30,7 +30,95 @@ def init_db():
     from .user_credential import UserCredential
     from .subscription import Subscription
     from .test import Test
+    from .test_summary import TestSummary
+    from .github_cache import GitHubCache
+    from .pipeline_job import PipelineJob
+    from .webhook_event import WebhookEvent
+    from .scheduler_lease import SchedulerLease
+    from .pipeline_checkpoint import PipelineCheckpoint
     
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+    _backfill_test_summaries()
     print("✅ Database initialized")
 
+def _add_missing_columns():
+    """기존 테이블에 모델에 새로 추가된 컬럼과 인덱스를 추가 (create_all은 기존 테이블을 변경하지 않음)"""
+    inspector = inspect(engine)
+    
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                print(f"➕ Added column {table.name}.{column.name}")
+            
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                
+                index.create(bind=conn)
+                print(f"➕ Added index {index.name}")
+
+def _backfill_test_summaries(batch_size: int = 1000):
+    """요약 테이블 도입 전에 생성된 테스트의 요약 행 생성 (이후에는 Test 변경 시 자동 갱신)
+    
+    매 시작마다 실행되므로 요약이 없는 테스트가 없으면 개수만 확인하고 끝낸다.
+    요약에 필요한 컬럼만 조회하고(test_results JSON은 존재 여부만) batch_size개씩 나눠 저장한다.
+    """
+    from sqlalchemy import String, and_, cast, func
+    from .test import Test
+    from .test_summary import TestSummary
+    
+    db = SessionLocal()
+    try:
+        def missing_tests(query):
+            return query.outerjoin(TestSummary, TestSummary.test_id == Test.id).filter(TestSummary.test_id.is_(None))
+        
+        # JSON 컬럼은 None을 JSON null로 저장할 수 있으므로 둘 다 결과 없음으로 처리
+        results_text = cast(Test.test_results, String)
+        has_results = and_(results_text.isnot(None), results_text != 'null')
+        
+        missing = missing_tests(db.query(func.count(Test.id))).scalar()
+        if not missing:
+            return
+        
+        # 저장한 행은 다음 조회에서 빠지므로 ID 순서로 이어서 조회 (조회 중인 테이블에 쓰지 않도록 배치마다 새로 조회)
+        last_id = 0
+        while True:
+            rows = missing_tests(db.query(
+                Test.id,
+                Test.subscription_id,
+                Test.pr_number,
+                Test.repo_full_name,
+                Test.head_sha,
+                Test.status,
+                has_results.label('has_results'),
+                Test.scenarios_total,
+                Test.scenarios_completed
+            )).filter(Test.id > last_id).order_by(Test.id).limit(batch_size).yield_per(batch_size).all()
+            if not rows:
+                break
+            
+            db.execute(TestSummary.__table__.insert(), [
+                dict(test_id=row.id, **TestSummary.values_from_test(row, Test.finished_run_from(
+                    row.status, bool(row.has_results), row.scenarios_total, row.scenarios_completed
+                )))
+                for row in rows
+            ])
+            db.commit()
+            last_id = rows[-1].id
+        print(f"➕ Added summaries for {missing} existing test(s)")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
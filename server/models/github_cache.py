@@ -0,0 +1,22 @@
+"""
+GitHub 조건부 요청(ETag / If-Modified-Since) 캐시 모델
+"""
+from sqlalchemy import Column, Integer, String, DateTime, JSON, UniqueConstraint
+from datetime import datetime
+from .base import Base
+
+class GitHubCache(Base):
+    """레포지토리/인증 정보별 GitHub 응답 검증자(ETag, Last-Modified)와 응답 본문"""
+    __tablename__ = 'github_cache'
+    __table_args__ = (
+        UniqueConstraint('repo_full_name', 'credential_key', 'resource', name='uq_github_cache_key'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    repo_full_name = Column(String(511), nullable=False, index=True)
+    credential_key = Column(String(255), nullable=False)  # 'credential:{id}' 또는 'anonymous'
+    resource = Column(String(255), nullable=False)  # 예: 'open_pulls'
+    etag = Column(String(255))
+    last_modified = Column(String(255))
+    payload = Column(JSON)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
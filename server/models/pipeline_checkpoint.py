@@ -0,0 +1,23 @@
+# server/models/pipeline_checkpoint.py
+"""
+파이프라인 단계 결과 체크포인트 모델
+"""
+from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, UniqueConstraint
+from datetime import datetime
+from .base import Base
+
+class PipelineCheckpoint(Base):
+    """PR 커밋별로 끝난 파이프라인 단계의 결과 (같은 커밋의 재시도/재개 시 해당 단계를 건너뜀)"""
+    __tablename__ = 'pipeline_checkpoints'
+    __table_args__ = (
+        UniqueConstraint('subscription_id', 'pr_number', 'head_sha', 'stage', name='uq_pipeline_checkpoints_pr_sha_stage'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    subscription_id = Column(Integer, ForeignKey('subscriptions.id'), nullable=False)
+    pr_number = Column(Integer, nullable=False)
+    head_sha = Column(String(40), nullable=False)
+    stage = Column(String(50), nullable=False)  # 'diff', 'scenarios', 'execution:<index>', 'validation:<index>'
+    data = Column(JSON)
+    test_id = Column(Integer, ForeignKey('tests.id'), nullable=True)  # 단계를 저장한 테스트 (기록용)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
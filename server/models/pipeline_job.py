@@ -0,0 +1,30 @@
+# server/models/pipeline_job.py
+"""
+테스트 파이프라인 작업 대기열 모델
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
+from datetime import datetime
+from .base import Base
+
+class PipelineJob(Base):
+    """워커가 Lease를 잡고 실행하는 파이프라인 작업 (프로세스 재시작 후에도 유지)"""
+    __tablename__ = 'pipeline_jobs'
+    __table_args__ = (
+        Index('ix_pipeline_jobs_claim', 'status', 'priority', 'id'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    job_type = Column(String(50), nullable=False, default='pr_test')
+    test_id = Column(Integer, ForeignKey('tests.id'), nullable=True, index=True)  # PR 테스트 작업
+    subscription_id = Column(Integer, ForeignKey('subscriptions.id'), nullable=True)
+    webhook_event_id = Column(Integer, ForeignKey('webhook_events.id'), nullable=True, index=True)  # Webhook 이벤트 처리 작업
+    pr_number = Column(Integer, nullable=False)
+    priority = Column(Integer, nullable=False, default=1)  # 작을수록 먼저 실행
+    status = Column(String(50), nullable=False, default='queued')  # queued, running, completed, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    lease_owner = Column(String(255))  # 작업을 잡은 워커 ID
+    lease_expires_at = Column(DateTime, index=True)  # Heartbeat가 끊기면 이 시각 이후 다른 워커가 다시 가져감
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
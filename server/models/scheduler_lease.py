@@ -0,0 +1,15 @@
+# server/models/scheduler_lease.py
+"""
+스케줄러 리더 선출용 Lease 모델
+"""
+from sqlalchemy import Column, String, DateTime
+from .base import Base
+
+class SchedulerLease(Base):
+    """여러 인스턴스 중 Lease를 가진 하나만 스케줄 작업을 실행 (만료되면 다른 인스턴스가 가져감)"""
+    __tablename__ = 'scheduler_leases'
+    
+    name = Column(String(100), primary_key=True)  # 예: 'polling'
+    holder = Column(String(255))  # Lease를 가진 인스턴스 ID (hostname:pid)
+    acquired_at = Column(DateTime)
+    expires_at = Column(DateTime)
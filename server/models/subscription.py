@@ -26,6 +26,10 @@ class Subscription(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_polled_at = Column(DateTime)
+    last_full_scan_at = Column(DateTime)  # 마지막으로 열린 PR 전체를 확인한 시간 (이후에는 증분 조회)
+    poll_interval_seconds = Column(Integer)  # 현재 적응형 Polling 간격
+    next_poll_at = Column(DateTime, index=True)  # 다음 Polling 예정 시간 (재시작 후에도 유지)
+    last_webhook_at = Column(DateTime)  # 마지막으로 서명이 유효한 Webhook을 받은 시간
     
     # 관계
     credential = relationship("UserCredential", back_populates="subscriptions")
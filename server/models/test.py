@@ -2,7 +2,7 @@
 """
 테스트 기록 모델
 """
-from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .base import Base
@@ -10,6 +10,9 @@ from .base import Base
 class Test(Base):
     """테스트 기록"""
     __tablename__ = 'tests'
+    __table_args__ = (
+        Index('ix_tests_subscription_pr', 'subscription_id', 'pr_number'),
+    )
     
     id = Column(Integer, primary_key=True)
     subscription_id = Column(Integer, ForeignKey('subscriptions.id'), nullable=False)
@@ -17,13 +20,30 @@ class Test(Base):
     pr_title = Column(String(511))  # PR 제목
     pr_url = Column(String(1023))
     branch_name = Column(String(255))  # 브랜치 이름
+    head_sha = Column(String(40), index=True)  # 테스트한 PR head 커밋 SHA
     repo_full_name = Column(String(511))
     status = Column(String(50), default='pending')
     test_results = Column(JSON)
+    scenarios_total = Column(Integer)  # 생성된 시나리오 수
+    scenarios_completed = Column(Integer)  # 실행/검증이 끝나 test_results에 기록된 시나리오 수
+    stage_timings = Column(JSON)  # 단계/시나리오/액션별 소요 시간 (StageTimer.as_dict)
+    diff_files = Column(JSON)  # 테스트한 PR diff의 파일 목록 (다음 커밋의 증분 실행에서 비교)
     report_path = Column(String(1023))
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime)
     
     # 관계
     subscription = relationship("Subscription", back_populates="tests")
+    
+    def is_finished_run(self) -> bool:
+        """파이프라인이 끝까지 실행된 기록인지 (시나리오 실패는 포함, 실행 중 에러로 결과가 없는 경우는 제외)"""
+        return self.finished_run_from(self.status, self.test_results is not None, self.scenarios_total, self.scenarios_completed)
+    
+    @staticmethod
+    def finished_run_from(status, has_results, scenarios_total, scenarios_completed) -> bool:
+        """실행 중에도 부분 결과가 기록되므로 실패한 테스트는 모든 시나리오의 결과가 있을 때만 끝까지 실행된 것으로 봄
+        (진행 개수가 없는 이전 기록은 결과 유무로 판단)"""
+        if status == 'completed':
+            return True
+        return status == 'failed' and has_results and (scenarios_total is None or scenarios_completed == scenarios_total)
 
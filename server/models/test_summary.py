@@ -0,0 +1,117 @@
+# server/models/test_summary.py
+"""
+테스트 요약 모델
+
+Polling은 PR마다 테스트 여부(PR 번호, 커밋, 상태)만 필요하지만 Test 행에는 큰 test_results JSON이 있으므로,
+필요한 컬럼만 담은 요약 행을 Test와 함께 유지한다. (Test가 추가/변경될 때 같은 flush 안에서 갱신)
+query(Test).update(...) / delete(...) 같은 일괄 실행은 ORM flush 이벤트가 발생하지 않으므로, 실행할 때 대상 테스트의 요약을 함께 갱신/삭제한다.
+"""
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, event, inspect, select
+from sqlalchemy.orm import Session
+from datetime import datetime
+from .base import Base
+from .test import Test
+
+# 이 컬럼들이 바뀔 때만 요약을 갱신
+SUMMARY_SOURCE_FIELDS = [
+    'subscription_id', 'pr_number', 'repo_full_name', 'head_sha', 'status', 'test_results',
+    'scenarios_total', 'scenarios_completed'
+]
+
+class TestSummary(Base):
+    """테스트별 요약 (test_results 없이 구독/PR 단위로 조회)"""
+    __tablename__ = 'test_summaries'
+    __table_args__ = (
+        Index('ix_test_summaries_subscription_pr', 'subscription_id', 'pr_number'),
+    )
+    
+    test_id = Column(Integer, ForeignKey('tests.id'), primary_key=True)
+    subscription_id = Column(Integer, nullable=False)
+    pr_number = Column(Integer, nullable=False)
+    repo_full_name = Column(String(511))
+    head_sha = Column(String(40))
+    status = Column(String(50))
+    finished_run = Column(Boolean, nullable=False, default=False)  # Test.is_finished_run()
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    
+    @classmethod
+    def values_from_test(cls, test: Test, finished_run: bool = None) -> dict:
+        return {
+            'subscription_id': test.subscription_id,
+            'pr_number': test.pr_number,
+            'repo_full_name': test.repo_full_name,
+            'head_sha': test.head_sha,
+            'status': test.status,
+            'finished_run': test.is_finished_run() if finished_run is None else finished_run,
+            'updated_at': datetime.utcnow()
+        }
+
+
+def _is_finished_run(connection, test: Test) -> bool:
+    """flush 중에 test_results가 로드되지 않은 객체는 추가 로드 없이 값만 조회"""
+    if 'test_results' not in inspect(test).unloaded:
+        return test.is_finished_run()
+    if test.status == 'completed':
+        return True
+    if test.status != 'failed':
+        return False
+    test_results = connection.execute(
+        select(Test.__table__.c.test_results).where(Test.__table__.c.id == test.id)
+    ).scalar()
+    return Test.finished_run_from(test.status, test_results is not None, test.scenarios_total, test.scenarios_completed)
+
+
+@event.listens_for(Test, 'after_insert')
+def _insert_summary(mapper, connection, test):
+    connection.execute(
+        TestSummary.__table__.insert().values(test_id=test.id, **TestSummary.values_from_test(test, _is_finished_run(connection, test)))
+    )
+
+
+@event.listens_for(Test, 'after_update')
+def _update_summary(mapper, connection, test):
+    state = inspect(test)
+    if not any(state.attrs[name].history.has_changes() for name in SUMMARY_SOURCE_FIELDS):
+        return
+    
+    values = TestSummary.values_from_test(test, _is_finished_run(connection, test))
+    result = connection.execute(
+        TestSummary.__table__.update().where(TestSummary.__table__.c.test_id == test.id).values(**values)
+    )
+    if result.rowcount == 0:
+        connection.execute(TestSummary.__table__.insert().values(test_id=test.id, **values))
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _sync_bulk_execution(orm_execute_state):
+    """Test 일괄 UPDATE/DELETE 대상의 요약 갱신 (after_insert/after_update가 발생하지 않는 경로)"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_arguments.get('mapper')
+    if mapper is None or mapper.class_ is not Test:
+        return None
+    
+    session = orm_execute_state.session
+    statement = orm_execute_state.statement
+    # 실행 후에는 조건이 바뀐 값과 맞지 않을 수 있으므로 대상 ID를 먼저 조회
+    target = select(Test.id)
+    if statement.whereclause is not None:
+        target = target.where(statement.whereclause)
+    test_ids = session.scalars(target).all()
+    
+    summaries = TestSummary.__table__
+    if orm_execute_state.is_delete and test_ids:
+        session.execute(summaries.delete().where(summaries.c.test_id.in_(test_ids)))
+    
+    result = orm_execute_state.invoke_statement()
+    
+    if orm_execute_state.is_update and test_ids:
+        tests = session.scalars(
+            select(Test).where(Test.id.in_(test_ids)).execution_options(populate_existing=True)
+        ).all()
+        for test in tests:
+            values = TestSummary.values_from_test(test)
+            updated = session.execute(summaries.update().where(summaries.c.test_id == test.id).values(**values))
+            if updated.rowcount == 0:
+                session.execute(summaries.insert().values(test_id=test.id, **values))
+    return result
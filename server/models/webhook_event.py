@@ -0,0 +1,24 @@
+# server/models/webhook_event.py
+"""
+GitHub Webhook 이벤트 모델
+"""
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Text
+from datetime import datetime
+from .base import Base
+
+class WebhookEvent(Base):
+    """수신한 Webhook 이벤트 (X-GitHub-Delivery 기준으로 중복 수신 방지, 워커가 비동기로 처리)"""
+    __tablename__ = 'webhook_events'
+    
+    id = Column(Integer, primary_key=True)
+    delivery_id = Column(String(255), nullable=False, unique=True)  # X-GitHub-Delivery (GitHub 재전송 시 동일)
+    event_type = Column(String(100))  # X-GitHub-Event (예: pull_request)
+    action = Column(String(100))
+    repo_full_name = Column(String(511), index=True)
+    pr_number = Column(Integer)
+    head_sha = Column(String(40))
+    payload = Column(JSON)
+    status = Column(String(50), nullable=False, default='queued')  # queued, processing, processed, ignored, failed
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    processed_at = Column(DateTime)
@@ -6,6 +6,7 @@ from flask import Blueprint, request
 from ..controllers.subscription_controller import SubscriptionController
 from ..controllers.pat_controller import PATController
 from ..controllers.test_controller import TestController
+from ..controllers.pipeline_controller import PipelineController
 
 # Blueprint 생성
 api_bp = Blueprint('api', __name__, url_prefix='/api')
@@ -14,6 +15,7 @@ api_bp = Blueprint('api', __name__, url_prefix='/api')
 subscription_controller = SubscriptionController()
 pat_controller = PATController()
 test_controller = TestController()
+pipeline_controller = PipelineController()
 
 # 구독 관련 라우트
 @api_bp.route('/subscriptions', methods=['GET'])
@@ -59,11 +61,19 @@ def verify_pat():
 def check_repo_access():
     return pat_controller.check_repo_access()
 
+@api_bp.route('/pat/rate-limit', methods=['GET'])
+def get_rate_limits():
+    return pat_controller.get_rate_limits()
+
 # 테스트 관련 라우트
 @api_bp.route('/tests', methods=['GET'])
 def get_tests():
     return test_controller.get_tests()
 
+@api_bp.route('/tests/stage-timings', methods=['GET'])
+def get_stage_timing_stats():
+    return test_controller.get_stage_timing_stats()
+
 @api_bp.route('/tests/<int:test_id>', methods=['GET'])
 def get_test(test_id):
     return test_controller.get_test(test_id)
@@ -80,3 +90,7 @@ def regenerate_scenarios(test_id):
         return '', 200
     return test_controller.regenerate_scenarios(test_id)
 
+# 파이프라인 관련 라우트
+@api_bp.route('/pipeline/stats', methods=['GET'])
+def get_pipeline_stats():
+    return pipeline_controller.get_stats()
@@ -2,14 +2,10 @@
 """
 Webhook 라우트 정의
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 import hmac
 import hashlib
 import os
-from github import Github
-from ..services.test_pipeline_service import TestPipelineService
-from ..services.k8s_deployer import K8sDeployer
-from ..config import BASE_URL
 
 webhook_bp = Blueprint('webhook', __name__)
 
@@ -26,51 +22,31 @@ def verify_signature(payload_body, signature_header):
 
 @webhook_bp.route('/webhook', methods=['POST'])
 def handle_webhook():
-    """GitHub Webhook 처리"""
+    """GitHub Webhook 수신
+    
+    요청 안에서는 이벤트 저장과 작업 대기열 추가만 하고 바로 202를 반환한다.
+    (파이프라인은 수 분 걸리므로 요청 안에서 실행하면 GitHub가 타임아웃으로 재전송함)
+    """
     signature = request.headers.get('X-Hub-Signature-256')
     if not verify_signature(request.data, signature):
         return jsonify({"error": "Invalid signature"}), 401
     
-    payload = request.json
-    action = payload.get('action')
-    
-    # PR이 닫히거나 머지될 때 배포 정리
-    if action in ['closed', 'merged']:
-        try:
-            pr_number = payload['pull_request']['number']
-            print(f"🧹 Cleaning up PR #{pr_number} deployment...")
-            
-            k8s_deployer = K8sDeployer(base_domain=BASE_URL)
-            k8s_deployer.cleanup_pr(pr_number)
-            
-            return jsonify({"message": "Deployment cleaned up"}), 200
-        except Exception as e:
-            print(f"❌ Cleanup error: {str(e)}")
-            return jsonify({"error": str(e)}), 500
+    delivery_id = request.headers.get('X-GitHub-Delivery')
+    if not delivery_id:
+        return jsonify({"error": "Missing X-GitHub-Delivery header"}), 400
     
-    # PR이 열렸거나 업데이트될 때만 테스트 실행
-    if action not in ['opened', 'synchronize']:
-        return jsonify({"message": "Ignored event"}), 200
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Invalid payload"}), 400
     
     try:
-        pr_number = payload['pull_request']['number']
-        repo_name = payload['repository']['full_name']
-        branch_name = payload['pull_request']['head']['ref']
-        
-        print(f"🔍 Processing PR #{pr_number} in {repo_name}")
-        
-        g = Github(os.getenv('GITHUB_TOKEN'))
-        repo = g.get_repo(repo_name)
-        pr = repo.get_pull(pr_number)
-        
-        test_pipeline = TestPipelineService(base_url=BASE_URL)
-        pr_diff = test_pipeline.get_pr_diff(pr)
-        
-        test_pipeline.run_test_pipeline(pr, pr_diff, branch_name)
-        
-        return jsonify({"message": "Test pipeline started"}), 200
-        
+        result = current_app.extensions['webhook_event_service'].accept(delivery_id, request.headers.get('X-GitHub-Event'), payload)
     except Exception as e:
         print(f"❌ Error: {str(e)}")
         return jsonify({"error": str(e)}), 500
-
+    
+    if result['status'] == 'duplicate':
+        return jsonify({"message": "Duplicate delivery", "event_id": result['event_id']}), 200
+    if result['status'] == 'ignored':
+        return jsonify({"message": "Ignored event", "event_id": result['event_id']}), 200
+    return jsonify({"message": "Event accepted", "event_id": result['event_id']}), 202
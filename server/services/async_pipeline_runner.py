@@ -0,0 +1,274 @@
+# server/services/async_pipeline_runner.py
+"""
+이벤트 루프 하나에서 여러 PR의 테스트 파이프라인을 동시에 실행하는 러너 (PIPELINE_ENGINE=asyncio)
+
+스레드 엔진(TestPipelineService)은 워커 스레드 하나가 PR 하나의 파이프라인을 끝까지 붙잡고,
+그 시간 대부분을 Gemini/Slack/MCP 응답이나 브라우저를 기다리는 데 쓴다. 이 러너는 전용 스레드의 이벤트 루프에서
+- 시나리오 생성/Vision 검증: Vertex AI generate_content_async
+- 브라우저 실행: ParallelBrowserExecutor (공유 Chromium의 시나리오별 컨텍스트,
+  SCENARIO_CONCURRENCY=1이면 aiohttp로 Browser MCP 호출)
+- Slack 리포트: AsyncWebClient
+를 실행해 대기 시간을 겹치고, 워커 스레드 수와 관계없이 최대 ASYNC_PIPELINE_CONCURRENCY개의 PR을 동시에 진행한다.
+
+체크포인트/진행 상황 기록/제한 시간은 스레드 엔진과 같은 훅(PipelineCheckpointService, TestProgressRecorder,
+CancellationToken)을 사용하고, DB에 쓰는 훅은 이벤트 루프를 막지 않도록 asyncio.to_thread로 실행한다.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime
+from playwright.async_api import async_playwright
+from ..config import VIDEOS_DIR, SCENARIO_CONCURRENCY, VISION_VALIDATION_WORKERS
+from .browser_mcp_client import AsyncBrowserMCPClient
+from .parallel_browser_executor import ParallelBrowserExecutor, SharedBrowser
+from .pipeline_checkpoint_service import STAGE_SCENARIOS, needs_validation
+from .pr_analyzer_service import PRAnalyzerService
+from .run_registry import CancellationToken, PipelineCancelled, PipelineTimeout
+from .slack_notifier import SlackNotifier
+from .stage_timer import (
+    StageTimer, elapsed_ms, STAGE_SCENARIO_GENERATION, STAGE_BROWSER_EXECUTION,
+    STAGE_VISION_VALIDATION, STAGE_SLACK_NOTIFICATION
+)
+from .vision_validator import VisionValidator
+
+
+@contextmanager
+def _stage(timer, cancel_token, name):
+    """단계 소요 시간 기록 + 단계 제한 시간 적용"""
+    with timer.stage(name), cancel_token.stage(name):
+        yield
+
+
+class AsyncPipelineRunner:
+    """전용 스레드의 이벤트 루프 + 공유 브라우저/MCP 클라이언트/Vertex 모델로 PR 파이프라인 실행"""
+    
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._resource_lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self._mcp_client = None
+        self._analyzer = None
+        self._validator = None
+    
+    def submit(self, coro) -> Future:
+        """코루틴을 러너의 이벤트 루프에서 실행 (처음 호출할 때 루프 스레드 시작)
+        
+        Returns:
+            Future: 코루틴 결과 (다른 스레드에서 대기 가능)
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    def start(self):
+        with self._lock:
+            if self._thread:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name='async-pipeline-loop', daemon=True)
+            self._thread.start()
+        print("✅ Async pipeline runner started")
+    
+    async def run_test_pipeline(self, pr, pr_diff, cancel_token=None, timer=None, checkpoint=None, progress=None):
+        """
+        TestPipelineService.run_test_pipeline의 asyncio 버전 (러너의 이벤트 루프에서 실행)
+        
+        인자와 반환값, PipelineTimeout/PipelineCancelled 전파는 스레드 엔진과 같다.
+        다만 제한 시간이 지나거나 취소되면 진행 중인 Gemini/Slack/브라우저 대기를 바로 취소한다.
+        """
+        cancel_token = cancel_token or CancellationToken()
+        timer = timer or StageTimer()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        pr_number = pr.number
+        
+        # preview 브랜치만 테스트 대상이므로 항상 고정된 URL 사용
+        pr_full_url = "https://preview-dev.oliveyoung.com"
+        
+        try:
+            # 1. PR 분석 및 시나리오 생성 (같은 커밋에서 이미 생성한 시나리오가 있으면 재사용)
+            cancel_token.raise_if_cancelled()
+            scenarios = await asyncio.to_thread(checkpoint.load, STAGE_SCENARIOS) if checkpoint else None
+            if scenarios is not None:
+                print(f"♻️ Reusing {len(scenarios)} checkpointed test scenarios")
+            else:
+                print(f"📝 Analyzing PR #{pr_number} with Gemini...")
+                with _stage(timer, cancel_token, STAGE_SCENARIO_GENERATION):
+                    scenarios = await self._guard(
+                        self._get_analyzer().analyze_and_generate_scenarios_async(pr_diff, pr_url=pr_full_url),
+                        cancel_token
+                    )
+                if checkpoint:
+                    await asyncio.to_thread(checkpoint.save, STAGE_SCENARIOS, scenarios)
+                print(f"✓ Generated {len(scenarios)} test scenarios for PR #{pr_number}")
+            
+            # 2~3. 브라우저 테스트 실행 + Vision API 검증 (시나리오가 끝날 때마다 검증 태스크 시작)
+            cancel_token.raise_if_cancelled()
+            completed = await asyncio.to_thread(checkpoint.load_scenario_results) if checkpoint else {}
+            pending = [(index, scenario) for index, scenario in enumerate(scenarios) if index not in completed]
+            if completed:
+                print(f"♻️ Reusing {len(completed)} checkpointed scenario result(s)")
+            if progress:
+                await asyncio.to_thread(progress.start, len(scenarios), sum(
+                    1 for result in completed.values() if not needs_validation(result)
+                ))
+            
+            validation_slots = asyncio.Semaphore(VISION_VALIDATION_WORKERS)
+            positions = {id(scenario): index for index, scenario in pending}
+            followups = []
+            
+            def record(index, scenario, result, executed):
+                followups.append(asyncio.create_task(self._record_result(
+                    index, scenario, result, executed, checkpoint, progress, validation_slots
+                )))
+            
+            try:
+                # 실행은 끝났지만 검증 전에 중단된 시나리오는 검증만 다시 수행
+                for index, result in completed.items():
+                    if needs_validation(result):
+                        record(index, scenarios[index], result, executed=False)
+                
+                executed = []
+                if pending:
+                    with _stage(timer, cancel_token, STAGE_BROWSER_EXECUTION):
+                        executor = ParallelBrowserExecutor(
+                            video_dir=os.path.join(VIDEOS_DIR, f"test_{timestamp}_pr{pr_number}"),
+                            concurrency=SCENARIO_CONCURRENCY,
+                            mcp_client=await self._get_mcp_client()
+                        )
+                        executed = await self._guard(executor.run_scenarios_async(
+                            [scenario for _, scenario in pending], pr_url=pr_full_url, cancel_token=cancel_token,
+                            on_result=lambda scenario, result: record(positions[id(scenario)], scenario, result, executed=True),
+                            browser=await self._get_browser()
+                        ), cancel_token)
+                print(f"👁️ Waiting for Gemini Vision validation (PR #{pr_number})...")
+                with _stage(timer, cancel_token, STAGE_VISION_VALIDATION):
+                    await self._guard(asyncio.gather(*followups), cancel_token)
+            finally:
+                for task in followups:
+                    task.cancel()
+            
+            executed_by_index = dict(zip([index for index, _ in pending], executed))
+            test_results = [
+                completed[index] if index in completed else executed_by_index[index]
+                for index in range(len(scenarios))
+            ]
+            timer.record_scenarios(test_results)
+            
+            # 4. 리포트 생성 및 슬랙 알림
+            cancel_token.raise_if_cancelled()
+            print(f"📤 Sending Slack notification (PR #{pr_number})...")
+            with _stage(timer, cancel_token, STAGE_SLACK_NOTIFICATION):
+                notifier = SlackNotifier(timeout=cancel_token.timeout(30))
+                await self._guard(
+                    notifier.send_test_report_async(pr, test_results, timestamp, pr_url=pr_full_url),
+                    cancel_token
+                )
+            
+            print(f"✅ Test pipeline completed for PR #{pr_number}!")
+            
+            return {
+                'success': True,
+                'test_results': test_results,
+                'pr_url': pr_full_url,
+                'stage_timings': timer.as_dict()
+            }
+        
+        except PipelineTimeout as e:
+            print(f"⏱️ Pipeline timed out for PR #{pr_number}: {str(e)}")
+            try:
+                await SlackNotifier(timeout=5).send_error_notification_async(pr, f"Timeout: {str(e)}")
+            except Exception:
+                pass
+            raise
+        except PipelineCancelled as e:
+            print(f"🛑 Pipeline cancelled for PR #{pr_number}: {str(e)}")
+            raise
+        except Exception as e:
+            print(f"❌ Pipeline error for PR #{pr_number}: {str(e)}")
+            try:
+                await SlackNotifier().send_error_notification_async(pr, str(e))
+            except Exception:
+                pass
+            
+            return {
+                'success': False,
+                'error': str(e),
+                'stage_timings': timer.as_dict()
+            }
+    
+    async def _record_result(self, index, scenario, result, executed, checkpoint, progress, validation_slots):
+        """시나리오 하나의 실행 결과 저장 → Vision 검증 → 검증 결과 저장 → 진행 개수 갱신 (스레드 엔진의 on_result/on_validated와 같은 순서)"""
+        if executed and checkpoint:
+            await asyncio.to_thread(checkpoint.save_execution, index, result)
+        
+        if needs_validation(result):
+            expected_result = result.get('expected_result') or scenario.get('expected_result', '')
+            async with validation_slots:
+                started = time.monotonic()
+                try:
+                    result['validation'] = await self._get_validator().validate_screenshot_async(
+                        result['screenshot'], expected_result
+                    )
+                finally:
+                    result['validation_ms'] = elapsed_ms(started)
+            if checkpoint:
+                await asyncio.to_thread(checkpoint.save_validation, index, result['validation'])
+        
+        if progress:
+            await asyncio.to_thread(progress.record)
+    
+    async def _guard(self, awaitable, cancel_token):
+        """
+        awaitable이 끝날 때까지 1초마다 취소/제한 시간을 확인하며 대기
+        
+        취소되거나 제한 시간이 지나면 대기 중인 작업을 취소하고 PipelineCancelled/PipelineTimeout 발생
+        """
+        task = asyncio.ensure_future(awaitable)
+        try:
+            while not task.done():
+                if cancel_token.is_cancelled:
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    cancel_token.raise_if_cancelled()
+                await asyncio.wait({task}, timeout=1)
+            return task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+    
+    async def _get_browser(self) -> SharedBrowser:
+        """모든 파이프라인이 공유하는 브라우저 (Chromium은 처음 컨텍스트가 필요할 때 실행)"""
+        async with self._resource_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = SharedBrowser(self._playwright)
+            return self._browser
+    
+    async def _get_mcp_client(self):
+        """SCENARIO_CONCURRENCY=1이면 Browser MCP 클라이언트 (MCP 서버의 브라우저 세션 하나를 모든 파이프라인이 순서대로 사용)"""
+        if SCENARIO_CONCURRENCY > 1 or os.getenv('USE_BROWSER_MCP', 'true').lower() != 'true':
+            return None
+        async with self._resource_lock:
+            if self._mcp_client is None:
+                self._mcp_client = AsyncBrowserMCPClient()
+            return self._mcp_client
+    
+    def _get_analyzer(self) -> PRAnalyzerService:
+        if self._analyzer is None:
+            # preview 브랜치는 항상 preview-dev.oliveyoung.com 사용
+            self._analyzer = PRAnalyzerService(base_url="preview-dev.oliveyoung.com")
+        return self._analyzer
+    
+    def _get_validator(self) -> VisionValidator:
+        if self._validator is None:
+            self._validator = VisionValidator()
+        return self._validator
+
+
+# 프로세스 전체에서 공유하는 인스턴스 (이벤트 루프와 브라우저를 프로세스 단위로 하나만 사용)
+async_pipeline_runner = AsyncPipelineRunner()
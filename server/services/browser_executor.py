@@ -8,8 +8,143 @@ import time
 import os
 from urllib.parse import urlparse
 from .browser_mcp_client import BrowserMCPClient
+from .run_registry import PipelineCancelled
+from .stage_timer import elapsed_ms
 from playwright.sync_api import sync_playwright
 
+# 브라우저에서 실행할 수 있는 액션 타입 (comment 등 설명용 액션은 제외)
+SUPPORTED_ACTION_TYPES = ['goto', 'click', 'fill', 'wait', 'screenshot', 'set_viewport']
+
+def prepare_scenario(scenario):
+    """
+    시나리오에서 결과 딕셔너리와 실행할 액션 목록을 준비 (순차/병렬 실행기 공용)
+    
+    Returns:
+        tuple: (결과 딕셔너리, 실행할 액션 목록) - 실행할 액션이 없으면 실패 결과와 빈 목록
+    """
+    # 시나리오가 결과 형태인지 원본 형태인지 확인
+    scenario_name = scenario.get('scenario_name') or scenario.get('name', 'Unknown Scenario')
+    description = scenario.get('description', '')
+    expected_result = scenario.get('expected_result', '')
+    related_files = scenario.get('related_files') or []
+    actions = scenario.get('actions', [])
+    
+    # actions가 없고 actions_executed가 있으면 원본 actions 추출 시도
+    if not actions and 'actions_executed' in scenario:
+        actions_executed = scenario.get('actions_executed', [])
+        for action_result in actions_executed:
+            if 'action' in action_result:
+                actions.append(action_result['action'])
+            elif 'type' in action_result:
+                # action_result 자체가 action 형태일 수 있음
+                action = {k: v for k, v in action_result.items() 
+                         if k not in ['success', 'error', 'screenshot', 'screenshot_path']}
+                if action:
+                    actions.append(action)
+    
+    if not actions:
+        return {
+            'scenario_name': scenario_name,
+            'description': description,
+            'expected_result': expected_result,
+            'related_files': related_files,
+            'actions': [],
+            'actions_executed': [],
+            'success': False,
+            'error': '시나리오에 실행할 액션이 없습니다.',
+            'screenshot': None
+        }, []
+    
+    result = {
+        'scenario_name': scenario_name,
+        'description': description,
+        'expected_result': expected_result,
+        'related_files': related_files,  # 증분 실행에서 다시 실행할 시나리오를 고르는 데 사용
+        'actions': actions,  # 원본 액션 목록도 저장 (프론트엔드 표시용)
+        'actions_executed': [],
+        'success': True,
+        'error': None,
+        'screenshot': None
+    }
+    
+    # 지원되지 않는 액션 타입 필터링 (comment 등)
+    filtered_actions = [action for action in actions if action.get('type') in SUPPORTED_ACTION_TYPES]
+    
+    if len(filtered_actions) < len(actions):
+        skipped_count = len(actions) - len(filtered_actions)
+        print(f"⚠️ {skipped_count}개의 지원되지 않는 액션 타입이 필터링되었습니다.")
+    
+    if not filtered_actions:
+        return {
+            'scenario_name': scenario_name,
+            'description': description,
+            'expected_result': expected_result,
+            'related_files': related_files,
+            'actions': actions,
+            'actions_executed': [],
+            'success': False,
+            'error': '시나리오에 실행 가능한 액션이 없습니다.',
+            'screenshot': None
+        }, []
+    
+    
+    return result, filtered_actions
+
+def resolve_goto_url(original_url, pr_url):
+    """goto 액션의 URL을 PR 배포 URL 기준으로 변환"""
+    target = pr_url if pr_url.startswith(('http://', 'https://')) else f"http://{pr_url}"
+    parsed_target = urlparse(target)
+    base_scheme = parsed_target.scheme or 'http'
+    base_netloc = parsed_target.netloc
+    base_root = f"{base_scheme}://{base_netloc}"
+    
+    if original_url.startswith('/'):
+        return f"{base_root}{original_url}"
+    elif original_url.startswith(('http://', 'https://')):
+        return original_url
+    elif '://' not in original_url and ('.' in original_url or ':' in original_url):
+        scheme = 'http' if original_url.startswith(('localhost', '127.')) else base_scheme
+        return f"{scheme}://{original_url.lstrip('/')}"
+    else:
+        return f"{base_root}/{original_url.lstrip('/')}"
+
+
+def playwright_action_call(action, timeout_ms):
+    """
+    액션을 실행할 Playwright page 메서드와 인자 (순차 실행기의 sync API / 병렬 실행기의 async API 공용)
+    
+    Returns:
+        tuple: (page 메서드 이름, args, kwargs) - 브라우저에서 실행하지 않는 액션이면 None
+    """
+    action_type = action['type']
+    if action_type == 'goto':
+        return 'goto', (action['url'],), {'wait_until': 'networkidle', 'timeout': timeout_ms}
+    if action_type == 'fill':
+        return 'fill', (action['selector'], action['value']), {'timeout': timeout_ms}
+    if action_type == 'click':
+        return 'click', (action['selector'],), {'timeout': timeout_ms}
+    if action_type == 'wait':
+        return 'wait_for_timeout', (action.get('seconds', 1) * 1000,), {}
+    if action_type == 'set_viewport':
+        # 뷰포트 크기 설정
+        return 'set_viewport_size', ({'width': action.get('width', 1920), 'height': action.get('height', 1080)},), {}
+    if action_type == 'screenshot':
+        return 'screenshot', (), {}
+    return None
+
+def playwright_action_result(action, returned):
+    """page 메서드 반환값으로 액션 결과 생성 (screenshot은 base64로 포함)"""
+    if action['type'] == 'screenshot':
+        return {'action': action, 'success': True, 'screenshot': base64.b64encode(returned).decode()}
+    return {'action': action, 'success': True}
+
+def skipped_action_result(action):
+    """브라우저에서 실행하지 않는 액션의 결과 (comment는 설명용이므로 성공으로 처리)"""
+    if action['type'] == 'comment':
+        return {'action': action, 'success': True, 'skipped': True}
+    return {'action': action, 'success': False, 'error': f"Unknown action type: {action['type']}"}
+
+
 class BrowserExecutor:
     """
     Browser MCP를 사용하여 시나리오를 실행하는 클래스
@@ -23,6 +158,7 @@ class BrowserExecutor:
             base_url: 기본 URL (기본값: global.oliveyoung.com)
         """
         self.base_url = base_url or os.getenv('BASE_URL', 'localhost:5173')
+        self._cancel_token = None
         self.use_mcp = use_mcp and os.getenv('USE_BROWSER_MCP', 'true').lower() == 'true'
         
         if self.use_mcp:
@@ -48,98 +184,34 @@ class BrowserExecutor:
             self.page = self.context.new_page()
             self.mcp_client = None
     
-    def execute_scenario(self, scenario, pr_url=None):
+    def execute_scenario(self, scenario, pr_url=None, cancel_token=None):
         """
         시나리오 실행
         
         Args:
             scenario: 테스트 시나리오 딕셔너리 (원본 형태 또는 결과 형태)
             pr_url: PR 배포 URL (있을 경우 시나리오의 URL을 대체)
+            cancel_token: 취소 신호 (취소되면 다음 액션 전에 PipelineCancelled 발생,
+                제한 시간이 있으면 각 액션의 timeout도 남은 시간 이내로 줄임)
         """
-        # 시나리오가 결과 형태인지 원본 형태인지 확인
-        scenario_name = scenario.get('scenario_name') or scenario.get('name', 'Unknown Scenario')
-        description = scenario.get('description', '')
-        expected_result = scenario.get('expected_result', '')
-        actions = scenario.get('actions', [])
-        
-        # actions가 없고 actions_executed가 있으면 원본 actions 추출 시도
-        if not actions and 'actions_executed' in scenario:
-            actions_executed = scenario.get('actions_executed', [])
-            for action_result in actions_executed:
-                if 'action' in action_result:
-                    actions.append(action_result['action'])
-                elif 'type' in action_result:
-                    # action_result 자체가 action 형태일 수 있음
-                    action = {k: v for k, v in action_result.items() 
-                             if k not in ['success', 'error', 'screenshot', 'screenshot_path']}
-                    if action:
-                        actions.append(action)
-        
-        if not actions:
-            return {
-                'scenario_name': scenario_name,
-                'description': description,
-                'expected_result': expected_result,
-                'actions': [],
-                'actions_executed': [],
-                'success': False,
-                'error': '시나리오에 실행할 액션이 없습니다.',
-                'screenshot': None
-            }
-        
-        result = {
-            'scenario_name': scenario_name,
-            'description': description,
-            'expected_result': expected_result,
-            'actions': actions,  # 원본 액션 목록도 저장 (프론트엔드 표시용)
-            'actions_executed': [],
-            'success': True,
-            'error': None,
-            'screenshot': None
-        }
-        
-        # 지원되지 않는 액션 타입 필터링 (comment 등)
-        supported_action_types = ['goto', 'click', 'fill', 'wait', 'screenshot', 'set_viewport']
-        filtered_actions = [action for action in actions if action.get('type') in supported_action_types]
-        
-        if len(filtered_actions) < len(actions):
-            skipped_count = len(actions) - len(filtered_actions)
-            print(f"⚠️ {skipped_count}개의 지원되지 않는 액션 타입이 필터링되었습니다.")
-        
+        self._cancel_token = cancel_token
+        result, filtered_actions = prepare_scenario(scenario)
         if not filtered_actions:
-            return {
-                'scenario_name': scenario_name,
-                'description': description,
-                'expected_result': expected_result,
-                'actions': actions,
-                'actions_executed': [],
-                'success': False,
-                'error': '시나리오에 실행 가능한 액션이 없습니다.',
-                'screenshot': None
-            }
+            return result
         
+        scenario_started = time.monotonic()
         try:
             for action in filtered_actions:
+                if cancel_token:
+                    cancel_token.raise_if_cancelled()
+                
                 # PR URL이 있으면 goto 액션의 URL을 대체
                 if action['type'] == 'goto' and pr_url:
-                    original_url = action['url']
-                    target = pr_url if pr_url.startswith(('http://', 'https://')) else f"http://{pr_url}"
-                    parsed_target = urlparse(target)
-                    base_scheme = parsed_target.scheme or 'http'
-                    base_netloc = parsed_target.netloc
-                    base_root = f"{base_scheme}://{base_netloc}"
-                    
-                    if original_url.startswith('/'):
-                        action['url'] = f"{base_root}{original_url}"
-                    elif original_url.startswith(('http://', 'https://')):
-                        action['url'] = original_url
-                    elif '://' not in original_url and ('.' in original_url or ':' in original_url):
-                        scheme = 'http' if original_url.startswith(('localhost', '127.')) else base_scheme
-                        action['url'] = f"{scheme}://{original_url.lstrip('/')}"
-                    else:
-                        action['url'] = f"{base_root}/{original_url.lstrip('/')}"
+                    action['url'] = resolve_goto_url(action['url'], pr_url)
                 
+                action_started = time.monotonic()
                 action_result = self._execute_action(action)
+                action_result['duration_ms'] = elapsed_ms(action_started)
                 result['actions_executed'].append(action_result)
                 
                 if not action_result['success']:
@@ -154,18 +226,28 @@ class BrowserExecutor:
                     result['screenshot'] = screenshot_result.get('screenshot')
                     result['screenshot_path'] = screenshot_result.get('screenshot_path')
             
+        except PipelineCancelled:
+            raise
         except Exception as e:
             result['success'] = False
             result['error'] = str(e)
         
+        result['duration_ms'] = elapsed_ms(scenario_started)
         return result
     
+    def _action_timeout(self, default: float = 30) -> float:
+        """액션 timeout (초) - 제한 시간이 설정되어 있으면 남은 시간을 넘지 않음"""
+        if self._cancel_token:
+            return self._cancel_token.timeout(default)
+        return default
+    
     def _execute_action(self, action):
         """개별 액션 실행"""
         action_type = action['type']
         
         try:
             if self.use_mcp and self.mcp_client:
+                self.mcp_client.request_timeout = self._action_timeout()
                 result = self._execute_action_mcp(action)
                 # MCP 연결 실패 시 Playwright로 폴백
                 if not result.get('success') and result.get('error') and 'Connection' in result.get('error', ''):
@@ -232,11 +314,8 @@ class BrowserExecutor:
                 height = action.get('height', 1080)
                 result = self.mcp_client.resize(width, height)
                 return {'action': action, 'success': result.get('success', True), 'error': result.get('error')}
-            elif action_type == 'comment':
-                # comment 타입은 무시하고 성공으로 처리 (설명용 액션)
-                return {'action': action, 'success': True, 'skipped': True}
             else:
-                return {'action': action, 'success': False, 'error': f'Unknown action type: {action_type}'}
+                return skipped_action_result(action)
             
             if not result.get('success') and result.get('fallback'):
                 raise Exception(result.get('error', 'MCP connection failed'))
@@ -247,56 +326,12 @@ class BrowserExecutor:
     
     def _execute_action_playwright(self, action):
         """Playwright를 사용하여 액션 실행 (폴백)"""
-        action_type = action['type']
-        
-        if action_type == 'goto':
-            self.page.goto(action['url'], wait_until='networkidle', timeout=30000)
-            return {'action': action, 'success': True}
-        
-        elif action_type == 'fill':
-            self.page.fill(action['selector'], action['value'])
-            return {'action': action, 'success': True}
-        
-        elif action_type == 'click':
-            self.page.click(action['selector'])
-            return {'action': action, 'success': True}
+        call = playwright_action_call(action, self._action_timeout() * 1000)
+        if not call:
+            return skipped_action_result(action)
         
-        elif action_type == 'wait':
-            time.sleep(action.get('seconds', 1))
-            return {'action': action, 'success': True}
-        
-        elif action_type == 'set_viewport':
-            # 뷰포트 크기 설정
-            width = action.get('width', 1920)
-            height = action.get('height', 1080)
-            self.page.set_viewport_size({'width': width, 'height': height})
-            return {'action': action, 'success': True}
-        
-        elif action_type == 'screenshot':
-            screenshot_bytes = self.page.screenshot()
-            screenshot_b64 = base64.b64encode(screenshot_bytes).decode()
-            return {
-                'action': action,
-                'success': True,
-                'screenshot': screenshot_b64
-            }
-        
-        elif action_type == 'set_viewport':
-            # 뷰포트 크기 설정
-            width = action.get('width', 1920)
-            height = action.get('height', 1080)
-            self.page.set_viewport_size({'width': width, 'height': height})
-            return {'action': action, 'success': True}
-        
-        elif action_type == 'comment':
-            # comment 타입은 무시하고 성공으로 처리 (설명용 액션)
-            return {'action': action, 'success': True, 'skipped': True}
-        else:
-            return {
-                'action': action,
-                'success': False,
-                'error': f'Unknown action type: {action_type}'
-            }
+        method, args, kwargs = call
+        return playwright_action_result(action, getattr(self.page, method)(*args, **kwargs))
     
     def _take_screenshot(self):
         """스크린샷 촬영"""
@@ -3,10 +3,12 @@
 Browser MCP 클라이언트
 MCP 서버와 통신하여 브라우저 자동화 기능을 제공
 """
+import asyncio
 import os
 import json
 import base64
 import time
+import aiohttp
 import requests
 from typing import Dict, List, Optional
 
@@ -20,6 +22,7 @@ class BrowserMCPClient:
         """
         self.mcp_server_url = mcp_server_url or os.getenv('MCP_SERVER_URL', 'http://localhost:3000')
         self.session_id = None
+        self.request_timeout = 30  # 요청 timeout (초) - 파이프라인 제한 시간이 가까우면 BrowserExecutor가 줄임
     
     def navigate(self, url: str) -> Dict:
         """URL로 이동"""
@@ -68,7 +71,7 @@ class BrowserMCPClient:
                     'method': method,
                     'params': params
                 },
-                timeout=30
+                timeout=self.request_timeout
             )
             response.raise_for_status()
             return response.json()
@@ -80,3 +83,98 @@ class BrowserMCPClient:
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
+
+class AsyncBrowserMCPClient:
+    """
+    BrowserMCPClient의 asyncio 버전 (aiohttp로 요청해서 이벤트 루프 하나가 여러 PR의 MCP 호출을 함께 대기)
+    
+    MCP 서버는 브라우저 세션이 하나이므로 시나리오 하나를 실행하는 동안 lock을 잡아 다른 시나리오의 액션이 섞이지 않게 한다.
+    """
+    
+    def __init__(self, mcp_server_url=None):
+        self.mcp_server_url = mcp_server_url or os.getenv('MCP_SERVER_URL', 'http://localhost:3000')
+        self.lock = asyncio.Lock()
+        self._session = None
+    
+    async def navigate(self, url: str, timeout: float = 30) -> Dict:
+        return await self._call_mcp('browser_navigate', {'url': url}, timeout)
+    
+    async def click(self, selector: str, timeout: float = 30) -> Dict:
+        return await self._call_mcp('browser_click', {'selector': selector}, timeout)
+    
+    async def fill(self, selector: str, text: str, timeout: float = 30) -> Dict:
+        return await self._call_mcp('browser_fill', {'selector': selector, 'text': text}, timeout)
+    
+    async def screenshot(self, full_page: bool = False, timeout: float = 30) -> Dict:
+        return await self._call_mcp('browser_screenshot', {'full_page': full_page}, timeout)
+    
+    async def resize(self, width: int, height: int, timeout: float = 30) -> Dict:
+        return await self._call_mcp('browser_resize', {'width': width, 'height': height}, timeout)
+    
+    async def close(self):
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
+    async def _call_mcp(self, method: str, params: Dict, timeout: float) -> Dict:
+        """MCP 서버에 요청 전송 (응답/에러 형식은 BrowserMCPClient._call_mcp와 같음)"""
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        try:
+            async with self._session.post(
+                f"{self.mcp_server_url}/mcp/call",
+                json={'method': method, 'params': params},
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                response.raise_for_status()
+                return await response.json()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            print(f"⚠️ MCP server not available, using fallback: {e}")
+            return {'success': False, 'error': str(e), 'fallback': True}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+
+class MCPConnectionError(Exception):
+    """MCP 서버에 연결할 수 없는 경우 (호출한 쪽에서 Playwright로 폴백)"""
+    pass
+
+
+class MCPPage:
+    """
+    AsyncBrowserMCPClient를 Playwright async page처럼 사용하는 어댑터
+    
+    playwright_action_call이 돌려주는 page 메서드 이름/인자를 그대로 MCP 호출로 실행한다.
+    Playwright와 같이 실패하면 예외를 발생시킨다.
+    """
+    
+    def __init__(self, client: AsyncBrowserMCPClient):
+        self.client = client
+    
+    async def goto(self, url, wait_until=None, timeout=30000):
+        await self._check(self.client.navigate(url, timeout=timeout / 1000))
+    
+    async def fill(self, selector, value, timeout=30000):
+        await self._check(self.client.fill(selector, value, timeout=timeout / 1000))
+    
+    async def click(self, selector, timeout=30000):
+        await self._check(self.client.click(selector, timeout=timeout / 1000))
+    
+    async def wait_for_timeout(self, timeout_ms):
+        await asyncio.sleep(timeout_ms / 1000)
+    
+    async def set_viewport_size(self, viewport_size):
+        await self._check(self.client.resize(viewport_size['width'], viewport_size['height']))
+    
+    async def screenshot(self, full_page=False):
+        result = await self._check(self.client.screenshot(full_page=full_page))
+        screenshot_data = result.get('screenshot')
+        return base64.b64decode(screenshot_data) if isinstance(screenshot_data, str) else screenshot_data
+    
+    async def _check(self, call) -> Dict:
+        result = await call
+        if result.get('fallback'):
+            raise MCPConnectionError(result.get('error', 'MCP connection failed'))
+        if not result.get('success', True):
+            raise Exception(result.get('error') or 'MCP call failed')
+        return result
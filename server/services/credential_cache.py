@@ -0,0 +1,74 @@
+# server/services/credential_cache.py
+"""
+복호화된 PAT / GitHub 클라이언트 캐시
+
+Polling, 재실행, 구독 조회마다 인증 정보 조회(DB) + 복호화 + 새 Github 클라이언트 생성을
+반복하지 않도록 인증 정보 ID별로 TTL 동안 메모리에 유지한다.
+PAT가 변경되면(save_credential) 해당 인증 정보의 항목을 바로 무효화한다.
+"""
+import threading
+import time
+from typing import Callable, Optional
+from github import Github
+from ..config import CREDENTIAL_CACHE_TTL_SECONDS, POLLING_MAX_WORKERS
+
+
+class CredentialCache:
+    """인증 정보 ID별 복호화된 PAT와 GitHub 클라이언트 (TTL 만료)"""
+    
+    def __init__(self, ttl_seconds: int = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else CREDENTIAL_CACHE_TTL_SECONDS
+        self._pats = {}  # credential_id -> (pat, expires_at)
+        self._clients = {}  # credential_id(None이면 익명) -> (Github, expires_at, pat)
+        self._lock = threading.Lock()
+    
+    def get_pat(self, credential_id: int, loader: Callable[[int], Optional[str]]) -> Optional[str]:
+        """캐시된 PAT 반환 (없거나 만료되면 loader로 조회해 저장, 조회 실패(None)도 TTL 동안 유지)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._pats.get(credential_id)
+            if entry and entry[1] > now:
+                return entry[0]
+        
+        pat = loader(credential_id)
+        with self._lock:
+            self._evict_expired(now)
+            self._pats[credential_id] = (pat, now + self.ttl_seconds)
+        return pat
+    
+    def get_client(self, credential_id: Optional[int], pat: Optional[str]) -> Github:
+        """인증 정보의 GitHub 클라이언트 (연결 풀을 재사용, PAT가 없으면 익명 클라이언트)"""
+        key = credential_id if pat else None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._clients.get(key)
+            # 다른 프로세스에서 PAT가 바뀌어 새로 복호화된 PAT와 다르면 클라이언트도 다시 생성
+            if entry and entry[1] > now and entry[2] == pat:
+                return entry[0]
+            
+            # 여러 Polling/파이프라인 스레드가 공유하므로 연결 풀 크기를 워커 수에 맞춤
+            client = Github(pat, pool_size=POLLING_MAX_WORKERS) if pat else Github(pool_size=POLLING_MAX_WORKERS)
+            self._evict_expired(now)
+            self._clients[key] = (client, now + self.ttl_seconds, pat)
+            return client
+    
+    def invalidate(self, credential_id: int):
+        """PAT가 변경/삭제된 인증 정보의 항목 제거"""
+        with self._lock:
+            self._pats.pop(credential_id, None)
+            self._clients.pop(credential_id, None)
+    
+    def clear(self):
+        with self._lock:
+            self._pats.clear()
+            self._clients.clear()
+    
+    def _evict_expired(self, now: float):
+        """만료된 항목 제거 (삭제된 인증 정보의 PAT가 메모리에 계속 남지 않도록, lock 안에서 호출)"""
+        for cache in (self._pats, self._clients):
+            for key in [key for key, entry in cache.items() if entry[1] <= now]:
+                del cache[key]
+
+
+# 프로세스 전체에서 공유하는 인스턴스
+credential_cache = CredentialCache()
@@ -0,0 +1,156 @@
+# server/services/github_graphql_fetcher.py
+"""
+GitHub GraphQL 기반 열린 PR 일괄 조회 서비스
+
+같은 인증 정보를 쓰는 여러 레포지토리의 열린 PR을 하나의 GraphQL 쿼리로 조회한다.
+Polling에서 사용하는 필드만 요청하며, 결과는 GitHubPRFetcher와 같은 PR 딕셔너리 형식이다.
+"""
+import requests
+from typing import Dict, List, Optional
+from datetime import datetime
+from .github_pr_fetcher import collect_until, normalize_timestamp
+from .rate_limit_tracker import rate_limit_tracker, RateLimitError, PRIORITY_LOW
+
+PULL_REQUEST_FIELDS = """
+        nodes {
+          number
+          title
+          headRefName
+          headRefOid
+          createdAt
+          updatedAt
+          url
+        }
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+"""
+
+
+class GitHubGraphQLFetcher:
+    """GraphQL로 여러 레포지토리의 열린 PR 목록을 한 번에 조회"""
+    
+    PER_PAGE = 50
+    
+    def __init__(self):
+        self.graphql_url = "https://api.github.com/graphql"
+    
+    def fetch_open_pulls(self, repo_full_names: List[str], pat: str, since_by_repo: Dict[str, Optional[datetime]] = None, priority: str = PRIORITY_LOW) -> Dict[str, Dict]:
+        """여러 레포지토리의 열린 PR 목록을 updated 내림차순으로 조회
+        
+        GraphQL API는 인증이 필수이므로 PAT가 있는 구독에만 사용한다.
+        
+        Args:
+            repo_full_names: 'owner/repo' 목록 (한 쿼리로 묶을 레포지토리)
+            pat: 모든 레포지토리에 접근 가능한 PAT
+            since_by_repo: 레포지토리별 증분 조회 기준 시각 (None이면 전체 조회)
+            priority: Rate Limit 예산 확인에 사용할 작업 우선순위
+        
+        Returns:
+            dict: {repo_full_name: {'pulls': [...], 'not_modified': False, 'complete': bool}}
+                  조회에 실패한 레포지토리는 결과에 포함되지 않음
+        """
+        since_by_repo = since_by_repo or {}
+        aliases = {f'r{index}': repo for index, repo in enumerate(repo_full_names)}
+        
+        variable_defs = []
+        variables = {}
+        selections = []
+        for alias, repo_full_name in aliases.items():
+            owner, name = repo_full_name.split('/', 1)
+            variable_defs.append(f'${alias}_owner: String!, ${alias}_name: String!')
+            variables[f'{alias}_owner'] = owner
+            variables[f'{alias}_name'] = name
+            selections.append(f"""
+    {alias}: repository(owner: ${alias}_owner, name: ${alias}_name) {{
+      pullRequests(states: OPEN, first: {self.PER_PAGE}, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+{PULL_REQUEST_FIELDS}
+      }}
+    }}""")
+        
+        query = f"query({', '.join(variable_defs)}) {{{''.join(selections)}\n}}"
+        data = self._execute(query, variables, pat, priority)
+        
+        results = {}
+        for alias, repo_full_name in aliases.items():
+            repository = data.get(alias)
+            if not repository:
+                # 존재하지 않거나 접근 권한이 없는 레포지토리 - 호출 측에서 REST로 폴백
+                continue
+            
+            try:
+                results[repo_full_name] = self._collect_repository(
+                    repo_full_name,
+                    repository['pullRequests'],
+                    pat,
+                    since_by_repo.get(repo_full_name),
+                    priority
+                )
+            except Exception as e:
+                print(f"    ⚠️ GraphQL pagination failed for {repo_full_name}: {str(e)}")
+        
+        return results
+    
+    def _collect_repository(self, repo_full_name: str, connection: Dict, pat: str, since: Optional[datetime], priority: str) -> Dict:
+        """첫 페이지 결과에 이어 필요한 만큼 다음 페이지를 조회 (since 이전 PR을 만나면 중단)"""
+        pulls = []
+        reached_since = collect_until([self._to_pr_dict(node) for node in connection['nodes']], since, pulls)
+        page_info = connection['pageInfo']
+        
+        owner, name = repo_full_name.split('/', 1)
+        while not reached_since and page_info['hasNextPage']:
+            query = f"""query($owner: String!, $name: String!, $cursor: String) {{
+  repository(owner: $owner, name: $name) {{
+    pullRequests(states: OPEN, first: {self.PER_PAGE}, after: $cursor, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+{PULL_REQUEST_FIELDS}
+    }}
+  }}
+}}"""
+            data = self._execute(query, {'owner': owner, 'name': name, 'cursor': page_info['endCursor']}, pat, priority)
+            connection = data['repository']['pullRequests']
+            reached_since = collect_until([self._to_pr_dict(node) for node in connection['nodes']], since, pulls)
+            page_info = connection['pageInfo']
+        
+        return {
+            'pulls': pulls,
+            'not_modified': False,
+            'complete': not reached_since
+        }
+    
+    def _execute(self, query: str, variables: Dict, pat: str, priority: str) -> Dict:
+        rate_limit_tracker.check(pat, priority, resource='graphql')
+        response = requests.post(
+            self.graphql_url,
+            json={'query': query, 'variables': variables},
+            headers={'Authorization': f'bearer {pat}'},
+            timeout=20
+        )
+        rate_limit_tracker.record(pat, response.headers)
+        
+        if response.status_code != 200:
+            try:
+                message = response.json().get('message', '')
+            except ValueError:
+                message = response.text
+            raise Exception(f"GitHub API error {response.status_code}: {message}")
+        
+        body = response.json()
+        if body.get('errors') and not body.get('data'):
+            error = body['errors'][0]
+            if error.get('type') == 'RATE_LIMITED':
+                raise RateLimitError(f"GitHub GraphQL rate limit exceeded: {error.get('message')}")
+            raise Exception(f"GitHub GraphQL error: {error.get('message')}")
+        return body.get('data') or {}
+    
+    def _to_pr_dict(self, node: Dict) -> Dict:
+        """GraphQL 노드를 Polling에서 사용하는 PR 딕셔너리로 변환 (GitHubPRFetcher와 동일한 형식)"""
+        return {
+            'number': node['number'],
+            'title': node.get('title') or '',
+            'branch': node['headRefName'],
+            'head_sha': node.get('headRefOid'),
+            'url': node.get('url'),
+            'created_at': normalize_timestamp(node.get('createdAt')),
+            'updated_at': normalize_timestamp(node.get('updatedAt'))
+        }
@@ -0,0 +1,221 @@
+# server/services/github_pr_fetcher.py
+"""
+GitHub 열린 PR 목록 조회 서비스
+
+ETag / If-Modified-Since 조건부 요청으로 변경이 없는 레포지토리는
+304 Not Modified 응답을 받아 Rate Limit을 소모하지 않는다.
+"""
+import requests
+from typing import Dict, List, Optional
+from datetime import datetime
+from ..models import GitHubCache, get_db
+from .rate_limit_tracker import rate_limit_tracker, RateLimitError, PRIORITY_NORMAL
+
+OPEN_PULLS_RESOURCE = 'open_pulls'
+
+
+def collect_until(prs: List[Dict], since: Optional[datetime], pulls: List[Dict]) -> bool:
+    """since 이후에 업데이트된 PR을 pulls에 추가하고, since 이전 PR을 만났는지 반환 (updated 내림차순 PR 딕셔너리)"""
+    for pr in prs:
+        if since and pr['updated_at']:
+            updated_at = datetime.fromisoformat(pr['updated_at']).replace(tzinfo=None)
+            if updated_at <= since:
+                return True
+        pulls.append(pr)
+    return False
+
+
+def normalize_timestamp(value: Optional[str]) -> Optional[str]:
+    """'2024-01-01T00:00:00Z' → '2024-01-01T00:00:00+00:00' (PyGithub isoformat과 동일한 형식)"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).isoformat()
+
+
+class GitHubPRFetcher:
+    """열린 PR 목록 조회 (조건부 요청 캐시 사용)"""
+    
+    PER_PAGE = 100
+    
+    def __init__(self):
+        self.github_base_url = "https://api.github.com"
+    
+    def list_open_pulls(self, repo_full_name: str, pat: Optional[str] = None, credential_id: Optional[int] = None, since: Optional[datetime] = None, priority: str = PRIORITY_NORMAL) -> Dict:
+        """열린 PR 목록을 updated 내림차순으로 조회
+        
+        첫 페이지는 캐시된 ETag/Last-Modified로 조건부 요청하고, 304이면 캐시된 본문을 사용한다.
+        since가 주어지면 목록이 updated 내림차순이므로 since 이전에 업데이트된
+        첫 PR에서 페이지 조회를 중단한다 (증분 조회).
+        
+        Args:
+            since: 이 시각(naive UTC) 이후에 업데이트된 PR만 조회
+            priority: Rate Limit 예산 확인에 사용할 작업 우선순위
+        
+        Returns:
+            dict: {
+                'pulls': PR 딕셔너리 목록,
+                'not_modified': 첫 페이지가 304였는지 여부,
+                'complete': 열린 PR 전체를 확인했는지 여부 (since로 중단되면 False)
+            }
+        """
+        credential_key = self._credential_key(credential_id)
+        cached = self._load_cache(repo_full_name, credential_key, OPEN_PULLS_RESOURCE)
+        
+        url = f'{self.github_base_url}/repos/{repo_full_name}/pulls'
+        params = {
+            'state': 'open',
+            'sort': 'updated',
+            'direction': 'desc',
+            'per_page': self.PER_PAGE
+        }
+        
+        headers = self._headers(pat)
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        # 304 응답은 예산을 쓰지 않지만 응답 여부를 알 수 없으므로 요청 전에 확인
+        rate_limit_tracker.check(pat, priority)
+        response = requests.get(url, headers=headers, params=params, timeout=10)
+        rate_limit_tracker.record(pat, response.headers)
+        
+        if response.status_code == 304 and cached:
+            first_page = cached.get('payload') or []
+            not_modified = True
+        else:
+            self._raise_for_status(response)
+            first_page = [self._to_pr_dict(item) for item in response.json()]
+            not_modified = False
+            self._save_cache(
+                repo_full_name,
+                credential_key,
+                OPEN_PULLS_RESOURCE,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                payload=first_page
+            )
+        
+        pulls = []
+        reached_since = collect_until(first_page, since, pulls)
+        
+        # 100개를 넘는 경우 나머지 페이지는 일반 요청으로 조회 (since 이전 PR을 만나면 중단)
+        page_size = len(first_page)
+        page = 2
+        while not reached_since and page_size >= self.PER_PAGE:
+            rate_limit_tracker.check(pat, priority)
+            page_response = requests.get(
+                url,
+                headers=self._headers(pat),
+                params={**params, 'page': page},
+                timeout=10
+            )
+            rate_limit_tracker.record(pat, page_response.headers)
+            self._raise_for_status(page_response)
+            items = [self._to_pr_dict(item) for item in page_response.json()]
+            reached_since = collect_until(items, since, pulls)
+            page_size = len(items)
+            page += 1
+        
+        return {
+            'pulls': pulls,
+            'not_modified': not_modified,
+            'complete': not reached_since
+        }
+    
+    def _headers(self, pat: Optional[str]) -> Dict:
+        headers = {
+            'Accept': 'application/vnd.github.v3+json'
+        }
+        if pat:
+            headers['Authorization'] = f'token {pat}'
+        return headers
+    
+    def _credential_key(self, credential_id: Optional[int]) -> str:
+        """캐시 키에 사용할 인증 정보 식별자 (인증 정보마다 볼 수 있는 응답이 다르므로 분리)"""
+        return f'credential:{credential_id}' if credential_id else 'anonymous'
+    
+    def _raise_for_status(self, response):
+        """GitHub API 에러를 기존 Polling 에러 처리와 같은 형식의 예외로 변환"""
+        if response.status_code == 200:
+            return
+        try:
+            message = response.json().get('message', '')
+        except ValueError:
+            message = response.text
+        
+        if response.status_code in (403, 429) and (
+            response.headers.get('X-RateLimit-Remaining') == '0' or 'rate limit' in message.lower()
+        ):
+            reset = response.headers.get('X-RateLimit-Reset')
+            raise RateLimitError(
+                f"GitHub API rate limit exceeded: {message}",
+                reset_at=datetime.utcfromtimestamp(int(reset)) if reset else None
+            )
+        raise Exception(f"GitHub API error {response.status_code}: {message}")
+    
+    def _to_pr_dict(self, item: Dict) -> Dict:
+        """GitHub REST 응답을 Polling에서 사용하는 PR 딕셔너리로 변환"""
+        return {
+            'number': item['number'],
+            'title': item.get('title') or '',
+            'branch': item['head']['ref'],
+            'head_sha': item['head'].get('sha'),
+            'url': item.get('html_url'),
+            'created_at': normalize_timestamp(item.get('created_at')),
+            'updated_at': normalize_timestamp(item.get('updated_at'))
+        }
+    
+    def _load_cache(self, repo_full_name: str, credential_key: str, resource: str) -> Optional[Dict]:
+        db = next(get_db())
+        try:
+            entry = db.query(GitHubCache).filter(
+                GitHubCache.repo_full_name == repo_full_name,
+                GitHubCache.credential_key == credential_key,
+                GitHubCache.resource == resource
+            ).first()
+            
+            if not entry:
+                return None
+            return {
+                'etag': entry.etag,
+                'last_modified': entry.last_modified,
+                'payload': entry.payload
+            }
+        finally:
+            db.close()
+    
+    def _save_cache(self, repo_full_name: str, credential_key: str, resource: str, etag: str, last_modified: str, payload: List[Dict]):
+        if not etag and not last_modified:
+            return
+        
+        db = next(get_db())
+        try:
+            entry = db.query(GitHubCache).filter(
+                GitHubCache.repo_full_name == repo_full_name,
+                GitHubCache.credential_key == credential_key,
+                GitHubCache.resource == resource
+            ).first()
+            
+            if entry:
+                entry.etag = etag
+                entry.last_modified = last_modified
+                entry.payload = payload
+                entry.updated_at = datetime.utcnow()
+            else:
+                db.add(GitHubCache(
+                    repo_full_name=repo_full_name,
+                    credential_key=credential_key,
+                    resource=resource,
+                    etag=etag,
+                    last_modified=last_modified,
+                    payload=payload
+                ))
+            db.commit()
+        except Exception as e:
+            # 동시에 같은 키를 저장하는 경우 등 - 캐시 저장 실패는 Polling을 막지 않음
+            db.rollback()
+            print(f"    ⚠️ Failed to save GitHub cache for {repo_full_name}: {str(e)}")
+        finally:
+            db.close()
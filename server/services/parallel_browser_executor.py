@@ -0,0 +1,227 @@
+# server/services/parallel_browser_executor.py
+"""
+여러 시나리오를 동시에 실행하는 브라우저 실행기
+
+시나리오는 서로 독립적이므로(분석 프롬프트 조건), Playwright 브라우저 하나에서
+시나리오마다 독립된 컨텍스트(쿠키/스토리지 분리)를 만들어 최대 concurrency개씩 동시에 실행한다.
+결과는 입력 시나리오 순서대로 반환되며 형식은 BrowserExecutor.execute_scenario와 같다.
+
+AsyncBrowserMCPClient를 넘기면 같은 액션 처리로 Browser MCP에서 시나리오를 하나씩 실행한다. (AsyncPipelineRunner)
+"""
+import asyncio
+import base64
+import os
+import time
+import uuid
+from playwright.async_api import async_playwright
+from .browser_mcp_client import MCPConnectionError, MCPPage
+from .browser_executor import (
+    prepare_scenario, resolve_goto_url, playwright_action_call, playwright_action_result, skipped_action_result
+)
+from .run_registry import PipelineCancelled
+from .stage_timer import elapsed_ms
+
+
+class SharedBrowser:
+    """처음 필요할 때 headless Chromium을 띄우고 이후에는 같은 브라우저를 반환 (여러 실행이 동시에 요청해도 한 번만 실행)"""
+    
+    def __init__(self, playwright):
+        self.playwright = playwright
+        self._browser = None
+        self._lock = asyncio.Lock()
+    
+    async def get(self):
+        async with self._lock:
+            if self._browser is None:
+                self._browser = await self.playwright.chromium.launch(
+                    headless=True,
+                    args=['--no-sandbox', '--disable-setuid-sandbox']
+                )
+            return self._browser
+    
+    async def close(self):
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+
+
+class ParallelBrowserExecutor:
+    """공유 브라우저 + 시나리오별 컨텍스트로 시나리오 병렬 실행"""
+    
+    def __init__(self, video_dir=None, concurrency=2, mcp_client=None):
+        """
+        Args:
+            video_dir: 비디오 저장 디렉토리
+            concurrency: 동시에 실행할 시나리오 수
+            mcp_client: AsyncBrowserMCPClient (있으면 시나리오를 Browser MCP로 한 번에 하나씩 실행하고,
+                MCP 서버에 연결할 수 없으면 Playwright 컨텍스트로 폴백)
+        """
+        from ..config import VIDEOS_DIR
+        self.video_dir = video_dir or os.path.join(VIDEOS_DIR, "parallel")
+        self.concurrency = max(1, concurrency)
+        self.mcp_client = mcp_client
+    
+    def run_scenarios(self, scenarios, pr_url=None, cancel_token=None, on_result=None):
+        """
+        시나리오 목록을 병렬로 실행 (호출한 스레드에서 이벤트 루프를 만들어 끝날 때까지 대기)
+        
+        Args:
+            scenarios: 테스트 시나리오 목록
+            pr_url: PR 배포 URL (있을 경우 시나리오의 URL을 대체)
+            cancel_token: 취소 신호 (취소되면 실행 중인 모든 시나리오가 다음 액션 전에 중단되고 PipelineCancelled 발생)
+            on_result: 시나리오 하나가 끝날 때마다 호출할 함수 (scenario, result) - 바로 반환해야 함
+        
+        Returns:
+            list: 시나리오 순서대로의 실행 결과
+        """
+        return asyncio.run(self._run_with_own_browser(scenarios, pr_url, cancel_token, on_result))
+    
+    async def run_scenarios_async(self, scenarios, pr_url=None, cancel_token=None, on_result=None, browser=None):
+        """
+        run_scenarios의 asyncio 버전 (이미 실행 중인 이벤트 루프에서 호출)
+        
+        Args:
+            browser: 여러 파이프라인이 공유하는 SharedBrowser (없으면 이 실행 동안만 브라우저를 띄움)
+        """
+        if browser is None:
+            return await self._run_with_own_browser(scenarios, pr_url, cancel_token, on_result)
+        
+        os.makedirs(self.video_dir, exist_ok=True)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def run(index, scenario):
+            async with semaphore:
+                result = await self._run_scenario(browser, index, scenario, pr_url, cancel_token)
+            if on_result:
+                on_result(scenario, result)
+            return result
+        
+        tasks = [asyncio.create_task(run(index, scenario)) for index, scenario in enumerate(scenarios)]
+        try:
+            return await asyncio.gather(*tasks)
+        except (PipelineCancelled, asyncio.CancelledError):
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    
+    def close(self):
+        """BrowserExecutor와 같은 인터페이스 (브라우저는 run_scenarios가 끝날 때 종료됨)"""
+        pass
+    
+    async def _run_with_own_browser(self, scenarios, pr_url, cancel_token, on_result):
+        async with async_playwright() as playwright:
+            browser = SharedBrowser(playwright)
+            try:
+                return await self.run_scenarios_async(scenarios, pr_url, cancel_token, on_result, browser=browser)
+            finally:
+                await browser.close()
+    
+    async def _run_scenario(self, browser, index, scenario, pr_url, cancel_token):
+        """시나리오 하나 실행 (MCP 클라이언트가 있으면 MCP, 없거나 연결할 수 없으면 독립된 Playwright 컨텍스트)"""
+        if self.mcp_client:
+            async with self.mcp_client.lock:
+                try:
+                    return await self._run_actions(MCPPage(self.mcp_client), index, scenario, pr_url, cancel_token)
+                except MCPConnectionError as e:
+                    print(f"⚠️ MCP 연결 실패, Playwright로 폴백: {e}")
+                    self.mcp_client = None
+        
+        context = None
+        try:
+            context = await (await browser.get()).new_context(
+                viewport={'width': 1920, 'height': 1080},
+                record_video_dir=self.video_dir,
+                record_video_size={'width': 1920, 'height': 1080}
+            )
+            page = await context.new_page()
+            return await self._run_actions(page, index, scenario, pr_url, cancel_token)
+        finally:
+            if context:
+                await context.close()
+    
+    async def _run_actions(self, page, index, scenario, pr_url, cancel_token):
+        """page에서 시나리오의 액션 실행 (page는 Playwright async page 또는 MCPPage)"""
+        result, filtered_actions = prepare_scenario(scenario)
+        if not filtered_actions:
+            return result
+        
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+        
+        scenario_started = time.monotonic()
+        try:
+            print(f"🌐 [{index + 1}] Running scenario: {result['scenario_name']}")
+            
+            for action in filtered_actions:
+                if cancel_token:
+                    cancel_token.raise_if_cancelled()
+                
+                # PR URL이 있으면 goto 액션의 URL을 대체
+                if action['type'] == 'goto' and pr_url:
+                    action['url'] = resolve_goto_url(action['url'], pr_url)
+                
+                action_started = time.monotonic()
+                action_result = await self._execute_action(page, action, cancel_token)
+                action_result['duration_ms'] = elapsed_ms(action_started)
+                result['actions_executed'].append(action_result)
+                
+                if not action_result['success']:
+                    result['success'] = False
+                    result['error'] = action_result.get('error')
+                    break
+            
+            # 최종 스크린샷
+            if result['success']:
+                screenshot_result = await self._take_screenshot(page, index)
+                if screenshot_result['success']:
+                    result['screenshot'] = screenshot_result.get('screenshot')
+                    result['screenshot_path'] = screenshot_result.get('screenshot_path')
+        
+        except (PipelineCancelled, MCPConnectionError):
+            raise
+        except Exception as e:
+            result['success'] = False
+            result['error'] = str(e)
+        
+        result['duration_ms'] = elapsed_ms(scenario_started)
+        return result
+    
+    async def _execute_action(self, page, action, cancel_token=None):
+        """개별 액션 실행 (BrowserExecutor의 Playwright 실행과 같은 액션 처리를 async API로 실행)"""
+        # 제한 시간이 설정되어 있으면 액션 timeout이 남은 시간을 넘지 않도록
+        call = playwright_action_call(action, (cancel_token.timeout(30) if cancel_token else 30) * 1000)
+        if not call:
+            return skipped_action_result(action)
+        
+        method, args, kwargs = call
+        try:
+            return playwright_action_result(action, await getattr(page, method)(*args, **kwargs))
+        except MCPConnectionError:
+            raise
+        except Exception as e:
+            return {'action': action, 'success': False, 'error': str(e)}
+    
+    async def _take_screenshot(self, page, index):
+        """스크린샷 촬영 (동시에 저장해도 파일 이름이 겹치지 않도록 고유 이름 사용)"""
+        try:
+            screenshot_bytes = await page.screenshot(full_page=True)
+            
+            from ..config import SCREENSHOTS_DIR
+            os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+            screenshot_path = os.path.join(
+                SCREENSHOTS_DIR,
+                f"parallel_screenshot_{int(time.time())}_{index}_{uuid.uuid4().hex[:8]}.png"
+            )
+            with open(screenshot_path, 'wb') as f:
+                f.write(screenshot_bytes)
+            
+            return {
+                'success': True,
+                'screenshot': base64.b64encode(screenshot_bytes).decode(),
+                'screenshot_path': screenshot_path
+            }
+        except MCPConnectionError:
+            raise
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
@@ -4,10 +4,13 @@ Personal Access Token 인증 서비스
 """
 import logging
 import requests
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 from ..models import UserCredential, get_db
-from ..utils.crypto import encrypt_pat, decrypt_pat
+from ..utils.crypto import encrypt_pat, decrypt_pat, rotate_encrypted_pat
+from github import Github
+from .rate_limit_tracker import rate_limit_tracker
+from .credential_cache import credential_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,7 @@ class PATAuthService:
                 headers=headers,
                 timeout=10
             )
+            rate_limit_tracker.record(pat, response.headers)
             
             if response.status_code == 200:
                 user_info = response.json()
@@ -69,6 +73,7 @@ class PATAuthService:
                 headers=headers,
                 timeout=10
             )
+            rate_limit_tracker.record(pat, response.headers)
             
             if response.status_code == 200:
                 repo_info = response.json()
@@ -105,6 +110,7 @@ class PATAuthService:
                 headers=headers,
                 timeout=10
             )
+            rate_limit_tracker.record(None, response.headers)
             
             if response.status_code == 200:
                 repo_info = response.json()
@@ -158,9 +164,12 @@ class PATAuthService:
                     last_verified_at=datetime.utcnow()
                 )
                 db.add(credential)
+                db.flush()
                 credential_id = credential.id
             
             db.commit()
+            # 이전 PAT로 만든 클라이언트/복호화 결과를 바로 버림
+            credential_cache.invalidate(credential_id)
             return credential_id
         except Exception as e:
             db.rollback()
@@ -168,6 +177,32 @@ class PATAuthService:
         finally:
             db.close()
     
+    def reencrypt_all_credentials(self) -> int:
+        """저장된 모든 PAT를 현재 암호화 키(키 목록의 첫 번째)로 다시 암호화 (한 트랜잭션)
+        
+        이전 키로 복호화할 수 없는 PAT가 하나라도 있으면 전체를 롤백한다.
+        
+        Returns:
+            int: 다시 암호화한 인증 정보 수
+        """
+        db = next(get_db())
+        try:
+            credentials = db.query(UserCredential).all()
+            for credential in credentials:
+                try:
+                    credential.encrypted_pat = rotate_encrypted_pat(credential.encrypted_pat)
+                except ValueError as e:
+                    raise ValueError(f"Failed to re-encrypt PAT for credential {credential.id}: {e}") from e
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        
+        credential_cache.clear()
+        return len(credentials)
+    
     def get_decrypted_pat(self, user_id: str) -> Optional[str]:
         """사용자의 암호화된 PAT를 복호화하여 반환"""
         db = next(get_db())
@@ -186,6 +221,42 @@ class PATAuthService:
         finally:
             db.close()
     
+    def get_pat_by_credential_id(self, credential_id: Optional[int]) -> Optional[str]:
+        """인증 정보 ID로 복호화된 PAT 조회 (없으면 None - Public 저장소 접근)
+        
+        복호화 결과는 credential_cache에 TTL 동안 유지되므로 대부분 DB 조회와 복호화 없이 반환된다.
+        """
+        if not credential_id:
+            return None
+        return credential_cache.get_pat(credential_id, self._load_pat)
+    
+    def get_github_client(self, credential_id: Optional[int]) -> Tuple[Optional[str], Github]:
+        """인증 정보 ID로 PAT와 재사용 가능한 GitHub 클라이언트 조회 (PAT가 없으면 익명 클라이언트)
+        
+        Returns:
+            tuple: (pat, Github)
+        """
+        pat = self.get_pat_by_credential_id(credential_id)
+        return pat, credential_cache.get_client(credential_id, pat)
+    
+    def _load_pat(self, credential_id: int) -> Optional[str]:
+        """인증 정보 조회와 복호화를 한 세션에서 수행 (캐시 미스일 때만 호출)"""
+        db = next(get_db())
+        try:
+            credential = db.query(UserCredential).filter(
+                UserCredential.id == credential_id
+            ).first()
+            if not credential:
+                return None
+            
+            try:
+                return decrypt_pat(credential.encrypted_pat)
+            except ValueError as e:
+                logger.warning(f"Failed to decrypt PAT for credential {credential_id}: {e}")
+                return None
+        finally:
+            db.close()
+    
     def get_credential_by_id(self, credential_id: int) -> Optional[UserCredential]:
         """인증 정보 ID로 조회"""
         db = next(get_db())
@@ -0,0 +1,192 @@
+# server/services/pipeline_checkpoint_service.py
+"""
+파이프라인 단계 결과 체크포인트
+
+시나리오 생성 후 실행 전에 프로세스가 죽으면 재시도가 diff 조회와 Gemini 시나리오 생성부터 다시 시작해
+LLM 시간과 비용이 든다. 단계가 끝날 때마다 결과를 (subscription_id, pr_number, head_sha, stage)로 저장하고,
+같은 커밋의 재시도/재개는 저장된 단계를 건너뛴다. 재실행은 새 테스트 레코드를 만들므로 test_id가 아니라
+PR과 커밋으로 조회해, 실패/시간 초과 후 같은 커밋을 다시 테스트해도 끝난 단계를 이어받는다.
+- diff: PR 변경사항
+- scenarios: 생성된 시나리오 목록
+- execution:<index>: 시나리오별 브라우저 실행 결과 (증분 실행에서 이어받은 결과는 이전 테스트의 ID와 index 참조)
+- validation:<index>: 시나리오별 Vision 검증 결과
+
+성공한 커밋과 대체된 커밋의 체크포인트는 바로 삭제하고, 실패/시간 초과한 커밋의 체크포인트는
+PIPELINE_CHECKPOINT_TTL_HOURS가 지나면 삭제한다 (스크린샷을 포함하므로 계속 남겨두지 않음).
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy.exc import IntegrityError
+from ..config import PIPELINE_CHECKPOINT_TTL_HOURS
+from ..models import PipelineCheckpoint, Test, get_db
+
+STAGE_DIFF = 'diff'
+STAGE_SCENARIOS = 'scenarios'
+STAGE_EXECUTION_PREFIX = 'execution:'
+STAGE_VALIDATION_PREFIX = 'validation:'
+
+
+def needs_validation(result: Dict) -> bool:
+    """실행에 성공해 스크린샷이 있지만 아직 Vision 검증 결과가 없는 시나리오인지"""
+    return result['success'] and bool(result.get('screenshot')) and 'validation' not in result
+
+
+class PipelineCheckpointService:
+    """PR 커밋 하나의 단계 결과 저장/조회"""
+    
+    def __init__(self, test_id: int, subscription_id: int, pr_number: int, head_sha: str):
+        self.test_id = test_id
+        self.subscription_id = subscription_id
+        self.pr_number = pr_number
+        self.head_sha = head_sha
+    
+    def _filter(self, query):
+        """이 PR 커밋의 체크포인트"""
+        return query.filter(
+            PipelineCheckpoint.subscription_id == self.subscription_id,
+            PipelineCheckpoint.pr_number == self.pr_number,
+            PipelineCheckpoint.head_sha == self.head_sha
+        )
+    
+    def load(self, stage: str) -> Optional[Any]:
+        """저장된 단계 결과 (없으면 None)"""
+        db = next(get_db())
+        try:
+            checkpoint = self._filter(db.query(PipelineCheckpoint)).filter(
+                PipelineCheckpoint.stage == stage
+            ).first()
+            return checkpoint.data if checkpoint else None
+        finally:
+            db.close()
+    
+    def save(self, stage: str, data: Any):
+        """단계 결과 저장 (실패해도 파이프라인은 계속 진행 - 재시도 시 해당 단계를 다시 실행할 뿐)"""
+        db = next(get_db())
+        try:
+            updated = self._filter(db.query(PipelineCheckpoint)).filter(
+                PipelineCheckpoint.stage == stage
+            ).update({'data': data, 'test_id': self.test_id}, synchronize_session=False)
+            if not updated:
+                db.add(PipelineCheckpoint(
+                    subscription_id=self.subscription_id,
+                    pr_number=self.pr_number,
+                    head_sha=self.head_sha,
+                    stage=stage,
+                    data=data,
+                    test_id=self.test_id
+                ))
+            db.commit()
+        except IntegrityError:
+            # 같은 단계를 동시에 처음 저장한 경우 - 먼저 저장된 결과 유지
+            db.rollback()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to save checkpoint '{stage}' for test {self.test_id}: {str(e)}")
+        finally:
+            db.close()
+    
+    def save_execution(self, index: int, result: Dict):
+        self.save(f'{STAGE_EXECUTION_PREFIX}{index}', result)
+    
+    def save_validation(self, index: int, validation: Dict):
+        self.save(f'{STAGE_VALIDATION_PREFIX}{index}', validation)
+    
+    def save_carried(self, index: int, reference: Dict):
+        """증분 실행에서 이어받은 결과를 복사하지 않고 참조로 저장 (불러올 때 이전 테스트의 test_results에서 가져옴)
+        
+        Args:
+            reference: {'test_id': 이전 테스트 ID, 'index': 이전 결과의 index, 'carried_forward_from': 실제로 실행한 커밋}
+        """
+        self.save_execution(index, {'carried_from': reference})
+    
+    def load_scenario_results(self) -> Dict[int, Dict]:
+        """저장된 시나리오별 실행 결과 (검증이 끝난 시나리오는 validation 포함)
+        
+        Returns:
+            dict: {시나리오 index: 실행 결과}
+        """
+        db = next(get_db())
+        try:
+            checkpoints = self._filter(db.query(PipelineCheckpoint.stage, PipelineCheckpoint.data)).filter(
+                PipelineCheckpoint.stage.like('%:%')
+            ).all()
+        finally:
+            db.close()
+        
+        results = {}
+        validations = {}
+        for stage, data in checkpoints:
+            if stage.startswith(STAGE_EXECUTION_PREFIX):
+                results[int(stage[len(STAGE_EXECUTION_PREFIX):])] = data
+            elif stage.startswith(STAGE_VALIDATION_PREFIX):
+                validations[int(stage[len(STAGE_VALIDATION_PREFIX):])] = data
+        
+        self._resolve_carried(results)
+        for index, validation in validations.items():
+            if index in results:
+                results[index]['validation'] = validation
+        return results
+    
+    @staticmethod
+    def _resolve_carried(results: Dict[int, Dict]):
+        """참조로 저장된 이어받은 결과를 이전 테스트의 결과로 바꿈 (이전 테스트가 삭제되었으면 다시 실행하도록 제외)"""
+        references = {index: result['carried_from'] for index, result in results.items() if 'carried_from' in result}
+        if not references:
+            return
+        
+        db = next(get_db())
+        try:
+            previous = dict(db.query(Test.id, Test.test_results).filter(
+                Test.id.in_({reference['test_id'] for reference in references.values()})
+            ).all())
+        finally:
+            db.close()
+        
+        for index, reference in references.items():
+            previous_results = previous.get(reference['test_id']) or []
+            if reference['index'] < len(previous_results):
+                results[index] = dict(previous_results[reference['index']], carried_forward_from=reference['carried_forward_from'])
+            else:
+                del results[index]
+    
+    def load_finished_results(self) -> List[Dict]:
+        """끝난 시나리오(검증 대상이면 검증까지)의 결과를 시나리오 순서대로 (실행 중 부분 결과, 중단된 테스트의 결과)"""
+        results = self.load_scenario_results()
+        return [results[index] for index in sorted(results) if not needs_validation(results[index])]
+    
+    def discard_other_commits(self):
+        """이 PR의 다른 커밋 체크포인트 삭제 (새 커밋이 push되면 이전 커밋은 다시 테스트하지 않음)"""
+        db = next(get_db())
+        try:
+            db.query(PipelineCheckpoint).filter(
+                PipelineCheckpoint.subscription_id == self.subscription_id,
+                PipelineCheckpoint.pr_number == self.pr_number,
+                PipelineCheckpoint.head_sha != self.head_sha
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+    
+    def clear(self):
+        """이 PR 커밋의 체크포인트 삭제 (성공했거나 새 커밋으로 대체되어 다시 실행되지 않는 경우)"""
+        db = next(get_db())
+        try:
+            self._filter(db.query(PipelineCheckpoint)).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+    
+    @staticmethod
+    def expire():
+        """PIPELINE_CHECKPOINT_TTL_HOURS가 지난 체크포인트 삭제 (실패/시간 초과 후 다시 테스트되지 않은 커밋)"""
+        cutoff = datetime.utcnow() - timedelta(hours=PIPELINE_CHECKPOINT_TTL_HOURS)
+        db = next(get_db())
+        try:
+            expired = db.query(PipelineCheckpoint).filter(
+                PipelineCheckpoint.created_at < cutoff
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+        if expired:
+            print(f"🧹 Expired {expired} pipeline checkpoint(s)")
@@ -0,0 +1,336 @@
+# server/services/pipeline_job_queue.py
+"""
+DB 기반 파이프라인 작업 대기열
+
+작업을 pipeline_jobs 테이블에 저장하고 워커는 Lease(만료 시각)를 잡고 실행한다.
+실행 중에는 Heartbeat로 Lease를 연장하고, 프로세스가 죽어 Lease가 만료되면
+다른 워커(다른 프로세스 포함)가 작업을 다시 가져간다.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import and_, func, or_
+from ..config import PIPELINE_JOB_LEASE_SECONDS, PIPELINE_JOB_MAX_ATTEMPTS
+from ..models import PipelineJob, Test, WebhookEvent, get_db
+
+JOB_TYPE_PR_TEST = 'pr_test'
+JOB_TYPE_WEBHOOK_EVENT = 'webhook_event'
+
+ACTIVE_JOB_STATUSES = ['queued', 'running']
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차서 작업을 받을 수 없는 경우 (Backpressure)"""
+    pass
+
+
+class PipelineJobQueue:
+    """pipeline_jobs 테이블 기반 작업 대기열"""
+    
+    def __init__(self, lease_seconds: int = None, max_attempts: int = None):
+        self.lease_seconds = lease_seconds or PIPELINE_JOB_LEASE_SECONDS
+        self.max_attempts = max_attempts or PIPELINE_JOB_MAX_ATTEMPTS
+    
+    def enqueue(self, test_id: Optional[int], subscription_id: Optional[int], pr_number: int, priority: int, job_type: str = JOB_TYPE_PR_TEST, max_queued: Optional[int] = None, webhook_event_id: Optional[int] = None) -> Optional[int]:
+        """작업 추가
+        
+        Args:
+            max_queued: 대기(queued) 작업이 이 수 이상이면 추가하지 않음 (None이면 제한 없음)
+            webhook_event_id: Webhook 이벤트 처리 작업이면 이벤트 ID (test_id 없음)
+        
+        Returns:
+            int: 추가된 작업 ID (같은 테스트/이벤트의 작업이 이미 대기/실행 중이면 None)
+        
+        Raises:
+            QueueFullError: 대기 작업이 max_queued 이상인 경우
+        """
+        db = next(get_db())
+        try:
+            if webhook_event_id is not None:
+                same_target = PipelineJob.webhook_event_id == webhook_event_id
+            else:
+                same_target = PipelineJob.test_id == test_id
+            existing = db.query(PipelineJob).filter(
+                same_target,
+                PipelineJob.status.in_(ACTIVE_JOB_STATUSES)
+            ).first()
+            if existing:
+                return None
+            
+            if max_queued is not None:
+                queued_count = db.query(func.count(PipelineJob.id)).filter(
+                    PipelineJob.status == 'queued'
+                ).scalar()
+                if queued_count >= max_queued:
+                    raise QueueFullError(f"Pipeline queue is full ({queued_count} jobs waiting)")
+            
+            job = PipelineJob(
+                job_type=job_type,
+                test_id=test_id,
+                subscription_id=subscription_id,
+                webhook_event_id=webhook_event_id,
+                pr_number=pr_number,
+                priority=priority,
+                status='queued'
+            )
+            db.add(job)
+            db.commit()
+            return job.id
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
+    def claim(self, worker_id: str, job_types: List[str]) -> Optional[Dict]:
+        """우선순위가 가장 높은 작업의 Lease를 잡음 (Lease가 만료된 실행 중 작업 포함)
+        
+        여러 프로세스가 동시에 같은 작업을 잡지 않도록, 조회한 상태 그대로일 때만
+        갱신되는 조건부 UPDATE로 Lease를 잡는다.
+        
+        Returns:
+            dict: 잡은 작업 정보 (실행할 작업이 없으면 None)
+        """
+        db = next(get_db())
+        try:
+            now = datetime.utcnow()
+            claimable = or_(
+                PipelineJob.status == 'queued',
+                and_(PipelineJob.status == 'running', PipelineJob.lease_expires_at < now)
+            )
+            candidates = db.query(PipelineJob).filter(
+                PipelineJob.job_type.in_(job_types),
+                claimable
+            ).order_by(PipelineJob.priority, PipelineJob.id).limit(10).all()
+            
+            # commit 후에는 객체가 다시 로드되므로 조회 시점의 값을 먼저 복사
+            candidates = [{
+                'id': candidate.id,
+                'job_type': candidate.job_type,
+                'test_id': candidate.test_id,
+                'subscription_id': candidate.subscription_id,
+                'webhook_event_id': candidate.webhook_event_id,
+                'pr_number': candidate.pr_number,
+                'priority': candidate.priority,
+                'status': candidate.status,
+                'attempts': candidate.attempts
+            } for candidate in candidates]
+            
+            for candidate in candidates:
+                if candidate['attempts'] >= self.max_attempts:
+                    self._give_up(db, candidate, now)
+                    continue
+                
+                claimed = db.query(PipelineJob).filter(
+                    PipelineJob.id == candidate['id'],
+                    PipelineJob.status == candidate['status'],
+                    PipelineJob.attempts == candidate['attempts'],
+                    claimable
+                ).update({
+                    'status': 'running',
+                    'lease_owner': worker_id,
+                    'lease_expires_at': now + timedelta(seconds=self.lease_seconds),
+                    'attempts': candidate['attempts'] + 1,
+                    'started_at': now
+                }, synchronize_session=False)
+                db.commit()
+                
+                if claimed:
+                    attempt = candidate['attempts'] + 1
+                    if candidate['status'] == 'running':
+                        print(f"♻️ Reclaimed job {candidate['id']} for PR #{candidate['pr_number']} (lease expired, attempt {attempt})")
+                    return {
+                        'id': candidate['id'],
+                        'job_type': candidate['job_type'],
+                        'test_id': candidate['test_id'],
+                        'subscription_id': candidate['subscription_id'],
+                        'webhook_event_id': candidate['webhook_event_id'],
+                        'pr_number': candidate['pr_number'],
+                        'priority': candidate['priority'],
+                        'attempt': attempt
+                    }
+            return None
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """Lease 연장 (다른 워커가 이미 가져간 경우 False)"""
+        db = next(get_db())
+        try:
+            updated = db.query(PipelineJob).filter(
+                PipelineJob.id == job_id,
+                PipelineJob.status == 'running',
+                PipelineJob.lease_owner == worker_id
+            ).update({
+                'lease_expires_at': datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+            }, synchronize_session=False)
+            db.commit()
+            return bool(updated)
+        except Exception:
+            db.rollback()
+            return False
+        finally:
+            db.close()
+    
+    def complete(self, job_id: int, worker_id: str, success: bool, error: Optional[str] = None):
+        """작업 종료 기록 (실행 중 취소된 작업은 'cancelled' 상태 유지)"""
+        db = next(get_db())
+        try:
+            db.query(PipelineJob).filter(
+                PipelineJob.id == job_id,
+                PipelineJob.status == 'running',
+                PipelineJob.lease_owner == worker_id
+            ).update({
+                'status': 'completed' if success else 'failed',
+                'lease_expires_at': None,
+                'last_error': error,
+                'finished_at': datetime.utcnow()
+            }, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to record completion of job {job_id}: {str(e)}")
+        finally:
+            db.close()
+    
+    def cancel_superseded(self, repo_full_name: str, pr_number: int, head_sha: str, subscription_id: Optional[int] = None) -> List[int]:
+        """같은 PR의 다른 커밋에 대한 대기/실행 중인 테스트와 작업을 취소
+        
+        실행 중인 작업은 'cancelled'로 바뀌어 Heartbeat가 실패하므로, 다른 프로세스의 워커도 취소를 감지한다.
+        
+        Returns:
+            list: 'superseded'로 표시된 테스트 ID
+        """
+        db = next(get_db())
+        try:
+            query = db.query(Test).filter(
+                Test.repo_full_name == repo_full_name,
+                Test.pr_number == pr_number,
+                Test.status.in_(['pending', 'running']),
+                or_(Test.head_sha.is_(None), Test.head_sha != head_sha)
+            )
+            if subscription_id is not None:
+                query = query.filter(Test.subscription_id == subscription_id)
+            
+            now = datetime.utcnow()
+            superseded = query.all()
+            test_ids = [test.id for test in superseded]
+            for test in superseded:
+                test.status = 'superseded'
+                test.completed_at = now
+            
+            if test_ids:
+                db.query(PipelineJob).filter(
+                    PipelineJob.test_id.in_(test_ids),
+                    PipelineJob.status.in_(ACTIVE_JOB_STATUSES)
+                ).update({
+                    'status': 'cancelled',
+                    'lease_expires_at': None,
+                    'last_error': f'Superseded by commit {head_sha[:7]}',
+                    'finished_at': now
+                }, synchronize_session=False)
+            db.commit()
+            return test_ids
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to cancel superseded runs for PR #{pr_number}: {str(e)}")
+            return []
+        finally:
+            db.close()
+    
+    def get_active_test_ids(self, test_ids: List[int]) -> set:
+        """대기/실행 중인 작업이 있는 테스트 ID"""
+        if not test_ids:
+            return set()
+        
+        db = next(get_db())
+        try:
+            rows = db.query(PipelineJob.test_id).filter(
+                PipelineJob.test_id.in_(test_ids),
+                PipelineJob.status.in_(ACTIVE_JOB_STATUSES)
+            ).all()
+            return {row.test_id for row in rows}
+        finally:
+            db.close()
+    
+    def recover_orphaned_tests(self, priority: int) -> int:
+        """작업 없이 pending/running 상태로 남은 테스트(작업 대기열 도입 전 또는 기록 누락)를 다시 대기열에 추가
+        
+        Returns:
+            int: 다시 추가한 작업 수
+        """
+        db = next(get_db())
+        try:
+            # test_id가 없는 Webhook 이벤트 작업이 섞이면 NOT IN이 항상 거짓이 되므로 제외
+            active_jobs = db.query(PipelineJob.test_id).filter(
+                PipelineJob.status.in_(ACTIVE_JOB_STATUSES),
+                PipelineJob.test_id.isnot(None)
+            )
+            orphaned = db.query(Test).filter(
+                Test.status.in_(['pending', 'running']),
+                ~Test.id.in_(active_jobs)
+            ).all()
+            
+            for test in orphaned:
+                db.add(PipelineJob(
+                    job_type=JOB_TYPE_PR_TEST,
+                    test_id=test.id,
+                    subscription_id=test.subscription_id,
+                    pr_number=test.pr_number,
+                    priority=priority,
+                    status='queued'
+                ))
+            db.commit()
+            return len(orphaned)
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to recover orphaned tests: {str(e)}")
+            return 0
+        finally:
+            db.close()
+    
+    def stats(self) -> Dict:
+        """상태별 작업 수 (API 노출용)"""
+        db = next(get_db())
+        try:
+            rows = db.query(PipelineJob.status, PipelineJob.priority, func.count(PipelineJob.id)).filter(
+                PipelineJob.status.in_(ACTIVE_JOB_STATUSES)
+            ).group_by(PipelineJob.status, PipelineJob.priority).all()
+            
+            stats = {'queued': 0, 'running': 0, 'queued_by_priority': {}}
+            for status, priority, count in rows:
+                stats[status] += count
+                if status == 'queued':
+                    stats['queued_by_priority'][priority] = count
+            return stats
+        finally:
+            db.close()
+    
+    def _give_up(self, db, job: Dict, now: datetime):
+        """최대 시도 횟수를 넘긴 작업과 해당 테스트/Webhook 이벤트를 실패로 기록"""
+        updated = db.query(PipelineJob).filter(
+            PipelineJob.id == job['id'],
+            PipelineJob.status == job['status'],
+            PipelineJob.attempts == job['attempts']
+        ).update({
+            'status': 'failed',
+            'lease_expires_at': None,
+            'last_error': f"Gave up after {job['attempts']} attempt(s)",
+            'finished_at': now
+        }, synchronize_session=False)
+        
+        if updated:
+            # 테스트는 행 단위 ORM 변경으로 기록 (TestSummary가 flush 이벤트로 함께 갱신됨)
+            test = db.query(Test).filter(Test.id == job['test_id']).first() if job['test_id'] else None
+            if test and test.status in ['pending', 'running']:
+                test.status = 'failed'
+                test.completed_at = now
+            event = db.query(WebhookEvent).filter(WebhookEvent.id == job['webhook_event_id']).first() if job['webhook_event_id'] else None
+            if event and event.status in ['queued', 'processing']:
+                event.status = 'failed'
+                event.error = f"Gave up after {job['attempts']} attempt(s)"
+                event.processed_at = now
+            print(f"❌ Job {job['id']} for PR #{job['pr_number']} failed after {job['attempts']} attempt(s)")
+        db.commit()
@@ -0,0 +1,337 @@
+# server/services/pipeline_worker_pool.py
+"""
+테스트 파이프라인 워커 풀
+
+PR마다 스레드를 만들면 PR이 몰릴 때 브라우저/Vertex/Slack 클라이언트가 PR 수만큼 생성되므로,
+고정된 수의 워커가 작업을 꺼내 실행한다. (수동 재실행 > 새 PR > 업데이트된 PR 순)
+
+- PR 테스트 작업은 pipeline_jobs 테이블(PipelineJobQueue)에 저장되고 워커가 Lease를 잡고 실행하므로,
+  프로세스가 재시작되어도 작업이 유실되지 않고 별도 워커 프로세스(main_worker.py)에서도 실행할 수 있다.
+- 결과를 바로 응답해야 하는 수동 재실행은 메모리 대기열로 받아 DB 작업보다 먼저 실행한다.
+- 코루틴 함수로 등록된 작업(PIPELINE_ENGINE=asyncio의 PR 테스트)은 워커가 가져오기만 하고 AsyncPipelineRunner의
+  이벤트 루프에 넘기므로, 워커 수와 관계없이 최대 ASYNC_PIPELINE_CONCURRENCY개까지 동시에 실행된다.
+"""
+import asyncio
+import os
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+from ..config import (
+    PIPELINE_MAX_WORKERS,
+    PIPELINE_MAX_QUEUE_SIZE,
+    PIPELINE_WORKER_POLL_SECONDS,
+    PIPELINE_IN_PROCESS_WORKERS,
+    ASYNC_PIPELINE_CONCURRENCY
+)
+from .async_pipeline_runner import async_pipeline_runner
+from .pipeline_job_queue import PipelineJobQueue, QueueFullError, JOB_TYPE_PR_TEST, JOB_TYPE_WEBHOOK_EVENT
+from .run_registry import CancellationToken
+
+JOB_PRIORITY_MANUAL = 0  # 수동 재실행 / 시나리오 재생성
+JOB_PRIORITY_NEW = 1  # 새로 열린 PR
+JOB_PRIORITY_UPDATE = 2  # 업데이트된 PR
+
+PRIORITY_NAMES = {
+    JOB_PRIORITY_MANUAL: 'manual',
+    JOB_PRIORITY_NEW: 'new',
+    JOB_PRIORITY_UPDATE: 'update'
+}
+
+
+class PipelineWorkerPool:
+    """고정 크기 워커 + 우선순위 대기열 (수동 작업은 메모리, PR 테스트는 DB)"""
+    
+    def __init__(self, num_workers: int = None, max_queue_size: int = None, job_queue: PipelineJobQueue = None, claim_jobs: bool = None, async_concurrency: int = None):
+        """
+        Args:
+            num_workers: 동시에 실행할 파이프라인 수 (기본값: PIPELINE_MAX_WORKERS)
+            max_queue_size: 대기 중인 PR 테스트 작업 최대 수 (기본값: PIPELINE_MAX_QUEUE_SIZE, 수동 작업은 제한 없음)
+            claim_jobs: DB 작업을 이 프로세스에서 실행할지 여부 (기본값: PIPELINE_IN_PROCESS_WORKERS)
+            async_concurrency: 이벤트 루프에서 동시에 실행할 코루틴 작업 수 (기본값: ASYNC_PIPELINE_CONCURRENCY)
+        """
+        self.num_workers = max(1, num_workers or PIPELINE_MAX_WORKERS)
+        self.max_queue_size = max_queue_size or PIPELINE_MAX_QUEUE_SIZE
+        self.job_queue = job_queue or PipelineJobQueue()
+        self.claim_jobs = PIPELINE_IN_PROCESS_WORKERS if claim_jobs is None else claim_jobs
+        self.async_concurrency = max(1, async_concurrency or ASYNC_PIPELINE_CONCURRENCY)
+        self.worker_id_prefix = f'{socket.gethostname()}:{os.getpid()}'
+        self._manual_queue = queue.Queue()
+        self._wakeup = threading.Condition()
+        self._lock = threading.Lock()
+        self._workers = []
+        self._job_handlers = {}
+        self._busy = 0
+        self._async_running = 0
+        self._busy_seconds = 0.0
+        self._started_at = None
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+    
+    def register_job_handler(self, job_type: str, handler: Callable[[Dict], None]):
+        """DB 작업 종류별 실행 함수 등록 (등록된 종류의 작업만 이 프로세스에서 가져감)
+        
+        handler가 코루틴 함수면 작업을 AsyncPipelineRunner의 이벤트 루프에서 실행한다.
+        """
+        with self._lock:
+            self._job_handlers[job_type] = handler
+        self._notify()
+    
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """수동 작업을 메모리 대기열에 추가 (DB 작업보다 먼저 실행되며 대기열 제한 없음)
+        
+        Returns:
+            Future: 작업 결과
+        """
+        self.start()
+        
+        future = Future()
+        self._manual_queue.put((fn, args, kwargs, future))
+        self._notify()
+        return future
+    
+    def enqueue_test(self, test_id: int, subscription_id: int, pr_number: int, priority: int = JOB_PRIORITY_NEW) -> Optional[int]:
+        """PR 테스트 작업을 DB 대기열에 추가
+        
+        Returns:
+            int: 작업 ID (같은 테스트의 작업이 이미 대기/실행 중이면 None)
+        
+        Raises:
+            QueueFullError: 대기 작업이 max_queue_size 이상인 경우
+        """
+        self.start()
+        
+        try:
+            job_id = self.job_queue.enqueue(
+                test_id,
+                subscription_id,
+                pr_number,
+                priority,
+                job_type=JOB_TYPE_PR_TEST,
+                max_queued=self.max_queue_size
+            )
+        except QueueFullError:
+            with self._lock:
+                self._rejected += 1
+            raise
+        
+        self._notify()
+        return job_id
+    
+    def enqueue_webhook_event(self, webhook_event_id: int, pr_number: int, priority: int = JOB_PRIORITY_NEW) -> Optional[int]:
+        """Webhook 이벤트 처리 작업을 DB 대기열에 추가
+        
+        이벤트는 이미 저장되어 있으므로 대기열 제한 없이 받는다. (실제 테스트 작업은 처리 시 대기열 제한을 받음)
+        
+        Returns:
+            int: 작업 ID (같은 이벤트의 작업이 이미 대기/실행 중이면 None)
+        """
+        self.start()
+        
+        job_id = self.job_queue.enqueue(
+            None,
+            None,
+            pr_number,
+            priority,
+            job_type=JOB_TYPE_WEBHOOK_EVENT,
+            webhook_event_id=webhook_event_id
+        )
+        self._notify()
+        return job_id
+    
+    def start(self):
+        """워커 스레드 시작 (DB 작업을 실행하는 경우 작업 없이 남은 테스트를 먼저 복구)"""
+        with self._lock:
+            if self._workers:
+                return
+            self._started_at = time.monotonic()
+            self._workers = [
+                threading.Thread(
+                    target=self._worker_loop,
+                    args=(f'{self.worker_id_prefix}:{index}',),
+                    name=f'pipeline-worker-{index}',
+                    daemon=True
+                )
+                for index in range(self.num_workers)
+            ]
+        
+        if self.claim_jobs:
+            recovered = self.job_queue.recover_orphaned_tests(JOB_PRIORITY_NEW)
+            if recovered:
+                print(f"♻️ Re-queued {recovered} test(s) left pending/running without a job")
+        
+        for worker in self._workers:
+            worker.start()
+        print(f"✅ Pipeline worker pool started ({self.num_workers} worker(s), {'claiming' if self.claim_jobs else 'not claiming'} queued jobs)")
+    
+    def stats(self) -> Dict:
+        """대기열 길이와 워커 사용률 (API 노출용)"""
+        job_stats = self.job_queue.stats()
+        with self._lock:
+            busy = self._busy
+            uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+            queued_by_priority = {name: 0 for name in PRIORITY_NAMES.values()}
+            for priority, count in job_stats['queued_by_priority'].items():
+                queued_by_priority[PRIORITY_NAMES.get(priority, str(priority))] = count
+            queued_by_priority['manual'] += self._manual_queue.qsize()
+            return {
+                'workers': len(self._workers),
+                'busy_workers': busy,
+                'utilization': round(busy / self.num_workers, 2),
+                'async_running': self._async_running,  # 이벤트 루프에서 실행 중인 작업 (PIPELINE_ENGINE=asyncio)
+                'async_capacity': self.async_concurrency,
+                'average_utilization': round(self._busy_seconds / (uptime * self.num_workers), 2) if uptime else 0.0,
+                'queue_depth': job_stats['queued'] + self._manual_queue.qsize(),
+                'max_queue_size': self.max_queue_size,
+                'queued_by_priority': queued_by_priority,
+                'running_jobs': job_stats['running'],  # 다른 워커 프로세스에서 실행 중인 작업 포함
+                'completed': self._completed,
+                'failed': self._failed,
+                'rejected': self._rejected
+            }
+    
+    def _notify(self):
+        with self._wakeup:
+            self._wakeup.notify_all()
+    
+    def _worker_loop(self, worker_id: str):
+        while True:
+            try:
+                if self._run_manual_job():
+                    continue
+                if self._run_db_job(worker_id):
+                    continue
+            except Exception as e:
+                print(f"❌ Pipeline worker {worker_id} error: {str(e)}")
+            
+            # 실행할 작업이 없으면 새 작업 알림 또는 다음 확인 주기까지 대기
+            # (다른 프로세스가 추가한 작업은 알림이 없으므로 주기적으로 확인)
+            with self._wakeup:
+                self._wakeup.wait(timeout=PIPELINE_WORKER_POLL_SECONDS)
+    
+    def _run_manual_job(self) -> bool:
+        try:
+            fn, args, kwargs, future = self._manual_queue.get_nowait()
+        except queue.Empty:
+            return False
+        
+        if future.set_running_or_notify_cancel():
+            self._track(lambda: future.set_result(fn(*args, **kwargs)), on_error=future.set_exception)
+        return True
+    
+    def _run_db_job(self, worker_id: str) -> bool:
+        if not self.claim_jobs:
+            return False
+        with self._lock:
+            handlers = dict(self._job_handlers)
+            # 이벤트 루프 작업은 async_concurrency개까지만 가져감 (가져오기 전에 자리를 잡아 다른 워커와 겹치지 않게)
+            async_slot = self._async_running < self.async_concurrency and any(
+                asyncio.iscoroutinefunction(handler) for handler in handlers.values()
+            )
+            if async_slot:
+                self._async_running += 1
+        if not async_slot:
+            handlers = {
+                job_type: handler for job_type, handler in handlers.items()
+                if not asyncio.iscoroutinefunction(handler)
+            }
+        if not handlers:
+            return False
+        
+        job = self.job_queue.claim(worker_id, list(handlers))
+        handler = handlers[job['job_type']] if job else None
+        if async_slot and not asyncio.iscoroutinefunction(handler):
+            with self._lock:
+                self._async_running -= 1
+        if not job:
+            return False
+        
+        if asyncio.iscoroutinefunction(handler):
+            # 워커는 바로 다음 작업을 가져가고, 작업과 Heartbeat는 이벤트 루프에서 실행
+            job['cancel_token'] = CancellationToken()
+            async_pipeline_runner.submit(self._run_async_job(job, worker_id, handler))
+            return True
+        
+        # 실행 중에는 Lease의 1/3 주기로 Heartbeat를 보내 다른 워커가 가져가지 않게 함
+        # Heartbeat가 실패하면(다른 워커가 가져갔거나 새 커밋으로 취소됨) 실행 중인 파이프라인도 중단
+        job['cancel_token'] = CancellationToken()
+        stop_heartbeat = threading.Event()
+        
+        def heartbeat():
+            while not stop_heartbeat.wait(self.job_queue.lease_seconds / 3):
+                if not self.job_queue.heartbeat(job['id'], worker_id):
+                    print(f"⚠️ Lost lease on job {job['id']} for PR #{job['pr_number']}, cancelling")
+                    job['cancel_token'].cancel('Job was cancelled or claimed by another worker')
+                    return
+        
+        threading.Thread(target=heartbeat, name=f"heartbeat-{job['id']}", daemon=True).start()
+        try:
+            success, error = self._track(lambda: handler(job))
+        finally:
+            stop_heartbeat.set()
+        
+        self.job_queue.complete(job['id'], worker_id, success=success, error=error)
+        return True
+    
+    async def _run_async_job(self, job: Dict, worker_id: str, handler: Callable):
+        """이벤트 루프에서 DB 작업 실행 (_run_db_job과 같은 Heartbeat/완료 처리를 루프의 태스크로 수행)"""
+        async def heartbeat():
+            while True:
+                await asyncio.sleep(self.job_queue.lease_seconds / 3)
+                if not await asyncio.to_thread(self.job_queue.heartbeat, job['id'], worker_id):
+                    print(f"⚠️ Lost lease on job {job['id']} for PR #{job['pr_number']}, cancelling")
+                    job['cancel_token'].cancel('Job was cancelled or claimed by another worker')
+                    return
+        
+        heartbeat_task = asyncio.create_task(heartbeat())
+        error = None
+        try:
+            await handler(job)
+        except Exception as e:
+            error = str(e)
+            print(f"❌ Pipeline job failed: {error}")
+        finally:
+            heartbeat_task.cancel()
+            with self._lock:
+                self._async_running -= 1
+                if error is None:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+            self._notify()
+        
+        await asyncio.to_thread(self.job_queue.complete, job['id'], worker_id, success=error is None, error=error)
+    
+    def _track(self, run: Callable[[], None], on_error: Callable[[BaseException], None] = None):
+        """작업 실행 및 사용률/결과 집계
+        
+        Returns:
+            tuple: (성공 여부, 에러 메시지)
+        """
+        with self._lock:
+            self._busy += 1
+        started = time.monotonic()
+        error = None
+        try:
+            run()
+        except Exception as e:
+            error = str(e)
+            print(f"❌ Pipeline job failed: {error}")
+            if on_error:
+                on_error(e)
+        finally:
+            with self._lock:
+                self._busy -= 1
+                self._busy_seconds += time.monotonic() - started
+                if error is None:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+        return error is None, error
+
+
+# 프로세스 전체에서 공유하는 인스턴스 (브라우저 동시 실행 수를 프로세스 단위로 제한)
+pipeline_worker_pool = PipelineWorkerPool()
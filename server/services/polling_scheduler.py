@@ -1,20 +1,33 @@
 # server/services/polling_scheduler.py
 """
 Polling 스케줄러
+
+여러 인스턴스를 실행해도 DB Lease를 가진 리더 인스턴스만 Polling한다.
+(나머지 인스턴스는 대기하다가 리더가 죽어 Lease가 만료되면 이어받음)
 """
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 import os
+from ..config import POLLING_TICK_SECONDS
 from .polling_service import PollingService
+from .scheduler_lease_service import SchedulerLeaseService
 from ..models import init_db
 
 class PollingScheduler:
     """Polling 스케줄러 클래스"""
     
-    def __init__(self, interval_minutes: int = 5):
+    def __init__(self, interval_minutes: int = 5, tick_seconds: int = None):
+        """
+        Args:
+            interval_minutes: 새 구독의 기본 Polling 간격 (이후에는 구독별로 활동에 따라 조정됨)
+            tick_seconds: Polling 시점이 된 구독을 확인하는 주기
+        """
         self.interval_minutes = interval_minutes
+        self.tick_seconds = tick_seconds or POLLING_TICK_SECONDS
         self.scheduler = BackgroundScheduler()
         self.polling_service = PollingService()
+        self.polling_service.default_poll_interval_seconds = interval_minutes * 60
+        self.leader_lease = SchedulerLeaseService('polling')
         self.is_running = False
     
     def start(self):
@@ -25,18 +38,37 @@ class PollingScheduler:
         
         init_db()
         
+        # Polling으로 감지된 PR 테스트를 실행할 워커 시작 (이전 실행에서 남은 작업도 이어서 실행)
+        self.polling_service.worker_pool.start()
+        
+        # 리더 Lease는 Polling 사이클과 별도로 갱신 (사이클이 길어져도 Lease가 만료되지 않도록)
+        self.leader_lease.acquire_or_renew()
+        self.scheduler.add_job(
+            func=self.leader_lease.acquire_or_renew,
+            trigger=IntervalTrigger(seconds=max(1, self.leader_lease.lease_seconds // 3)),
+            id='renew_leader_lease',
+            name='Renew polling scheduler leader lease',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        
         self.scheduler.add_job(
             func=self._poll_job,
-            trigger=IntervalTrigger(minutes=self.interval_minutes),
+            trigger=IntervalTrigger(seconds=self.tick_seconds),
             id='poll_prs',
             name='Poll PRs from subscribed repositories',
-            replace_existing=True
+            replace_existing=True,
+            # 이전 사이클이 끝나지 않았으면 겹쳐 실행하지 않고 한 번으로 합침
+            max_instances=1,
+            coalesce=True
         )
         
         self.scheduler.start()
         self.is_running = True
         
-        print(f"✅ Polling scheduler started (interval: {self.interval_minutes} minutes)")
+        role = 'leader' if self.leader_lease.is_leader else 'standby'
+        print(f"✅ Polling scheduler started (adaptive per-subscription interval, checking every {self.tick_seconds}s, {role})")
     
     def stop(self):
         """스케줄러 중지"""
@@ -44,15 +76,17 @@ class PollingScheduler:
             return
         
         self.scheduler.shutdown()
+        self.leader_lease.release()
         self.is_running = False
         print("🛑 Polling scheduler stopped")
     
     def _poll_job(self):
-        """실제 Polling 작업"""
+        """실제 Polling 작업 (리더 인스턴스에서만 실행)"""
+        if not self.leader_lease.is_leader:
+            return
+        
         try:
-            print(f"\n⏰ Running scheduled polling job...")
-            self.polling_service.poll_all_subscriptions()
-            print("✅ Polling job completed\n")
+            self.polling_service.poll_all_subscriptions(due_only=True)
         except Exception as e:
             print(f"❌ Error in polling job: {str(e)}\n")
 
@@ -2,72 +2,342 @@
 """
 Polling 서비스 - 주기적으로 PR을 확인하고 테스트 실행
 """
+import asyncio
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timedelta
-from github import Github
-from ..models import Subscription, Test, get_db
+from typing import Dict, Optional
+from ..config import (
+    POLLING_INTERVAL_MINUTES,
+    POLLING_MIN_INTERVAL_MINUTES,
+    POLLING_MAX_INTERVAL_MINUTES,
+    POLLING_MAX_WORKERS,
+    POLLING_SUBSCRIPTION_TIMEOUT_SECONDS,
+    POLLING_USE_GRAPHQL,
+    GRAPHQL_BATCH_SIZE,
+    INCREMENTAL_TESTS,
+    PIPELINE_ENGINE,
+    WEBHOOK_FRESHNESS_MINUTES,
+    WEBHOOK_SAFETY_POLL_INTERVAL_MINUTES
+)
+from ..models import Subscription, Test, TestSummary, get_db
 from .subscription_service import SubscriptionService
 from .pat_auth_service import PATAuthService
 from .test_pipeline_service import TestPipelineService
+from .github_pr_fetcher import GitHubPRFetcher
+from .github_graphql_fetcher import GitHubGraphQLFetcher
+from .rate_limit_tracker import rate_limit_tracker, RateLimitError, PRIORITY_LOW, PRIORITY_NORMAL
+from .pipeline_worker_pool import pipeline_worker_pool, JOB_PRIORITY_NEW, JOB_PRIORITY_UPDATE
+from .pipeline_job_queue import QueueFullError, JOB_TYPE_PR_TEST
+from .run_registry import run_registry, resolve_deadlines, PipelineCancelled, PipelineTimeout
+from .stage_timer import StageTimer, STAGE_DIFF_FETCH
+from .pipeline_checkpoint_service import PipelineCheckpointService, STAGE_DIFF, STAGE_SCENARIOS
+from .test_progress_recorder import TestProgressRecorder
+from .scenario_impact_service import ScenarioImpactService
+from .async_pipeline_runner import async_pipeline_runner
 
 class PollingService:
     """PR Polling 서비스"""
     
+    # Polling 중인 레포지토리 (스케줄러/수동 Polling/Webhook 인스턴스가 공유)
+    # 타임아웃으로 포기한 Polling은 백그라운드에서 계속 실행되므로, 끝날 때까지 다음 사이클에서 건너뜀
+    _in_flight_repos = set()
+    _in_flight_lock = threading.Lock()
+    
     def __init__(self):
         self.subscription_service = SubscriptionService()
         self.pat_auth = PATAuthService()
         self.test_pipeline = TestPipelineService()
+        self.pr_fetcher = GitHubPRFetcher()
+        self.graphql_fetcher = GitHubGraphQLFetcher()
+        self.worker_pool = pipeline_worker_pool
+        # PIPELINE_ENGINE=asyncio면 PR 테스트를 이벤트 루프 하나에서 동시에 실행
+        self.worker_pool.register_job_handler(
+            JOB_TYPE_PR_TEST,
+            self._run_test_job_async if PIPELINE_ENGINE == 'asyncio' else self._run_test_job
+        )
         self.base_url = os.getenv('BASE_URL', 'localhost:5173')
+        # 적응형 간격이 아직 정해지지 않은 구독의 기본 Polling 간격
+        self.default_poll_interval_seconds = POLLING_INTERVAL_MINUTES * 60
+    
+    def poll_all_subscriptions(self, max_workers: int = None, timeout_seconds: int = None, due_only: bool = False, priority: str = PRIORITY_LOW):
+        """모든 활성 구독에 대해 PR 확인 및 테스트 실행
+        
+        같은 레포지토리를 구독한 사용자가 여러 명이어도 PR 목록은 사이클당 한 번만 조회하고,
+        결과를 각 구독의 제외 브랜치 규칙과 테스트 기록에 나눠 적용한다.
+        
+        Args:
+            max_workers: 동시에 Polling할 레포지토리 수 (기본값: POLLING_MAX_WORKERS, 1이면 순차 실행)
+            timeout_seconds: 레포지토리 하나당 최대 대기 시간 (기본값: POLLING_SUBSCRIPTION_TIMEOUT_SECONDS)
+            due_only: True면 next_poll_at이 지난 구독만 Polling (스케줄러용)
+            priority: GitHub Rate Limit 예산 우선순위 (스케줄된 Polling은 PRIORITY_LOW)
+        """
+        if due_only:
+            subscriptions = self.subscription_service.get_due_subscriptions()
+        else:
+            subscriptions = self.subscription_service.get_all_active_subscriptions()
+        
+        if due_only and not subscriptions:
+            return
+        max_workers = max_workers or POLLING_MAX_WORKERS
+        timeout_seconds = timeout_seconds or POLLING_SUBSCRIPTION_TIMEOUT_SECONDS
+        
+        repo_groups = self._claim_repositories(self._group_by_repository(subscriptions))
+        if not repo_groups:
+            return
+        print(f"🔍 Polling {len(subscriptions)} active subscriptions ({len(repo_groups)} repositories)...")
+        
+        try:
+            prefetched = self._prefetch_listings(repo_groups, priority) if POLLING_USE_GRAPHQL else {}
+        except Exception:
+            for repo_full_name in repo_groups:
+                self._release_repository(repo_full_name)
+            raise
+        
+        if max_workers <= 1 or len(repo_groups) <= 1:
+            for repo_full_name, group in repo_groups.items():
+                try:
+                    self._poll_repository(repo_full_name, group, prefetched.get(repo_full_name), priority)
+                except Exception as e:
+                    print(f"❌ Error polling repository {repo_full_name}: {str(e)}")
+                finally:
+                    self._release_repository(repo_full_name)
+            return
+        
+        self._poll_concurrently(repo_groups, max_workers, timeout_seconds, prefetched, priority)
+    
+    def _claim_repositories(self, repo_groups: Dict[str, list]) -> Dict[str, list]:
+        """이전 사이클의 Polling이 아직 끝나지 않은 레포지토리를 제외하고 나머지를 Polling 중으로 표시"""
+        claimed = {}
+        with self._in_flight_lock:
+            for repo_full_name, group in repo_groups.items():
+                if repo_full_name in self._in_flight_repos:
+                    print(f"  ⏭️ Skipping {repo_full_name} (previous poll still running)")
+                    continue
+                self._in_flight_repos.add(repo_full_name)
+                claimed[repo_full_name] = group
+        return claimed
+    
+    def _release_repository(self, repo_full_name: str):
+        with self._in_flight_lock:
+            self._in_flight_repos.discard(repo_full_name)
+    
+    def _group_by_repository(self, subscriptions) -> Dict[str, list]:
+        """구독을 레포지토리별로 묶음 (PAT가 있는 구독을 앞에 두어 조회에 사용)"""
+        groups = {}
+        for subscription in subscriptions:
+            groups.setdefault(subscription.repo_full_name, []).append(subscription)
+        
+        for group in groups.values():
+            group.sort(key=lambda sub: sub.user_credential_id is None)
+        return groups
+    
+    def _get_group_scan_window(self, subscriptions):
+        """레포지토리를 구독한 모든 구독을 만족하는 조회 범위
+        
+        Returns:
+            datetime: 가장 이른 since (하나라도 전체 조회가 필요하면 None)
+        """
+        group_since = None
+        for subscription in subscriptions:
+            since, full_scan = self._get_scan_window(subscription)
+            if full_scan:
+                return None
+            group_since = since if group_since is None else min(group_since, since)
+        return group_since
+    
+    def _prefetch_listings(self, repo_groups: Dict[str, list], priority: str = PRIORITY_LOW) -> Dict[str, Dict]:
+        """PAT가 같은 레포지토리들을 묶어 GraphQL로 열린 PR 목록을 미리 조회
+        
+        GraphQL은 인증이 필요하므로 PAT가 없는 레포지토리와 조회에 실패한 레포지토리는
+        결과에서 빠지고, _poll_repository에서 REST로 조회한다.
+        
+        Returns:
+            dict: {repo_full_name: PR 목록 조회 결과}
+        """
+        repos_by_credential = {}
+        for repo_full_name, group in repo_groups.items():
+            credential_id = group[0].user_credential_id
+            if credential_id:
+                repos_by_credential.setdefault(credential_id, []).append(repo_full_name)
+        
+        prefetched = {}
+        for credential_id, repos in repos_by_credential.items():
+            pat = self.pat_auth.get_pat_by_credential_id(credential_id)
+            if not pat:
+                continue
+            
+            since_by_repo = {repo: self._get_group_scan_window(repo_groups[repo]) for repo in repos}
+            for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+                batch = repos[start:start + GRAPHQL_BATCH_SIZE]
+                fetched_at = datetime.utcnow()
+                try:
+                    listings = self.graphql_fetcher.fetch_open_pulls(batch, pat, since_by_repo, priority)
+                except Exception as e:
+                    print(f"  ⚠️ GraphQL prefetch failed for {len(batch)} repo(s), falling back to REST: {str(e)}")
+                    continue
+                
+                for repo_full_name, listing in listings.items():
+                    prefetched[repo_full_name] = {**listing, 'fetched_at': fetched_at}
+        
+        if prefetched:
+            print(f"  📡 Prefetched PR lists for {len(prefetched)} repository(ies) via GraphQL")
+        return prefetched
     
-    def poll_all_subscriptions(self):
-        """모든 활성 구독에 대해 PR 확인 및 테스트 실행"""
-        subscriptions = self.subscription_service.get_all_active_subscriptions()
+    def _poll_repository(self, repo_full_name: str, subscriptions, prefetched_listing: Dict = None, priority: str = PRIORITY_LOW):
+        """레포지토리의 PR 목록을 한 번 조회한 뒤 모든 구독자에게 적용"""
+        listing = prefetched_listing
         
-        print(f"🔍 Polling {len(subscriptions)} active subscriptions...")
+        if listing is None and len(subscriptions) > 1:
+            representative = subscriptions[0]
+            pat = self.pat_auth.get_pat_by_credential_id(representative.user_credential_id)
+            fetched_at = datetime.utcnow()
+            try:
+                listing = self.pr_fetcher.list_open_pulls(
+                    repo_full_name,
+                    pat=pat,
+                    credential_id=representative.user_credential_id,
+                    since=self._get_group_scan_window(subscriptions),
+                    priority=priority
+                )
+            except RateLimitError as e:
+                self._defer_subscriptions(subscriptions, e)
+                raise
+            listing['fetched_at'] = fetched_at
+            print(f"  📡 Fetched PR list for {repo_full_name} once for {len(subscriptions)} subscribers")
         
         for subscription in subscriptions:
             try:
-                self._poll_subscription(subscription)
+                self._poll_subscription(subscription, prefetched_listing=listing, priority=priority)
             except Exception as e:
                 print(f"❌ Error polling subscription {subscription.id}: {str(e)}")
     
-    def _poll_subscription(self, subscription: Subscription):
+    def _poll_concurrently(self, repo_groups: Dict[str, list], max_workers: int, timeout_seconds: int, prefetched: Dict[str, Dict] = None, priority: str = PRIORITY_LOW):
+        """제한된 워커 풀로 레포지토리들을 동시에 Polling
+        
+        각 레포지토리는 실제로 실행을 시작한 시점부터 timeout_seconds가 지나면 포기한다.
+        (스레드는 강제 종료할 수 없으므로 결과만 버리고 사이클은 계속 진행, 실제로 끝날 때까지 다음 사이클은 해당 레포지토리를 건너뜀)
+        """
+        started_at = {}
+        lock = threading.Lock()
+        
+        def run(repo_full_name):
+            with lock:
+                started_at[repo_full_name] = time.monotonic()
+            return self._poll_repository(repo_full_name, repo_groups[repo_full_name], (prefetched or {}).get(repo_full_name), priority)
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='poller')
+        futures = {}
+        for repo in repo_groups:
+            future = executor.submit(run, repo)
+            # 타임아웃으로 포기한 작업도 실제로 끝나거나 취소될 때 Polling 중 표시 해제
+            future.add_done_callback(lambda _, repo=repo: self._release_repository(repo))
+            futures[future] = repo
+        pending = set(futures)
+        # 워커가 모두 멈춰 대기 중인 레포지토리가 시작조차 못 하는 경우를 위한 사이클 전체 상한
+        waves = -(-len(repo_groups) // max_workers)
+        cycle_deadline = time.monotonic() + timeout_seconds * (waves + 1)
+        
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    repo_full_name = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"❌ Error polling repository {repo_full_name}: {str(e)}")
+                
+                now = time.monotonic()
+                timed_out = set()
+                for future in pending:
+                    with lock:
+                        start = started_at.get(futures[future])
+                    if start is not None and now - start > timeout_seconds:
+                        timed_out.add(future)
+                
+                for future in timed_out:
+                    print(f"⏱️ Polling repository {futures[future]} timed out after {timeout_seconds}s")
+                pending -= timed_out
+                
+                if pending and now > cycle_deadline:
+                    print(f"⏱️ Polling cycle deadline exceeded, abandoning {len(pending)} repository(ies)")
+                    break
+        finally:
+            # 타임아웃된 작업은 백그라운드에서 마무리되도록 두고 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _get_scan_window(self, subscription: Subscription):
+        """구독의 증분 조회 기준 시각과 전체 조회 여부
+        
+        Returns:
+            tuple: (since, full_scan)
+        """
+        since = subscription.last_polled_at
+        # last_polled_at이 없으면 첫 polling이므로 모든 열린 PR을 확인 (30일 전까지)
+        if not since:
+            since = datetime.utcnow() - timedelta(days=30)
+        
+        # 전체 조회를 한 번도 하지 않은 구독만 열린 PR 전체를 확인하고,
+        # 이후에는 since 이전에 업데이트된 PR을 만나면 페이지 조회를 중단 (증분 조회)
+        full_scan = not subscription.last_polled_at or not subscription.last_full_scan_at
+        return since, full_scan
+    
+    def _poll_subscription(self, subscription: Subscription, prefetched_listing: Dict = None, priority: str = PRIORITY_LOW):
         """특정 구독에 대해 PR 확인
         
+        Args:
+            prefetched_listing: GraphQL 일괄 조회로 미리 가져온 PR 목록 (없으면 REST로 조회)
+            priority: GitHub Rate Limit 예산 우선순위 (수동 Polling은 PRIORITY_HIGH)
+        
         Returns:
             tuple: (감지된 PR 개수, 감지된 PR 목록, 테스트 미대상 PR 목록)
         """
+        # 워커를 테스트 레코드 생성 전에 시작해야 이전 실행에서 남은 테스트만 복구 대상이 됨
+        self.worker_pool.start()
+        
         print(f"  📦 Checking {subscription.repo_full_name}...")
+        poll_started_at = datetime.utcnow()
         
         # PAT가 있는 경우 사용, 없으면 Public 저장소로 간주
-        pat = None
-        if subscription.user_credential_id:
-            credential = self.pat_auth.get_credential_by_id(subscription.user_credential_id)
-            if credential:
-                pat = self.pat_auth.get_decrypted_pat(credential.user_id)
+        pat = self.pat_auth.get_pat_by_credential_id(subscription.user_credential_id)
         
         try:
-            # PAT가 있으면 사용, 없으면 None으로 Public 저장소 접근
-            if pat:
-                g = Github(pat)
-            else:
+            if not pat:
                 # Public 저장소는 PAT 없이 접근 가능
-                g = Github()
                 print(f"    ℹ️ Using public API access (no PAT)")
             
-            repo = g.get_repo(subscription.repo_full_name)
+            since, full_scan = self._get_scan_window(subscription)
             
-            since = subscription.last_polled_at
-            # last_polled_at이 없으면 첫 polling이므로 모든 열린 PR을 확인 (30일 전까지)
-            if not since:
-                since = datetime.utcnow() - timedelta(days=30)
-            
-            pulls = repo.get_pulls(state='open', sort='updated', direction='desc')
-            
-            # PR 목록을 리스트로 변환 (제너레이터이므로)
-            pulls_list = list(pulls)
+            if prefetched_listing:
+                listing = prefetched_listing
+                poll_started_at = prefetched_listing['fetched_at']
+            else:
+                # ETag 조건부 요청 - 변경이 없으면 304로 Rate Limit 소모 없이 캐시 사용
+                listing = self.pr_fetcher.list_open_pulls(
+                    subscription.repo_full_name,
+                    pat=pat,
+                    credential_id=subscription.user_credential_id,
+                    since=None if full_scan else since,
+                    priority=priority
+                )
+            pulls_list = listing['pulls']
+            if not full_scan:
+                # 여러 구독자가 공유하는 목록은 가장 이른 since 기준이므로 이 구독의 since로 다시 거름
+                pulls_list = [
+                    pr for pr in pulls_list
+                    if not pr['updated_at'] or self._parse_timestamp(pr['updated_at']) > since
+                ]
             
-            print(f"    📋 Found {len(pulls_list)} open PR(s) in repository")
+            if listing['not_modified']:
+                print(f"    💾 PR list not modified since last request (served from cache)")
+            if full_scan:
+                print(f"    📋 Found {len(pulls_list)} open PR(s) in repository (full scan)")
+            else:
+                print(f"    📋 Found {len(pulls_list)} open PR(s) updated since last poll (incremental scan)")
             print(f"    📅 Last polled at: {subscription.last_polled_at}")
             print(f"    📅 Since: {since}")
             print(f"    🚫 Exclude branches: {subscription.exclude_branches or ['main']}")
@@ -79,52 +349,42 @@ class PollingService:
             # 제외할 브랜치 목록 (기본값: main)
             exclude_branches = subscription.exclude_branches or ['main']
             
-            # DB에서 이미 테스트가 있는 PR 목록 확인
-            db = next(get_db())
-            try:
-                existing_tests = db.query(Test).filter(
-                    Test.subscription_id == subscription.id
-                ).all()
-                tested_pr_numbers = {test.pr_number for test in existing_tests}
-            finally:
-                db.close()
+            # DB에서 이미 테스트가 있는 PR 목록 확인 (요약 테이블만 조회)
+            summaries = self._get_test_summaries(subscription.id)
+            tested_pr_numbers = {summary.pr_number for summary in summaries}
+            # 이미 테스트가 끝난 커밋 (라벨/코멘트/제목 변경으로 updated_at만 바뀐 PR은 다시 테스트하지 않음)
+            tested_shas = {
+                (summary.pr_number, summary.head_sha)
+                for summary in summaries
+                if summary.head_sha and summary.finished_run
+            }
             
             for pr in pulls_list:
-                pr_updated = pr.updated_at.replace(tzinfo=None) if pr.updated_at else None
-                pr_created = pr.created_at.replace(tzinfo=None) if pr.created_at else None
+                pr_updated = self._parse_timestamp(pr['updated_at'])
+                pr_created = self._parse_timestamp(pr['created_at'])
                 
-                print(f"    🔍 Checking PR #{pr.number}: {pr.title[:50]}... (branch: {pr.head.ref})")
+                print(f"    🔍 Checking PR #{pr['number']}: {pr['title'][:50]}... (branch: {pr['branch']})")
                 
                 # 테스트 대상 브랜치 확인: 정확히 "preview"인 경우만 테스트 대상
-                is_test_target = pr.head.ref == "preview"
-                
-                # 제외할 브랜치인지 확인
-                should_exclude = False
-                
-                for exclude_branch in exclude_branches:
-                    # 와일드카드 패턴 지원 (예: "main*" -> "main", "main-dev" 등)
-                    if exclude_branch.endswith('*'):
-                        pattern = exclude_branch.replace('*', '')
-                        if pr.head.ref.startswith(pattern):
-                            should_exclude = True
-                            break
-                    # 정확한 매칭
-                    elif pr.head.ref == exclude_branch:
-                        should_exclude = True
-                        break
+                is_test_target = pr['branch'] == "preview"
                 
                 # 제외할 브랜치면 스킵
-                if should_exclude:
-                    print(f"      ⏭️ Skipping PR #{pr.number} (excluded branch: {pr.head.ref})")
+                if self._is_excluded_branch(pr['branch'], exclude_branches):
+                    print(f"      ⏭️ Skipping PR #{pr['number']} (excluded branch: {pr['branch']})")
                     continue
                 
                 # 테스트 대상이 아닌 경우 (preview 브랜치가 아닌 경우)
                 if not is_test_target:
-                    print(f"      ⏸️ PR #{pr.number} is not a test target (branch: {pr.head.ref}, required: 'preview')")
+                    print(f"      ⏸️ PR #{pr['number']} is not a test target (branch: {pr['branch']}, required: 'preview')")
                     # 테스트 미대상 PR 목록에 추가
                     non_target_prs.append(pr)
                     continue
                 
+                # 같은 커밋에 대한 테스트가 이미 끝났으면 스킵
+                if pr['head_sha'] and (pr['number'], pr['head_sha']) in tested_shas:
+                    print(f"      ⏭️ Skipping PR #{pr['number']} (commit {pr['head_sha'][:7]} already tested)")
+                    continue
+                
                 # 첫 polling이거나 PR이 since 이후에 생성/업데이트된 경우
                 is_first_polling = not subscription.last_polled_at
                 
@@ -132,99 +392,291 @@ class PollingService:
                     # 첫 polling: 모든 열린 PR을 새 PR로 처리
                     if pr_created:
                         new_prs.append(pr)
-                        print(f"      ✅ Found PR #{pr.number} (first polling, branch: {pr.head.ref})")
+                        print(f"      ✅ Found PR #{pr['number']} (first polling, branch: {pr['branch']})")
                 else:
                     # 이후 polling: since 이후 생성/업데이트된 PR 또는 테스트가 없는 PR
-                    has_test = pr.number in tested_pr_numbers
+                    has_test = pr['number'] in tested_pr_numbers
                     
                     if pr_updated and pr_updated > since:
                         # PR이 since 이후에 업데이트됨
                         if pr_created and pr_created > since:
                             new_prs.append(pr)
-                            print(f"      ✅ Found new PR #{pr.number} (branch: {pr.head.ref}, created: {pr_created})")
+                            print(f"      ✅ Found new PR #{pr['number']} (branch: {pr['branch']}, created: {pr_created})")
                         else:
                             updated_prs.append(pr)
-                            print(f"      ✅ Found updated PR #{pr.number} (branch: {pr.head.ref}, updated: {pr_updated})")
+                            print(f"      ✅ Found updated PR #{pr['number']} (branch: {pr['branch']}, updated: {pr_updated})")
                     elif not has_test:
                         # PR이 since 이전에 생성되었지만 테스트가 없는 경우
                         new_prs.append(pr)
-                        print(f"      ✅ Found PR #{pr.number} (no test exists, branch: {pr.head.ref}, created: {pr_created})")
+                        print(f"      ✅ Found PR #{pr['number']} (no test exists, branch: {pr['branch']}, created: {pr_created})")
                     else:
-                        print(f"      ⏭️ Skipping PR #{pr.number} (already tested, not updated since {since})")
+                        print(f"      ⏭️ Skipping PR #{pr['number']} (already tested, not updated since {since})")
+            
+            # 증분 조회에서는 변경되지 않은 PR이 목록에 없으므로,
+            # 이전 사이클에 감지됐지만 아직 실행되지 않은(pending) 테스트는 DB에서 찾음
+            if not full_scan:
+                listed_numbers = {pr['number'] for pr in pulls_list}
+                for pr in self._find_untested_prs(subscription):
+                    if pr['number'] not in listed_numbers:
+                        new_prs.append(pr)
+                        print(f"      ✅ Found PR #{pr['number']} (pending test not started yet, branch: {pr['branch']})")
             
             all_prs = new_prs + updated_prs
+            has_backlog = False
             detected_count = len(all_prs)
             
             # 감지된 PR 정보 수집 (테스트 대상)
             detected_pr_list = []
             for pr in all_prs:
-                detected_pr_list.append({
-                    'number': pr.number,
-                    'title': pr.title,
-                    'branch': pr.head.ref,
-                    'url': pr.html_url,
-                    'created_at': pr.created_at.isoformat() if pr.created_at else None,
-                    'updated_at': pr.updated_at.isoformat() if pr.updated_at else None,
-                    'is_test_target': True
-                })
+                detected_pr_list.append(self._to_pr_info(pr, is_test_target=True))
             
             # 테스트 미대상 PR 정보 수집
             non_target_pr_list = []
             for pr in non_target_prs:
-                non_target_pr_list.append({
-                    'number': pr.number,
-                    'title': pr.title,
-                    'branch': pr.head.ref,
-                    'url': pr.html_url,
-                    'created_at': pr.created_at.isoformat() if pr.created_at else None,
-                    'updated_at': pr.updated_at.isoformat() if pr.updated_at else None,
-                    'is_test_target': False
-                })
+                non_target_pr_list.append(self._to_pr_info(pr, is_test_target=False))
             
             if all_prs:
                 print(f"    ✅ Found {len(all_prs)} PR(s) to test")
                 # PR 감지 후 즉시 DB에 pending 상태로 저장
+                test_ids = {}
                 for pr in all_prs:
-                    self._create_test_record(pr, subscription)
+                    test_ids[pr['number']] = self._create_test_record(pr, subscription)
                 
-                # 백그라운드에서 테스트 실행 (비동기)
-                import threading
-                for pr in all_prs:
-                    thread = threading.Thread(
-                        target=self._run_test_for_pr,
-                        args=(pr, subscription),
-                        daemon=True
-                    )
-                    thread.start()
-                    print(f"      🚀 Started background test for PR #{pr.number}")
+                # 작업 대기열에 테스트 실행 요청 (새 PR이 업데이트된 PR보다 먼저 실행)
+                # 대기열이 가득 차면 나머지는 pending으로 남겨두고 다음 Polling에서 다시 시도
+                jobs = [(pr, JOB_PRIORITY_NEW) for pr in new_prs] + [(pr, JOB_PRIORITY_UPDATE) for pr in updated_prs]
+                for index, (pr, job_priority) in enumerate(jobs):
+                    test_id = test_ids.get(pr['number'])
+                    if not test_id:
+                        continue
+                    
+                    try:
+                        job_id = self.worker_pool.enqueue_test(test_id, subscription.id, pr['number'], priority=job_priority)
+                    except QueueFullError:
+                        print(f"      ⏸️ Pipeline queue is full, leaving {len(jobs) - index} PR(s) pending until the next poll")
+                        has_backlog = True
+                        break
+                    
+                    if job_id:
+                        print(f"      🚀 Queued test for PR #{pr['number']} (job: {job_id})")
+                    else:
+                        print(f"      ℹ️ Test for PR #{pr['number']} is already queued or running")
             else:
                 print(f"    ℹ️ No new or updated PRs")
             
-            self.subscription_service.update_last_polled(subscription.id)
+            # 이번 Polling에서 변경된 PR(테스트 대상 여부 무관)이 있었는지에 따라 다음 간격 결정
+            # 대기열이 가득 차서 남겨둔 PR이 있으면 다음 Polling을 미루지 않음
+            has_activity = has_backlog or any(
+                pr['updated_at'] and self._parse_timestamp(pr['updated_at']) > since
+                for pr in pulls_list
+            )
+            next_interval_seconds = self._next_poll_interval(subscription, has_activity)
+            mode = 'active' if has_activity else 'quiet'
+            if not has_backlog:
+                throttled_seconds = self._apply_webhook_throttle(subscription, next_interval_seconds)
+                if throttled_seconds != next_interval_seconds:
+                    next_interval_seconds = throttled_seconds
+                    mode = 'webhook healthy'
+            print(f"    ⏲️ Next poll in {next_interval_seconds // 60}m {next_interval_seconds % 60}s ({mode})")
+            
+            self.subscription_service.update_last_polled(
+                subscription.id,
+                polled_at=poll_started_at,
+                full_scan=full_scan and listing['complete'],
+                next_interval_seconds=next_interval_seconds
+            )
             
             return detected_count, detected_pr_list, non_target_pr_list
             
-        except Exception as e:
-            error_msg = str(e)
-            # Rate limit 에러 체크
-            if '403' in error_msg or 'rate limit' in error_msg.lower() or 'RateLimitExceededException' in str(type(e).__name__):
+        except RateLimitError as e:
+            # 예산이 부족하면 한도를 넘기기 전에 미루고, 리셋 시각 이후에 다시 Polling
+            if e.deferred:
+                print(f"    ⏸️ Deferring {subscription.repo_full_name}: rate limit budget reserved for higher-priority work")
+            else:
                 print(f"    ⚠️ Rate limit exceeded for {subscription.repo_full_name}")
+            if not pat:
                 print(f"    💡 Tip: Add a PAT to increase rate limit from 60/hour to 5,000/hour")
-                # Rate limit 에러를 명확하게 전달
-                raise Exception(f"GitHub API rate limit exceeded. Please add a Personal Access Token (PAT) to increase the limit from 60/hour to 5,000/hour. Error: {error_msg}")
-            else:
-                print(f"    ❌ Error fetching PRs: {str(e)}")
-                raise
+            self._defer_subscriptions([subscription], e)
+            raise
+        except Exception as e:
+            print(f"    ❌ Error fetching PRs: {str(e)}")
+            raise
+    
+    def schedule_pr_test(self, subscription: Subscription, pr: Dict, job_priority: int = JOB_PRIORITY_NEW,
+                         preview_only: bool = True) -> Optional[int]:
+        """Polling 외의 경로(Webhook)로 받은 PR의 테스트를 예약 (Polling과 같은 중복 규칙 적용)
+        
+        대기열이 가득 차면 테스트는 pending으로 남고 다음 Polling에서 다시 대기열에 추가된다.
+        
+        Args:
+            preview_only: Polling과 같이 preview 브랜치만 테스트 (False면 구독의 제외 브랜치만 적용)
+        
+        Returns:
+            int: 테스트 ID (테스트 대상이 아니거나 이미 테스트한 커밋이면 None)
+        """
+        exclude_branches = subscription.exclude_branches or ['main']
+        if self._is_excluded_branch(pr['branch'], exclude_branches) or (preview_only and pr['branch'] != "preview"):
+            print(f"      ⏸️ PR #{pr['number']} is not a test target for subscription {subscription.id} (branch: {pr['branch']})")
+            return None
+        
+        if pr.get('head_sha'):
+            already_tested = any(
+                summary.head_sha == pr['head_sha'] and summary.finished_run
+                for summary in self._get_test_summaries(subscription.id, pr['number'])
+            )
+            if already_tested:
+                print(f"      ⏭️ Skipping PR #{pr['number']} (commit {pr['head_sha'][:7]} already tested)")
+                return None
+        
+        self.worker_pool.start()
+        test_id = self._create_test_record(pr, subscription)
+        if not test_id:
+            return None
+        
+        try:
+            job_id = self.worker_pool.enqueue_test(test_id, subscription.id, pr['number'], priority=job_priority)
+        except QueueFullError:
+            print(f"      ⏸️ Pipeline queue is full, leaving PR #{pr['number']} pending until the next poll")
+            return test_id
+        
+        if job_id:
+            print(f"      🚀 Queued test for PR #{pr['number']} (job: {job_id})")
+        return test_id
+    
+    def _get_test_summaries(self, subscription_id: int, pr_number: int = None):
+        """구독의 테스트별 (PR 번호, 커밋, 상태, 완료 여부) 조회 (test_results는 로드하지 않음)"""
+        db = next(get_db())
+        try:
+            query = db.query(
+                TestSummary.pr_number,
+                TestSummary.head_sha,
+                TestSummary.status,
+                TestSummary.finished_run
+            ).filter(TestSummary.subscription_id == subscription_id)
+            if pr_number is not None:
+                query = query.filter(TestSummary.pr_number == pr_number)
+            return query.all()
+        finally:
+            db.close()
+    
+    def _is_excluded_branch(self, branch: str, exclude_branches) -> bool:
+        """제외할 브랜치인지 확인"""
+        for exclude_branch in exclude_branches:
+            # 와일드카드 패턴 지원 (예: "main*" -> "main", "main-dev" 등)
+            if exclude_branch.endswith('*'):
+                if branch.startswith(exclude_branch.replace('*', '')):
+                    return True
+            # 정확한 매칭
+            elif branch == exclude_branch:
+                return True
+        return False
+    
+    def _defer_subscriptions(self, subscriptions, error: RateLimitError):
+        """Rate Limit 리셋 시각까지 구독의 다음 Polling을 미룸"""
+        if not error.reset_at or error.reset_at <= datetime.utcnow():
+            return
+        for subscription in subscriptions:
+            self.subscription_service.defer_polling(subscription.id, error.reset_at)
+    
+    def _next_poll_interval(self, subscription: Subscription, has_activity: bool) -> int:
+        """레포지토리 활동에 따른 다음 Polling 간격 (초)
+        
+        PR 활동이 있으면 최소 간격으로 줄이고, 조용하면 이전 간격의 2배로 늘린다 (최대 간격까지).
+        """
+        min_interval = POLLING_MIN_INTERVAL_MINUTES * 60
+        max_interval = max(POLLING_MAX_INTERVAL_MINUTES * 60, min_interval)
+        
+        if has_activity:
+            return min_interval
+        
+        current = subscription.poll_interval_seconds or self.default_poll_interval_seconds
+        return max(min_interval, min(current * 2, max_interval))
+    
+    def _apply_webhook_throttle(self, subscription: Subscription, interval_seconds: int, now: datetime = None) -> int:
+        """Webhook이 정상적으로 들어오는 구독은 안전망 간격으로만 Polling (초)
+        
+        마지막 Webhook 이후 WEBHOOK_FRESHNESS_MINUTES가 지나면 Webhook이 끊긴 것으로 보고
+        적응형 간격으로 돌아가야 하므로, 다음 Polling을 그 시점 이후로는 미루지 않는다.
+        """
+        if not subscription.last_webhook_at:
+            return interval_seconds
+        
+        now = now or datetime.utcnow()
+        stale_at = subscription.last_webhook_at + timedelta(minutes=WEBHOOK_FRESHNESS_MINUTES)
+        seconds_until_stale = int((stale_at - now).total_seconds())
+        if seconds_until_stale <= 0:
+            return interval_seconds
+        
+        return max(interval_seconds, min(WEBHOOK_SAFETY_POLL_INTERVAL_MINUTES * 60, seconds_until_stale))
+    
+    def _find_untested_prs(self, subscription: Subscription):
+        """이전 사이클에 pending으로 기록됐지만 작업 대기열에 없는(대기열이 가득 찼던) 테스트의 PR 정보 조회"""
+        db = next(get_db())
+        try:
+            pending_tests = db.query(Test).filter(
+                Test.subscription_id == subscription.id,
+                Test.status == 'pending'
+            ).order_by(Test.created_at.desc()).all()
+            queued_test_ids = self.worker_pool.job_queue.get_active_test_ids([test.id for test in pending_tests])
+            
+            untested = {}
+            for test in pending_tests:
+                if test.pr_number in untested or test.id in queued_test_ids:
+                    continue
+                untested[test.pr_number] = {
+                    'number': test.pr_number,
+                    'title': test.pr_title or '',
+                    'branch': test.branch_name,
+                    'head_sha': test.head_sha,
+                    'url': test.pr_url,
+                    'created_at': test.created_at.isoformat() if test.created_at else None,
+                    'updated_at': None
+                }
+            return list(untested.values())
+        finally:
+            db.close()
+    
+    def _parse_timestamp(self, value):
+        """PR 딕셔너리의 ISO 시간 문자열을 naive UTC datetime으로 변환"""
+        if not value:
+            return None
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    
+    def _to_pr_info(self, pr, is_test_target: bool):
+        """API 응답용 PR 정보 딕셔너리"""
+        return {
+            'number': pr['number'],
+            'title': pr['title'],
+            'branch': pr['branch'],
+            'url': pr['url'],
+            'created_at': pr['created_at'],
+            'updated_at': pr['updated_at'],
+            'is_test_target': is_test_target
+        }
+    
+    def _get_github_pull(self, subscription: Subscription, pr_number: int):
+        """구독의 PAT(없으면 Public 접근)로 PyGithub PR 객체 조회"""
+        pat, g = self.pat_auth.get_github_client(subscription.user_credential_id)
+        rate_limit_tracker.check(pat, PRIORITY_NORMAL)
+        pull = g.get_repo(subscription.repo_full_name).get_pull(pr_number)
+        rate_limit_tracker.record_github_client(pat, g)
+        return pull
     
     def _create_test_record(self, pr, subscription: Subscription):
         """PR에 대한 테스트 레코드 생성 (pending 상태)"""
-        pr_number = pr.number
+        pr_number = pr['number']
         repo_name = subscription.repo_full_name
-        branch_name = pr.head.ref
+        branch_name = pr['branch']
+        head_sha = pr.get('head_sha')
+        
+        # 다른 커밋에 대해 대기/실행 중인 테스트는 결과가 의미 없으므로 취소
+        superseded_test_ids = run_registry.supersede(repo_name, pr_number, head_sha, subscription_id=subscription.id)
+        if superseded_test_ids:
+            print(f"      🛑 Superseded {len(superseded_test_ids)} older run(s) for PR #{pr_number}")
         
         db = next(get_db())
         try:
-            # 이미 실행 중이거나 대기 중인 테스트가 있는지 확인
+            # 같은 커밋에 대해 이미 실행 중이거나 대기 중인 테스트가 있는지 확인
             recent_test = db.query(Test).filter(
                 Test.subscription_id == subscription.id,
                 Test.pr_number == pr_number,
@@ -239,7 +691,7 @@ class PollingService:
             completed_test = db.query(Test).filter(
                 Test.subscription_id == subscription.id,
                 Test.pr_number == pr_number,
-                Test.status.in_(['completed', 'failed'])
+                Test.status.in_(['completed', 'failed', 'timeout'])
             ).order_by(Test.created_at.desc()).first()
             
             if completed_test:
@@ -248,9 +700,10 @@ class PollingService:
             test = Test(
                 subscription_id=subscription.id,
                 pr_number=pr_number,
-                pr_title=pr.title,
-                pr_url=pr.html_url,
+                pr_title=pr['title'],
+                pr_url=pr['url'],
                 branch_name=branch_name,
+                head_sha=head_sha,
                 repo_full_name=repo_name,
                 status='pending'
             )
@@ -267,72 +720,218 @@ class PollingService:
         finally:
             db.close()
     
-    def _run_test_for_pr(self, pr, subscription: Subscription):
-        """PR에 대해 테스트 실행 (백그라운드에서 실행)"""
-        pr_number = pr.number
-        repo_name = subscription.repo_full_name
-        branch_name = pr.head.ref
+    def _run_test_job(self, job: Dict):
+        """작업 대기열에서 가져온 PR 테스트 실행 (파이프라인 워커에서 실행)
         
-        print(f"    🚀 Running test for PR #{pr_number} in background...")
+        Lease 만료로 다시 가져온 작업이면 테스트가 running 상태일 수 있으므로 처음부터 다시 실행한다.
+        """
+        run = self._start_test_run(job)
+        if not run:
+            return
         
-        # 테스트 레코드 찾기
-        db = next(get_db())
         try:
-            test = db.query(Test).filter(
-                Test.subscription_id == subscription.id,
-                Test.pr_number == pr_number,
-                Test.status == 'pending'
-            ).order_by(Test.created_at.desc()).first()
-            
-            if not test:
-                print(f"      ❌ Test record not found for PR #{pr_number}")
-                return
-            
-            test_id = test.id
+            self._prepare_test_run(run)
+            # preview 브랜치는 항상 preview-dev.oliveyoung.com 사용
+            result = self.test_pipeline.run_test_pipeline(
+                run['pr'], run['pr_diff'], run['branch_name'], base_url=None,
+                cancel_token=run['cancel_token'], timer=run['timer'], checkpoint=run['checkpoint'],
+                progress=TestProgressRecorder(run['test_id'])
+            )
+            self._record_test_result(run, result)
         except Exception as e:
-            print(f"      ❌ Failed to find test record: {str(e)}")
+            self._record_test_error(run, e)
+        finally:
+            run_registry.unregister(run['cancel_token'])
+    
+    async def _run_test_job_async(self, job: Dict):
+        """_run_test_job의 asyncio 버전 (PIPELINE_ENGINE=asyncio일 때 AsyncPipelineRunner의 이벤트 루프에서 실행)
+        
+        테스트 레코드/diff 조회와 결과 기록은 스레드 엔진과 같은 함수를 스레드에서 실행하고, 파이프라인만 이벤트 루프에서 실행한다.
+        """
+        run = await asyncio.to_thread(self._start_test_run, job)
+        if not run:
             return
+        
+        try:
+            await asyncio.to_thread(self._prepare_test_run, run)
+            result = await async_pipeline_runner.run_test_pipeline(
+                run['pr'], run['pr_diff'],
+                cancel_token=run['cancel_token'], timer=run['timer'], checkpoint=run['checkpoint'],
+                progress=TestProgressRecorder(run['test_id'])
+            )
+            await asyncio.to_thread(self._record_test_result, run, result)
+        except Exception as e:
+            await asyncio.to_thread(self._record_test_error, run, e)
         finally:
-            db.close()
+            run_registry.unregister(run['cancel_token'])
+    
+    def _start_test_run(self, job: Dict) -> Optional[Dict]:
+        """테스트 레코드와 구독을 찾아 실행 등록 (더 이상 실행할 테스트가 아니면 None)
+        
+        Returns:
+            dict: _prepare_test_run / 결과 기록에 넘길 실행 정보 (취소 신호, 단계 타이머 포함)
+        """
+        test_id = job['test_id']
+        pr_number = job['pr_number']
         
+        print(f"    🚀 Running test for PR #{pr_number} (job: {job['id']}, attempt: {job['attempt']})...")
+        
+        # 테스트 레코드와 구독 찾기
+        db = next(get_db())
         try:
-            pr_diff = self.test_pipeline.get_pr_diff(pr)
-            
-            db = next(get_db())
-            try:
-                test = db.query(Test).filter(Test.id == test_id).first()
-                if test:
-                    test.status = 'running'
-                    db.commit()
-            finally:
-                db.close()
-            
-            # preview 브랜치는 항상 preview-dev.oliveyoung.com 사용
-            result = self.test_pipeline.run_test_pipeline(pr, pr_diff, branch_name, base_url=None)
+            test = db.query(Test).filter(Test.id == test_id).first()
+            if not test or test.status not in ['pending', 'running']:
+                print(f"      ℹ️ Test {test_id} for PR #{pr_number} is no longer pending, skipping")
+                return None
             
-            db = next(get_db())
-            try:
-                test = db.query(Test).filter(Test.id == test_id).first()
-                if test:
-                    test.status = 'completed' if result['success'] else 'failed'
-                    test.test_results = result.get('test_results')
-                    test.completed_at = datetime.utcnow()
-                    db.commit()
-            finally:
-                db.close()
+            branch_name = test.branch_name
+            head_sha = test.head_sha
+            subscription = db.query(Subscription).filter(
+                Subscription.id == test.subscription_id
+            ).first()
+            if not subscription:
+                print(f"      ❌ Subscription not found for test {test_id}")
+                return None
+        finally:
+            db.close()
+        
+        # 같은 PR에 새 커밋의 테스트가 예약되면 run_registry가 이 토큰으로 실행을 취소
+        cancel_token = run_registry.register(
+            subscription.repo_full_name,
+            pr_number,
+            head_sha,
+            test_id=test_id,
+            token=job.get('cancel_token')
+        )
+        # 구독 test_options의 제한 시간 (없으면 설정 기본값)
+        cancel_token.set_deadline(*resolve_deadlines(subscription.test_options))
+        
+        return {
+            'test_id': test_id,
+            'pr_number': pr_number,
+            'branch_name': branch_name,
+            'subscription': subscription,
+            'cancel_token': cancel_token,
+            'timer': StageTimer(),
+            'checkpoint': None
+        }
+    
+    def _prepare_test_run(self, run: Dict):
+        """PR과 diff 조회, 체크포인트/증분 실행 준비 후 테스트를 running으로 표시 (run에 pr, pr_diff, checkpoint 기록)"""
+        test_id = run['test_id']
+        pr_number = run['pr_number']
+        subscription = run['subscription']
+        cancel_token = run['cancel_token']
+        timer = run['timer']
+        
+        # 파이프라인(diff 조회, Slack 리포트)은 PyGithub PR 객체가 필요하므로 여기서 조회
+        with timer.stage(STAGE_DIFF_FETCH), cancel_token.stage(STAGE_DIFF_FETCH):
+            pr = self._get_github_pull(subscription, pr_number)
             
-            print(f"      ✅ Test completed for PR #{pr_number}")
+            # 같은 커밋의 이전 시도(프로세스 종료 등)가 저장한 단계 결과는 재사용
+            checkpoint = PipelineCheckpointService(test_id, subscription.id, pr_number, pr.head.sha)
+            run['checkpoint'] = checkpoint
+            checkpoint.discard_other_commits()
+            pr_diff = checkpoint.load(STAGE_DIFF)
+            if pr_diff is None:
+                pr_diff = self.test_pipeline.get_pr_diff(pr, cancel_token=cancel_token)
+                checkpoint.save(STAGE_DIFF, pr_diff)
             
+            # 이전 커밋의 테스트가 있으면 관련 파일이 바뀐 시나리오만 다시 실행
+            if checkpoint.load(STAGE_SCENARIOS) is None and self._is_incremental(subscription):
+                impact = ScenarioImpactService(test_id, subscription.id, pr_number)
+                plan = impact.plan(pr, pr_diff)
+                if plan:
+                    # 시나리오 목록을 마지막에 저장해 중간에 종료되면 다음 시도가 처음부터 실행
+                    for index, reference in plan['carried'].items():
+                        checkpoint.save_carried(index, reference)
+                    checkpoint.save(STAGE_SCENARIOS, plan['scenarios'])
+        cancel_token.raise_if_cancelled()
+        
+        db = next(get_db())
+        try:
+            test = db.query(Test).filter(Test.id == test_id).first()
+            if test:
+                test.status = 'running'
+                # 감지 이후 새 커밋이 push됐을 수 있으므로 실제로 테스트하는 커밋으로 기록
+                test.head_sha = pr.head.sha
+                test.diff_files = [file['filename'] for file in pr_diff]
+                db.commit()
+        finally:
+            db.close()
+        
+        run['pr'] = pr
+        run['pr_diff'] = pr_diff
+    
+    def _record_test_result(self, run: Dict, result: Dict):
+        """파이프라인 결과 기록 (파이프라인 오류로 끝나면 체크포인트에 저장된 끝난 시나리오의 결과를 부분 결과로 기록)"""
+        checkpoint = run['checkpoint']
+        self._finish_test(
+            run['test_id'],
+            'completed' if result['success'] else 'failed',
+            result.get('test_results') if result['success'] else self._partial_results(checkpoint),
+            stage_timings=result.get('stage_timings')
+        )
+        if result['success']:
+            # 성공한 커밋은 다시 실행되지 않으므로 체크포인트 삭제 (실패/시간 초과는 재시도를 위해 보관)
+            checkpoint.clear()
+        print(f"      ✅ Test completed for PR #{run['pr_number']}")
+    
+    def _record_test_error(self, run: Dict, error: Exception):
+        """준비나 파이프라인 실행 중 발생한 예외에 따라 테스트 종료 기록"""
+        test_id = run['test_id']
+        pr_number = run['pr_number']
+        checkpoint = run['checkpoint']
+        
+        if isinstance(error, PipelineTimeout):
+            # 제한 시간 초과 - 체크포인트에 저장된 끝난 시나리오의 결과를 부분 결과로 기록하고 'timeout'으로 종료
+            print(f"      ⏱️ Test timed out for PR #{pr_number}: {str(error)}")
+            self._finish_test(test_id, 'timeout', self._partial_results(checkpoint), stage_timings=run['timer'].as_dict())
+        elif isinstance(error, PipelineCancelled):
+            # 테스트 레코드는 취소한 쪽에서 이미 'superseded'로 표시함 (다시 실행되지 않으므로 체크포인트 삭제)
+            print(f"      🛑 Test cancelled for PR #{pr_number}: {str(error)}")
+            if checkpoint:
+                checkpoint.clear()
+        else:
+            print(f"      ❌ Test failed for PR #{pr_number}: {str(error)}")
+            self._finish_test(test_id, 'failed', self._partial_results(checkpoint))
+    
+    @staticmethod
+    def _is_incremental(subscription: Subscription) -> bool:
+        """증분 실행 여부 (구독의 test_options.incremental, 없으면 INCREMENTAL_TESTS)"""
+        return (subscription.test_options or {}).get('incremental', INCREMENTAL_TESTS)
+    
+    @staticmethod
+    def _partial_results(checkpoint):
+        """중단된 실행에서 끝난 시나리오의 결과 (끝난 시나리오가 없으면 None)"""
+        if not checkpoint:
+            return None
+        try:
+            return checkpoint.load_finished_results() or None
         except Exception as e:
-            print(f"      ❌ Test failed for PR #{pr_number}: {str(e)}")
-            
-            db = next(get_db())
-            try:
-                test = db.query(Test).filter(Test.id == test_id).first()
-                if test:
-                    test.status = 'failed'
-                    test.completed_at = datetime.utcnow()
-                    db.commit()
-            finally:
-                db.close()
+            print(f"      ⚠️ Failed to load partial results: {str(e)}")
+            return None
+    
+    def _finish_test(self, test_id: int, status: str, test_results=None, stage_timings=None):
+        """테스트 종료 기록 (실행 중 새 커밋으로 대체된 테스트는 'superseded' 상태 유지)"""
+        db = next(get_db())
+        try:
+            test = db.query(Test).filter(Test.id == test_id).first()
+            if test and test.status in ['pending', 'running']:
+                test.status = status
+                if test_results is not None:
+                    # 시나리오 순서대로의 결과 (중단된 실행이면 끝난 시나리오만 - scenarios_total은 시작할 때 기록한 값 유지)
+                    test.test_results = test_results
+                    if test.scenarios_total is None:
+                        test.scenarios_total = len(test_results)
+                    test.scenarios_completed = len(test_results)
+                if stage_timings is not None:
+                    test.stage_timings = stage_timings
+                test.completed_at = datetime.utcnow()
+                db.commit()
+        finally:
+            db.close()
+        
+        # 보관 시간이 지난 실패/시간 초과 커밋의 체크포인트 정리
+        PipelineCheckpointService.expire()
 
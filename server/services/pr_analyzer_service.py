@@ -19,6 +19,29 @@ class PRAnalyzerService:
     
     def analyze_and_generate_scenarios(self, pr_diff, pr_url=None):
         """PR diff를 분석하여 테스트 시나리오 생성"""
+        prompt, test_url = self._build_prompt(pr_diff, pr_url)
+        
+        try:
+            response = self.model.generate_content(prompt)
+            return self._parse_scenarios(response.text, pr_url, test_url)
+        except Exception as e:
+            return self._handle_generation_error(e, pr_url)
+    
+    async def analyze_and_generate_scenarios_async(self, pr_diff, pr_url=None):
+        """analyze_and_generate_scenarios의 asyncio 버전 (이벤트 루프를 막지 않고 Vertex AI 호출)
+        
+        에러 처리는 동기 버전과 같다. 제한 시간은 호출한 쪽(AsyncPipelineRunner)이 작업을 취소해서 적용한다.
+        """
+        prompt, test_url = self._build_prompt(pr_diff, pr_url)
+        
+        try:
+            response = await self.model.generate_content_async(prompt)
+            return self._parse_scenarios(response.text, pr_url, test_url)
+        except Exception as e:
+            return self._handle_generation_error(e, pr_url)
+    
+    def _build_prompt(self, pr_diff, pr_url):
+        """시나리오 생성 프롬프트와 프롬프트에 사용한 테스트 URL"""
         diff_text = self._format_diff(pr_diff)
         
         # preview 브랜치는 항상 preview-dev.oliveyoung.com 사용
@@ -60,7 +83,8 @@ PR 변경사항:
         {{"type": "fill", "selector": "#input-field", "value": "test-value"}},
         {{"type": "screenshot", "name": "result"}}
       ],
-      "expected_result": "예상 결과 설명"
+      "expected_result": "예상 결과 설명",
+      "related_files": ["이 시나리오가 검증하는 변경 파일 경로"]
     }}
   ]
 }}
@@ -103,74 +127,77 @@ PR 변경사항을 철저히 분석하여 다음을 고려하세요:
 6. **절대 comment 타입의 액션을 생성하지 마세요. 설명은 description 필드에만 작성하세요.**
 7. 모바일 테스트가 필요한 경우 set_viewport 액션을 사용하세요 (예: {{"type": "set_viewport", "width": 375, "height": 667}})
 8. 각 시나리오는 명확하고 구체적인 expected_result를 포함해야 합니다
+9. related_files에는 해당 시나리오가 검증하는 변경 파일 경로를 PR 변경사항에 표시된 경로 그대로 모두 나열하세요 (이후 커밋에서 이 파일들이 바뀐 시나리오만 다시 실행됩니다)
 
 **중요:** PR 변경사항을 완전히 커버할 수 있는 충분한 시나리오를 생성하되, 불필요한 중복은 피하세요. 품질과 완전성을 우선시하세요.
 
 """
+        return prompt, test_url
+    
+    def _parse_scenarios(self, response_text, pr_url, test_url):
+        """모델 응답에서 시나리오 목록을 파싱하고 goto URL을 PR URL 기준으로 변환"""
+        response_text = response_text.strip()
         
-        try:
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
-            
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
+        if response_text.startswith('```'):
+            response_text = response_text.split('```')[1]
+            if response_text.startswith('json'):
+                response_text = response_text[4:]
+            response_text = response_text.strip()
+        
+        scenarios_data = json.loads(response_text)
+        scenarios = scenarios_data.get('scenarios', [])
+        
+        # pr_url이 있으면 모든 goto 액션의 URL을 pr_url로 교체
+        if pr_url:
+            # pr_url을 http:// 형식으로 변환
+            if not pr_url.startswith(('http://', 'https://')):
+                if pr_url.startswith('localhost') or pr_url.startswith('127.'):
+                    pr_url_http = f"http://{pr_url}"
+                else:
+                    pr_url_http = f"https://{pr_url}"
+            else:
+                pr_url_http = pr_url
             
-            scenarios_data = json.loads(response_text)
-            scenarios = scenarios_data.get('scenarios', [])
+            print(f"📝 Updating scenario URLs to use: {pr_url_http}")
             
-            # pr_url이 있으면 모든 goto 액션의 URL을 pr_url로 교체
-            if pr_url:
-                # pr_url을 http:// 형식으로 변환
-                if not pr_url.startswith(('http://', 'https://')):
-                    if pr_url.startswith('localhost') or pr_url.startswith('127.'):
-                        pr_url_http = f"http://{pr_url}"
-                    else:
-                        pr_url_http = f"https://{pr_url}"
-                else:
-                    pr_url_http = pr_url
-                
-                print(f"📝 Updating scenario URLs to use: {pr_url_http}")
-                
-                for scenario in scenarios:
-                    for action in scenario.get('actions', []):
-                        if action.get('type') == 'goto':
-                            url = action.get('url', '')
-                            original_url = url
-                            
-                            # test_url이 포함된 경우 (프롬프트에서 생성된 URL)
-                            if test_url in url:
+            for scenario in scenarios:
+                for action in scenario.get('actions', []):
+                    if action.get('type') == 'goto':
+                        url = action.get('url', '')
+                        original_url = url
+                        
+                        # test_url이 포함된 경우 (프롬프트에서 생성된 URL)
+                        if test_url in url:
+                            action['url'] = pr_url_http
+                            print(f"   ✅ Updated URL (test_url match): {original_url} → {pr_url_http}")
+                        # localhost가 포함된 경우 (모든 localhost를 preview-dev.oliveyoung.com으로 변경)
+                        elif 'localhost' in url or '127.0.0.1' in url:
+                            action['url'] = pr_url_http
+                            print(f"   ✅ Updated URL (localhost match): {original_url} → {pr_url_http}")
+                        # example.com이 포함된 경우
+                        elif 'example.com' in url:
+                            action['url'] = url.replace('example.com', pr_url.replace('http://', '').replace('https://', ''))
+                            if not action['url'].startswith(('http://', 'https://')):
                                 action['url'] = pr_url_http
-                                print(f"   ✅ Updated URL (test_url match): {original_url} → {pr_url_http}")
-                            # localhost가 포함된 경우 (모든 localhost를 preview-dev.oliveyoung.com으로 변경)
-                            elif 'localhost' in url or '127.0.0.1' in url:
-                                action['url'] = pr_url_http
-                                print(f"   ✅ Updated URL (localhost match): {original_url} → {pr_url_http}")
-                            # example.com이 포함된 경우
-                            elif 'example.com' in url:
-                                action['url'] = url.replace('example.com', pr_url.replace('http://', '').replace('https://', ''))
-                                if not action['url'].startswith(('http://', 'https://')):
-                                    action['url'] = pr_url_http
-                                print(f"   ✅ Updated URL (example.com match): {original_url} → {action['url']}")
-                            # 상대 경로인 경우 pr_url_http와 결합
-                            elif url.startswith('/'):
-                                action['url'] = f"{pr_url_http}{url}"
-                                print(f"   ✅ Updated relative URL: {original_url} → {action['url']}")
-                            # 그 외의 경우 (다른 도메인 등)는 그대로 유지
-                            else:
-                                print(f"   ℹ️ Keeping original URL: {original_url}")
-            
-            return scenarios
-        except Exception as e:
-            error_msg = str(e)
-            print(f"Error generating scenarios: {error_msg}")
-            # API 키 관련 에러인 경우 예외를 다시 던짐
-            if 'API key' in error_msg or 'API_KEY' in error_msg or 'API key not valid' in error_msg:
-                raise ValueError(f"Gemini API 키가 유효하지 않습니다: {error_msg}")
-            # 그 외의 경우 기본 시나리오 반환 (기존 동작 유지)
-            return self._get_default_scenarios(pr_url)
+                            print(f"   ✅ Updated URL (example.com match): {original_url} → {action['url']}")
+                        # 상대 경로인 경우 pr_url_http와 결합
+                        elif url.startswith('/'):
+                            action['url'] = f"{pr_url_http}{url}"
+                            print(f"   ✅ Updated relative URL: {original_url} → {action['url']}")
+                        # 그 외의 경우 (다른 도메인 등)는 그대로 유지
+                        else:
+                            print(f"   ℹ️ Keeping original URL: {original_url}")
+        
+        return scenarios
+    
+    def _handle_generation_error(self, e, pr_url):
+        error_msg = str(e)
+        print(f"Error generating scenarios: {error_msg}")
+        # API 키 관련 에러인 경우 예외를 다시 던짐
+        if 'API key' in error_msg or 'API_KEY' in error_msg or 'API key not valid' in error_msg:
+            raise ValueError(f"Gemini API 키가 유효하지 않습니다: {error_msg}")
+        # 그 외의 경우 기본 시나리오 반환 (기존 동작 유지)
+        return self._get_default_scenarios(pr_url)
     
     def _format_diff(self, pr_diff):
         """PR diff를 읽기 쉬운 형식으로 변환 (구조화된 분석 포함)"""
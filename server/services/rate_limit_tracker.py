@@ -0,0 +1,139 @@
+# server/services/rate_limit_tracker.py
+"""
+GitHub Rate Limit 예산 관리
+
+모든 GitHub 호출의 응답 헤더(X-RateLimit-Remaining / Reset)를 기록하여
+토큰별(익명 IP 포함) 남은 예산을 추적하고, 한도에 도달하기 전에
+우선순위가 낮은 작업부터 미룬다. 수동 재실행은 예약된 여유분을 사용할 수 있다.
+"""
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from ..config import RATE_LIMIT_LOW_PRIORITY_RESERVE, RATE_LIMIT_NORMAL_PRIORITY_RESERVE
+
+PRIORITY_LOW = 'low'  # 스케줄된 Polling
+PRIORITY_NORMAL = 'normal'  # 테스트 파이프라인, 조회 API
+PRIORITY_HIGH = 'high'  # 수동 재실행 / 수동 Polling (예약분 사용 가능)
+
+
+class RateLimitError(Exception):
+    """GitHub Rate Limit 초과 또는 예산 부족으로 작업을 미룬 경우"""
+    
+    def __init__(self, message: str, reset_at: Optional[datetime] = None, deferred: bool = False):
+        super().__init__(message)
+        self.reset_at = reset_at
+        self.deferred = deferred
+
+
+class RateLimitTracker:
+    """토큰/리소스(core, graphql 등)별 Rate Limit 예산 추적"""
+    
+    # 우선순위별로 남겨둬야 하는 예산 비율 (HIGH는 예약분까지 모두 사용 가능)
+    RESERVE_RATIOS = {
+        PRIORITY_LOW: RATE_LIMIT_LOW_PRIORITY_RESERVE,
+        PRIORITY_NORMAL: RATE_LIMIT_NORMAL_PRIORITY_RESERVE,
+        PRIORITY_HIGH: 0.0
+    }
+    
+    def __init__(self):
+        self._budgets = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def token_key(pat: Optional[str]) -> str:
+        """토큰을 그대로 저장하지 않도록 해시로 식별 (PAT가 없으면 IP 기준 익명 예산)"""
+        if not pat:
+            return 'anonymous'
+        return 'token:' + hashlib.sha256(pat.encode()).hexdigest()[:12]
+    
+    def record(self, pat: Optional[str], headers) -> None:
+        """GitHub 응답 헤더에서 Rate Limit 정보를 기록"""
+        if not headers:
+            return
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        limit = headers.get('X-RateLimit-Limit')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or limit is None:
+            return
+        
+        resource = headers.get('X-RateLimit-Resource', 'core')
+        try:
+            self._update(pat, resource, int(remaining), int(limit), int(reset) if reset else None)
+        except ValueError:
+            return
+    
+    def record_github_client(self, pat: Optional[str], github_client) -> None:
+        """PyGithub 클라이언트가 마지막 응답에서 읽은 Rate Limit 정보를 기록
+        
+        Github.rate_limiting 프로퍼티는 정보가 없으면 별도 요청을 보내므로,
+        요청을 만들지 않도록 내부 requester에 저장된 값을 직접 읽는다.
+        """
+        requester = getattr(github_client, '_Github__requester', None)
+        if requester is None:
+            return
+        try:
+            remaining, limit = requester.rate_limiting
+            reset = requester.rate_limiting_resettime
+        except Exception:
+            return
+        if remaining < 0 or limit < 0:
+            return
+        self._update(pat, 'core', remaining, limit, reset)
+    
+    def check(self, pat: Optional[str], priority: str = PRIORITY_NORMAL, cost: int = 1, resource: str = 'core') -> None:
+        """예산이 충분한지 확인하고, 부족하면 RateLimitError(deferred=True)를 발생
+        
+        Args:
+            priority: PRIORITY_LOW / PRIORITY_NORMAL / PRIORITY_HIGH
+            cost: 이번 작업에서 예상되는 요청 수
+        """
+        budget = self._get(pat, resource)
+        if not budget:
+            return
+        
+        reset_at = budget['reset_at']
+        if reset_at and reset_at <= datetime.utcnow():
+            return
+        
+        reserve = int(budget['limit'] * self.RESERVE_RATIOS.get(priority, 0.0))
+        if budget['remaining'] - cost >= reserve:
+            return
+        
+        raise RateLimitError(
+            f"GitHub API rate limit budget exhausted for {priority}-priority work "
+            f"({budget['remaining']}/{budget['limit']} remaining, resets at {reset_at} UTC). "
+            f"Please add a Personal Access Token (PAT) to increase the limit from 60/hour to 5,000/hour.",
+            reset_at=reset_at,
+            deferred=True
+        )
+    
+    def snapshot(self) -> Dict:
+        """현재 추적 중인 예산 (API 노출용)"""
+        with self._lock:
+            return {
+                f'{token}/{resource}': {
+                    'remaining': budget['remaining'],
+                    'limit': budget['limit'],
+                    'reset_at': budget['reset_at'].isoformat() if budget['reset_at'] else None
+                }
+                for (token, resource), budget in self._budgets.items()
+            }
+    
+    def _update(self, pat: Optional[str], resource: str, remaining: int, limit: int, reset: Optional[int]) -> None:
+        with self._lock:
+            self._budgets[(self.token_key(pat), resource)] = {
+                'remaining': remaining,
+                'limit': limit,
+                'reset_at': datetime.utcfromtimestamp(reset) if reset else None
+            }
+    
+    def _get(self, pat: Optional[str], resource: str) -> Optional[Dict]:
+        with self._lock:
+            budget = self._budgets.get((self.token_key(pat), resource))
+            return dict(budget) if budget else None
+
+
+# 프로세스 전체에서 공유하는 인스턴스
+rate_limit_tracker = RateLimitTracker()
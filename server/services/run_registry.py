@@ -0,0 +1,190 @@
+# server/services/run_registry.py
+"""
+PR별 실행 중인 테스트 파이프라인 관리
+
+같은 PR에 새 커밋이 push되어 새 head SHA의 테스트가 예약되면, 이전 SHA의 대기/실행 중인
+테스트는 결과가 이미 의미가 없으므로 취소한다.
+- 대기 중인 작업과 테스트 레코드는 DB에서 'superseded'로 표시 (다른 워커 프로세스는 Heartbeat 실패로 감지)
+- 이 프로세스에서 실행 중인 파이프라인은 CancellationToken으로 즉시 중단 (브라우저 액션/LLM 호출 사이에서 확인)
+
+CancellationToken은 파이프라인 전체 / 단계별 제한 시간도 함께 관리한다. 제한 시간이 지나면 같은 확인 지점에서
+PipelineTimeout이 발생하고, 블로킹 호출(LLM, Slack, 브라우저 액션)에는 timeout()으로 남은 시간을 넘겨 호출 자체가 끝나게 한다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from ..config import PIPELINE_DEADLINE_SECONDS, PIPELINE_STAGE_DEADLINE_SECONDS
+from .pipeline_job_queue import PipelineJobQueue
+from .stage_timer import PIPELINE_STAGES
+
+
+class PipelineCancelled(Exception):
+    """더 새로운 커밋의 테스트가 예약되어 실행 중인 파이프라인이 취소된 경우"""
+    pass
+
+
+class PipelineTimeout(PipelineCancelled):
+    """파이프라인 전체 또는 단계의 제한 시간을 넘긴 경우"""
+    pass
+
+
+def resolve_deadlines(test_options: Optional[Dict] = None):
+    """구독의 test_options에서 파이프라인 전체 / 단계별 제한 시간(초) 결정 (없으면 설정 기본값)
+    
+    예: {"deadline_seconds": 900, "stage_deadlines": {"browser_execution": 600, "slack_notification": 60}}
+    
+    Returns:
+        tuple: (전체 제한 시간, {단계: 제한 시간})
+    """
+    options = test_options or {}
+    seconds = options.get('deadline_seconds', PIPELINE_DEADLINE_SECONDS)
+    stage_seconds = {stage: PIPELINE_STAGE_DEADLINE_SECONDS for stage in PIPELINE_STAGES}
+    stage_seconds.update(options.get('stage_deadlines') or {})
+    return seconds, stage_seconds
+
+
+class CancellationToken:
+    """파이프라인 단계 사이에서 확인하는 취소 신호 (제한 시간 포함)"""
+    
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason = None
+        self._deadline = None  # (monotonic 시각, 초과 시 메시지)
+        self._stage_deadline = None
+        self._stage_seconds = {}
+    
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set() or self._expired_reason() is not None
+    
+    def cancel(self, reason: str = 'cancelled'):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+    
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise PipelineCancelled(self.reason)
+        reason = self._expired_reason()
+        if reason:
+            raise PipelineTimeout(reason)
+    
+    def set_deadline(self, seconds: Optional[float], stage_seconds: Dict[str, float] = None):
+        """파이프라인 전체 제한 시간과 단계별 제한 시간 설정 (None/0이면 제한 없음)"""
+        if seconds:
+            self._deadline = (time.monotonic() + seconds, f'Pipeline deadline ({seconds}s) exceeded')
+        self._stage_seconds = dict(stage_seconds or {})
+    
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록 동안 단계 제한 시간 적용 (set_deadline에 해당 단계가 없으면 전체 제한 시간만 적용)"""
+        seconds = self._stage_seconds.get(name)
+        previous = self._stage_deadline
+        if seconds:
+            self._stage_deadline = (time.monotonic() + seconds, f"Stage '{name}' deadline ({seconds}s) exceeded")
+        try:
+            yield
+        finally:
+            self._stage_deadline = previous
+    
+    def remaining(self) -> Optional[float]:
+        """가장 가까운 제한 시간까지 남은 시간 (초, 제한이 없으면 None)"""
+        deadlines = [deadline[0] for deadline in (self._deadline, self._stage_deadline) if deadline]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+    
+    def timeout(self, default: float) -> float:
+        """블로킹 호출에 넘길 timeout (기본값과 남은 시간 중 짧은 쪽, 최소 1초)"""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return max(1.0, min(default, remaining))
+    
+    def _expired_reason(self) -> Optional[str]:
+        now = time.monotonic()
+        for deadline in (self._stage_deadline, self._deadline):
+            if deadline and now >= deadline[0]:
+                return deadline[1]
+        return None
+
+
+class RunRegistry:
+    """PR별 실행 중인 파이프라인 등록 및 이전 커밋 실행 취소"""
+    
+    def __init__(self, job_queue: PipelineJobQueue = None):
+        self.job_queue = job_queue or PipelineJobQueue()
+        self._runs = []
+        self._lock = threading.Lock()
+    
+    def register(self, repo_full_name: str, pr_number: int, head_sha: Optional[str], test_id: Optional[int] = None, token: CancellationToken = None) -> CancellationToken:
+        """실행 시작 등록 (테스트 레코드가 없는 Webhook 실행은 test_id 없이 등록)
+        
+        Returns:
+            CancellationToken: 파이프라인에 전달할 취소 신호
+        """
+        token = token or CancellationToken()
+        with self._lock:
+            self._runs.append({
+                'repo_full_name': repo_full_name,
+                'pr_number': pr_number,
+                'head_sha': head_sha,
+                'test_id': test_id,
+                'token': token
+            })
+        return token
+    
+    def unregister(self, token: CancellationToken):
+        with self._lock:
+            self._runs = [run for run in self._runs if run['token'] is not token]
+    
+    def supersede(self, repo_full_name: str, pr_number: int, head_sha: Optional[str], subscription_id: Optional[int] = None) -> List[int]:
+        """새 head SHA가 예약되면 같은 PR의 다른 SHA 실행을 취소
+        
+        Args:
+            subscription_id: 지정하면 해당 구독의 테스트 레코드만 취소 (Webhook은 레포지토리 전체)
+        
+        Returns:
+            list: 'superseded'로 표시된 테스트 ID
+        """
+        if not head_sha:
+            return []
+        
+        superseded_test_ids = self.job_queue.cancel_superseded(repo_full_name, pr_number, head_sha, subscription_id)
+        
+        with self._lock:
+            targets = [
+                run for run in self._runs
+                if run['test_id'] in superseded_test_ids or (
+                    run['test_id'] is None
+                    and run['repo_full_name'] == repo_full_name
+                    and run['pr_number'] == pr_number
+                    and run['head_sha'] != head_sha
+                )
+            ]
+        
+        for run in targets:
+            short_sha = (run['head_sha'] or 'unknown')[:7]
+            print(f"🛑 Cancelling run for PR #{pr_number} at {short_sha} (superseded by {head_sha[:7]})")
+            run['token'].cancel(f'Superseded by commit {head_sha[:7]}')
+        
+        return superseded_test_ids
+    
+    def snapshot(self) -> List[Dict]:
+        """이 프로세스에서 실행 중인 파이프라인 목록 (API 노출용)"""
+        with self._lock:
+            return [
+                {
+                    'repo_full_name': run['repo_full_name'],
+                    'pr_number': run['pr_number'],
+                    'head_sha': run['head_sha'],
+                    'test_id': run['test_id'],
+                    'cancelled': run['token'].is_cancelled
+                }
+                for run in self._runs
+            ]
+
+
+# 프로세스 전체에서 공유하는 인스턴스
+run_registry = RunRegistry()
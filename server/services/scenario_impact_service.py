@@ -0,0 +1,161 @@
+# server/services/scenario_impact_service.py
+"""
+변경 영향 기반 시나리오 선택 (증분 실행)
+
+PR에 후속 커밋이 push되면 파일 하나만 바뀌어도 시나리오를 다시 생성하고 모두 실행한다.
+이전에 끝까지 실행된 테스트의 시나리오별 related_files(시나리오가 검증하는 변경 파일)와
+마지막으로 테스트한 커밋 → 새 head 커밋 사이에 바뀐 파일을 비교해, 관련 파일이 바뀐 시나리오만 다시 실행하고
+나머지는 이전 결과(검증 포함)를 그대로 사용한다.
+
+다음 경우에는 증분 실행하지 않고 처음부터 실행한다.
+- 비교할 이전 테스트가 없거나 diff 파일 목록이 기록되지 않은 경우
+- force push 등으로 이전 커밋이 새 커밋의 조상이 아닌 경우
+- 이전 diff에 없던 파일이 PR에 추가된 경우 (그 파일을 검증하는 시나리오가 없음)
+"""
+from typing import Dict, Iterable, List, Optional, Set
+from ..models import Test, get_db
+
+# GitHub compare API가 반환하는 최대 파일 수 (넘으면 바뀐 파일을 모두 알 수 없음)
+COMPARE_FILES_LIMIT = 300
+
+
+class ScenarioImpactService:
+    """이전 테스트 결과에서 다시 실행할 시나리오와 이어받을 결과 결정"""
+    
+    def __init__(self, test_id: int, subscription_id: int, pr_number: int):
+        self.test_id = test_id
+        self.subscription_id = subscription_id
+        self.pr_number = pr_number
+    
+    def plan(self, pr, pr_diff: List[Dict]) -> Optional[Dict]:
+        """
+        증분 실행 계획
+        
+        Args:
+            pr: GitHub PR 객체
+            pr_diff: 새 head 커밋의 PR diff
+        
+        Returns:
+            dict: {'base_sha', 'scenarios': 이전 시나리오 정의 목록,
+                   'carried': {시나리오 index: 이전 결과 참조 (PipelineCheckpointService.save_carried에 전달)}}
+                  (처음부터 실행해야 하면 None)
+        """
+        head_sha = pr.head.sha
+        baseline = self._find_baseline(head_sha)
+        if not baseline:
+            return None
+        
+        changed_files = self.changed_files(pr, baseline.head_sha, head_sha)
+        if changed_files is None:
+            print(f"      ℹ️ Cannot compare {baseline.head_sha[:7]}...{head_sha[:7]}, running all scenarios")
+            return None
+        
+        carried = self.select(
+            baseline.test_results,
+            baseline.diff_files,
+            [file['filename'] for file in pr_diff],
+            changed_files
+        )
+        if carried is None:
+            print(f"      ℹ️ New files since {baseline.head_sha[:7]} are not covered by any scenario, running all scenarios")
+            return None
+        
+        print(f"      ♻️ Incremental run from {baseline.head_sha[:7]}: "
+              f"{len(baseline.test_results) - len(carried)} scenario(s) to re-run, {len(carried)} carried forward")
+        # 이전 결과(스크린샷 포함)는 복사하지 않고 이전 테스트의 ID와 index로 참조
+        return {
+            'base_sha': baseline.head_sha,
+            'scenarios': [self.scenario_definition(result) for result in baseline.test_results],
+            'carried': {
+                index: {
+                    'test_id': baseline.id,
+                    'index': index,
+                    # 여러 커밋에 걸쳐 이어받은 결과는 실제로 실행한 커밋을 유지
+                    'carried_forward_from': result.get('carried_forward_from', baseline.head_sha)
+                }
+                for index, result in carried.items()
+            }
+        }
+    
+    def _find_baseline(self, head_sha: str) -> Optional[Test]:
+        """같은 구독/PR에서 다른 커밋을 끝까지 테스트한 가장 최근 기록"""
+        db = next(get_db())
+        try:
+            candidates = db.query(Test).filter(
+                Test.subscription_id == self.subscription_id,
+                Test.pr_number == self.pr_number,
+                Test.id != self.test_id,
+                Test.status.in_(['completed', 'failed']),
+                Test.head_sha.isnot(None),
+                Test.head_sha != head_sha
+            ).order_by(Test.created_at.desc()).limit(5).all()
+            
+            for test in candidates:
+                if test.is_finished_run() and test.test_results and test.diff_files is not None:
+                    # 세션을 닫은 뒤에도 사용할 수 있도록 값을 로드해 둠
+                    db.expunge(test)
+                    return test
+            return None
+        finally:
+            db.close()
+    
+    @staticmethod
+    def scenario_definition(result: Dict) -> Dict:
+        """실행 결과에서 다시 실행하는 데 필요한 시나리오 정의만 추출"""
+        return {
+            'name': result.get('scenario_name') or result.get('name'),
+            'description': result.get('description', ''),
+            'expected_result': result.get('expected_result', ''),
+            'actions': result.get('actions') or [],
+            'related_files': result.get('related_files') or []
+        }
+    
+    @staticmethod
+    def changed_files(pr, base_sha: str, head_sha: str) -> Optional[Set[str]]:
+        """base_sha → head_sha 사이에 바뀐 파일 (이어서 push된 커밋이 아니면 None)"""
+        repo = pr.head.repo or pr.base.repo
+        try:
+            comparison = repo.compare(base_sha, head_sha)
+        except Exception as e:
+            print(f"      ⚠️ Failed to compare commits: {str(e)}")
+            return None
+        
+        if comparison.status not in ['ahead', 'identical']:
+            return None
+        
+        files = list(comparison.files)
+        if len(files) >= COMPARE_FILES_LIMIT:
+            return None
+        
+        changed = set()
+        for file in files:
+            changed.add(file.filename)
+            # 이름이 바뀐 파일은 이전 경로에 매핑된 시나리오도 다시 실행
+            if getattr(file, 'previous_filename', None):
+                changed.add(file.previous_filename)
+        return changed
+    
+    @staticmethod
+    def select(previous_results: List[Dict], previous_files: Iterable[str], current_files: Iterable[str],
+               changed_files: Set[str]) -> Optional[Dict[int, Dict]]:
+        """
+        이어받을 시나리오 결과 선택
+        
+        PR diff에 포함된 파일의 변경만 영향으로 본다 (base 브랜치를 merge해 들어온 파일은 제외).
+        PR diff에서 빠진 파일(되돌린 변경)도 바뀐 것으로 보고, related_files가 없는 시나리오는 항상 다시 실행한다.
+        
+        Returns:
+            dict: {시나리오 index: 이어받을 결과 복사본} (이전 diff에 없던 파일이 추가되어 처음부터 실행해야 하면 None)
+        """
+        previous_files = set(previous_files)
+        current_files = set(current_files)
+        if current_files - previous_files:
+            return None
+        
+        affected = (changed_files & current_files) | (previous_files - current_files)
+        carried = {}
+        for index, result in enumerate(previous_results):
+            related_files = set(result.get('related_files') or [])
+            if related_files and not related_files & affected:
+                carried[index] = dict(result)
+        return carried
@@ -0,0 +1,114 @@
+# server/services/scheduler_lease_service.py
+"""
+DB Lease 기반 스케줄러 리더 선출
+
+가용성을 위해 인스턴스를 여러 개 실행하면 모든 PollingScheduler가 같은 구독을 Polling하므로,
+scheduler_leases 테이블의 Lease를 가진 인스턴스 하나만 스케줄 작업을 실행한다.
+리더는 Lease를 주기적으로 갱신하고, 갱신이 멈추면(프로세스 종료 등) 만료 후 다른 인스턴스가 가져간다.
+"""
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from ..config import SCHEDULER_LEASE_SECONDS
+from ..models import SchedulerLease, get_db
+
+
+class SchedulerLeaseService:
+    """이름별 리더 Lease 획득/갱신/반납"""
+    
+    def __init__(self, name: str, lease_seconds: int = None, holder_id: str = None):
+        """
+        Args:
+            name: Lease 이름 (스케줄 작업 종류별로 하나)
+            lease_seconds: Lease 유지 시간 (기본값: SCHEDULER_LEASE_SECONDS)
+            holder_id: 이 인스턴스 ID (기본값: hostname:pid)
+        """
+        self.name = name
+        self.lease_seconds = lease_seconds or SCHEDULER_LEASE_SECONDS
+        self.holder_id = holder_id or f'{socket.gethostname()}:{os.getpid()}'
+        self._expires_at = None
+        self._lock = threading.Lock()
+    
+    @property
+    def is_leader(self) -> bool:
+        """마지막으로 획득/갱신한 Lease가 아직 유효한지 (DB 조회 없음)"""
+        with self._lock:
+            return self._expires_at is not None and datetime.utcnow() < self._expires_at
+    
+    def acquire_or_renew(self) -> bool:
+        """Lease가 비어 있거나 만료됐거나 이미 이 인스턴스의 것이면 가져오거나 연장
+        
+        여러 인스턴스가 동시에 시도해도 하나만 성공하도록 조건부 UPDATE로 갱신한다.
+        
+        Returns:
+            bool: 이 인스턴스가 리더인지
+        """
+        was_leader = self.is_leader
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        
+        db = next(get_db())
+        try:
+            updated = db.query(SchedulerLease).filter(
+                SchedulerLease.name == self.name,
+                or_(
+                    SchedulerLease.holder == self.holder_id,
+                    SchedulerLease.expires_at == None,
+                    SchedulerLease.expires_at < now
+                )
+            ).update({
+                'holder': self.holder_id,
+                'expires_at': expires_at
+            }, synchronize_session=False)
+            db.commit()
+            
+            if not updated and not db.query(SchedulerLease).filter(SchedulerLease.name == self.name).first():
+                # 처음 실행 - Lease 행 생성 (동시에 생성하면 기본 키 충돌로 한 인스턴스만 성공)
+                db.add(SchedulerLease(name=self.name, holder=self.holder_id, acquired_at=now, expires_at=expires_at))
+                db.commit()
+                updated = 1
+            elif updated and not was_leader:
+                db.query(SchedulerLease).filter(
+                    SchedulerLease.name == self.name,
+                    SchedulerLease.holder == self.holder_id
+                ).update({'acquired_at': now}, synchronize_session=False)
+                db.commit()
+        except IntegrityError:
+            db.rollback()
+            updated = 0
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to renew scheduler lease '{self.name}': {str(e)}")
+            updated = 0
+        finally:
+            db.close()
+        
+        with self._lock:
+            self._expires_at = expires_at if updated else None
+        
+        if updated and not was_leader:
+            print(f"👑 Acquired scheduler lease '{self.name}' ({self.holder_id})")
+        elif not updated and was_leader:
+            print(f"⚠️ Lost scheduler lease '{self.name}' ({self.holder_id})")
+        return bool(updated)
+    
+    def release(self):
+        """Lease 반납 (정상 종료 시 다른 인스턴스가 만료를 기다리지 않고 바로 가져가도록)"""
+        with self._lock:
+            self._expires_at = None
+        
+        db = next(get_db())
+        try:
+            db.query(SchedulerLease).filter(
+                SchedulerLease.name == self.name,
+                SchedulerLease.holder == self.holder_id
+            ).update({'expires_at': None}, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to release scheduler lease '{self.name}': {str(e)}")
+        finally:
+            db.close()
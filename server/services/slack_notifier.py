@@ -1,17 +1,84 @@
 # server/services/slack_notifier.py
 from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
+import asyncio
 import os
 import json
 from datetime import datetime
 
 class SlackNotifier:
-    def __init__(self):
-        self.client = WebClient(token=os.getenv('SLACK_TOKEN'))
+    def __init__(self, timeout=None):
+        """
+        Args:
+            timeout: 요청별 timeout (초, 기본값: slack_sdk 기본값 30초) - 파이프라인 제한 시간이 가까우면 남은 시간으로 줄임
+        """
+        self.client = WebClient(token=os.getenv('SLACK_TOKEN'), timeout=int(timeout or 30))
+        # 비동기 파이프라인(AsyncPipelineRunner)용 클라이언트
+        self.async_client = AsyncWebClient(token=os.getenv('SLACK_TOKEN'), timeout=int(timeout or 30))
         self.channel = os.getenv('SLACK_CHANNEL', '#test-alerts')
     
     def send_test_report(self, pr, test_results, timestamp, pr_url=None):
         """테스트 결과 리포트 전송"""
+        message_blocks = self._build_report_blocks(pr, test_results, pr_url)
+        
+        # 슬랙 메시지 전송
+        try:
+            response = self.client.chat_postMessage(
+                channel=self.channel,
+                blocks=message_blocks,
+                text=f"E2E Test Report for PR #{pr.number}"
+            )
+            
+            # 스크린샷 업로드
+            self._upload_screenshots(test_results, response['ts'])
+            
+            # 상세 리포트 JSON 파일 업로드
+            self._upload_detailed_report(pr, test_results, timestamp, response['ts'])
+        
+        except SlackApiError as e:
+            print(f"Slack API Error: {e.response['error']}")
+    
+    async def send_test_report_async(self, pr, test_results, timestamp, pr_url=None):
+        """send_test_report의 asyncio 버전 (스크린샷은 동시에 업로드)"""
+        message_blocks = self._build_report_blocks(pr, test_results, pr_url)
+        
+        try:
+            response = await self.async_client.chat_postMessage(
+                channel=self.channel,
+                blocks=message_blocks,
+                text=f"E2E Test Report for PR #{pr.number}"
+            )
+            thread_ts = response['ts']
+            
+            uploads = [
+                self._upload_file_async(
+                    result['screenshot_path'],
+                    f"{result['scenario_name']} - Screenshot",
+                    thread_ts
+                )
+                for result in test_results if result.get('screenshot_path')
+            ]
+            report_path = self._write_report_file(pr, test_results, timestamp)
+            uploads.append(self._upload_file_async(report_path, f"Detailed Report - {timestamp}", thread_ts))
+            await asyncio.gather(*uploads)
+        
+        except SlackApiError as e:
+            print(f"Slack API Error: {e.response['error']}")
+    
+    async def _upload_file_async(self, path, title, thread_ts):
+        try:
+            await self.async_client.files_upload_v2(
+                channel=self.channel,
+                file=path,
+                title=title,
+                thread_ts=thread_ts
+            )
+        except Exception as e:
+            print(f"File upload error ({title}): {e}")
+    
+    def _build_report_blocks(self, pr, test_results, pr_url=None):
+        """테스트 결과 리포트 메시지 블록 작성"""
         
         # 통계 계산
         total = len(test_results)
@@ -100,22 +167,7 @@ class SlackNotifier:
                         }
                     })
         
-        # 슬랙 메시지 전송
-        try:
-            response = self.client.chat_postMessage(
-                channel=self.channel,
-                blocks=message_blocks,
-                text=f"E2E Test Report for PR #{pr.number}"
-            )
-            
-            # 스크린샷 업로드
-            self._upload_screenshots(test_results, response['ts'])
-            
-            # 상세 리포트 JSON 파일 업로드
-            self._upload_detailed_report(pr, test_results, timestamp, response['ts'])
-            
-        except SlackApiError as e:
-            print(f"Slack API Error: {e.response['error']}")
+        return message_blocks
     
     def _upload_screenshots(self, test_results, thread_ts):
         """스크린샷 업로드"""
@@ -133,6 +185,20 @@ class SlackNotifier:
     
     def _upload_detailed_report(self, pr, test_results, timestamp, thread_ts):
         """상세 리포트 JSON 업로드"""
+        report_path = self._write_report_file(pr, test_results, timestamp)
+        
+        try:
+            self.client.files_upload_v2(
+                channel=self.channel,
+                file=report_path,
+                title=f"Detailed Report - {timestamp}",
+                thread_ts=thread_ts
+            )
+        except Exception as e:
+            print(f"Report upload error: {e}")
+    
+    def _write_report_file(self, pr, test_results, timestamp):
+        """상세 리포트 JSON 파일 저장 후 경로 반환"""
         report = {
             "timestamp": timestamp,
             "pr": {
@@ -150,16 +216,7 @@ class SlackNotifier:
         report_path = os.path.join(REPORTS_DIR, f"report_{timestamp}.json")
         with open(report_path, 'w', encoding='utf-8') as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
-        
-        try:
-            self.client.files_upload_v2(
-                channel=self.channel,
-                file=report_path,
-                title=f"Detailed Report - {timestamp}",
-                thread_ts=thread_ts
-            )
-        except Exception as e:
-            print(f"Report upload error: {e}")
+        return report_path
     
     def send_error_notification(self, pr, error_message):
         """에러 알림 전송"""
@@ -170,4 +227,13 @@ class SlackNotifier:
             )
         except SlackApiError as e:
             print(f"Slack error notification failed: {e}")
-
+    
+    async def send_error_notification_async(self, pr, error_message):
+        """send_error_notification의 asyncio 버전"""
+        try:
+            await self.async_client.chat_postMessage(
+                channel=self.channel,
+                text=f"🚨 *NightWatch Pipeline Error*\n\nPR: #{pr.number} {pr.title}\nError: ```{error_message}```"
+            )
+        except SlackApiError as e:
+            print(f"Slack error notification failed: {e}")
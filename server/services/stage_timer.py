@@ -0,0 +1,110 @@
+# server/services/stage_timer.py
+"""
+파이프라인 단계별 소요 시간 측정
+
+PR 실행이 느릴 때 diff 조회, 시나리오 생성, 브라우저 실행, Vision 검증, Slack 알림 중 어디서 시간이 걸렸는지
+알 수 있도록 단계별 / 시나리오별 / 액션별 소요 시간(ms)을 구조화해 Test.stage_timings에 저장한다.
+"""
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+STAGE_DIFF_FETCH = 'diff_fetch'
+STAGE_SCENARIO_GENERATION = 'scenario_generation'
+STAGE_BROWSER_EXECUTION = 'browser_execution'
+STAGE_VISION_VALIDATION = 'vision_validation'
+STAGE_SLACK_NOTIFICATION = 'slack_notification'
+PIPELINE_STAGES = [
+    STAGE_DIFF_FETCH, STAGE_SCENARIO_GENERATION, STAGE_BROWSER_EXECUTION,
+    STAGE_VISION_VALIDATION, STAGE_SLACK_NOTIFICATION
+]
+
+
+def elapsed_ms(started: float) -> int:
+    """time.monotonic()으로 기록한 시작 시각부터 지금까지의 시간 (ms)"""
+    return int((time.monotonic() - started) * 1000)
+
+
+class StageTimer:
+    """파이프라인 실행 하나의 단계별 소요 시간 기록"""
+    
+    def __init__(self):
+        self._started = time.monotonic()
+        self.stages = {}  # 단계 이름 -> ms (같은 단계를 여러 번 실행하면 합산)
+        self.scenarios = []
+    
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록의 소요 시간을 단계로 기록 (예외로 중단돼도 기록)"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0) + elapsed_ms(started)
+    
+    def record_scenarios(self, test_results: Iterable[Dict]):
+        """시나리오 실행 결과에 기록된 시나리오/액션/검증 소요 시간 수집 (이전 커밋에서 이어받은 결과는 제외)"""
+        self.scenarios = [
+            {
+                'scenario_name': result.get('scenario_name'),
+                'duration_ms': result.get('duration_ms'),
+                'validation_ms': result.get('validation_ms'),
+                'actions': [
+                    {
+                        'type': (action_result.get('action') or {}).get('type'),
+                        'duration_ms': action_result.get('duration_ms')
+                    }
+                    for action_result in result.get('actions_executed', [])
+                ]
+            }
+            for result in test_results
+            if not result.get('carried_forward_from')
+        ]
+    
+    def as_dict(self) -> Dict:
+        return {
+            'total_ms': elapsed_ms(self._started),
+            'stages': dict(self.stages),
+            'scenarios': self.scenarios
+        }
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """정렬된 값의 백분위수 (선형 보간)"""
+    if not values:
+        return None
+    values = sorted(values)
+    position = (len(values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def aggregate_stage_timings(rows: Iterable) -> Dict:
+    """(repo_full_name, stage_timings) 목록을 레포지토리/단계별 p50/p95로 집계
+    
+    Returns:
+        dict: {repo_full_name: {stage: {'count', 'p50_ms', 'p95_ms', 'max_ms'}}} (전체 소요 시간은 'total' 단계)
+    """
+    samples = {}
+    for repo_full_name, stage_timings in rows:
+        if not stage_timings:
+            continue
+        repo_samples = samples.setdefault(repo_full_name, {})
+        for stage, duration in (stage_timings.get('stages') or {}).items():
+            repo_samples.setdefault(stage, []).append(duration)
+        if stage_timings.get('total_ms') is not None:
+            repo_samples.setdefault('total', []).append(stage_timings['total_ms'])
+    
+    return {
+        repo_full_name: {
+            stage: {
+                'count': len(durations),
+                'p50_ms': percentile(durations, 50),
+                'p95_ms': percentile(durations, 95),
+                'max_ms': max(durations)
+            }
+            for stage, durations in repo_samples.items()
+        }
+        for repo_full_name, repo_samples in samples.items()
+    }
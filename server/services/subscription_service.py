@@ -3,7 +3,8 @@
 레포지토리 구독 관리 서비스
 """
 from typing import List, Dict
-from datetime import datetime
+from datetime import datetime, timedelta
+from sqlalchemy import or_
 from ..models import Subscription, get_db
 from .pat_auth_service import PATAuthService
 
@@ -164,6 +165,19 @@ class SubscriptionService:
         finally:
             db.close()
     
+    def get_due_subscriptions(self, now: datetime = None) -> List[Subscription]:
+        """다음 Polling 예정 시간이 지난 활성 구독 조회 (적응형 스케줄링용)"""
+        now = now or datetime.utcnow()
+        db = next(get_db())
+        try:
+            return db.query(Subscription).filter(
+                Subscription.is_active == True,
+                Subscription.auto_test == True,
+                or_(Subscription.next_poll_at == None, Subscription.next_poll_at <= now)
+            ).all()
+        finally:
+            db.close()
+    
     def delete_subscription(self, subscription_id: int, user_id: str) -> bool:
         """구독 삭제 (비활성화)"""
         db = next(get_db())
@@ -185,8 +199,15 @@ class SubscriptionService:
         finally:
             db.close()
     
-    def update_last_polled(self, subscription_id: int):
-        """마지막 Polling 시간 업데이트"""
+    def update_last_polled(self, subscription_id: int, polled_at: datetime = None, full_scan: bool = False, next_interval_seconds: int = None):
+        """마지막 Polling 시간 업데이트
+        
+        Args:
+            polled_at: Polling을 시작한 시간 (조회 도중 업데이트된 PR을 놓치지 않도록 시작 시각 기준)
+            full_scan: 열린 PR 전체를 확인한 경우 True
+            next_interval_seconds: 다음 Polling까지의 간격 (주어지면 next_poll_at도 갱신)
+        """
+        polled_at = polled_at or datetime.utcnow()
         db = next(get_db())
         try:
             subscription = db.query(Subscription).filter(
@@ -194,13 +215,56 @@ class SubscriptionService:
             ).first()
             
             if subscription:
-                subscription.last_polled_at = datetime.utcnow()
+                subscription.last_polled_at = polled_at
+                if full_scan:
+                    subscription.last_full_scan_at = polled_at
+                if next_interval_seconds:
+                    subscription.poll_interval_seconds = next_interval_seconds
+                    subscription.next_poll_at = polled_at + timedelta(seconds=next_interval_seconds)
                 db.commit()
         except Exception as e:
             db.rollback()
         finally:
             db.close()
     
+    def defer_polling(self, subscription_id: int, until: datetime):
+        """다음 Polling을 지정한 시각 이후로 미룸 (Rate Limit 리셋 대기 등)"""
+        db = next(get_db())
+        try:
+            subscription = db.query(Subscription).filter(
+                Subscription.id == subscription_id
+            ).first()
+            
+            if subscription and (not subscription.next_poll_at or subscription.next_poll_at < until):
+                subscription.next_poll_at = until
+                db.commit()
+        except Exception as e:
+            db.rollback()
+        finally:
+            db.close()
+    
+    def record_webhook(self, repo_full_name: str, received_at: datetime = None) -> int:
+        """레포지토리의 활성 구독에 Webhook 수신 시간 기록 (Polling 스케줄러가 Webhook 정상 여부 판단에 사용)
+        
+        Returns:
+            int: 갱신된 구독 수
+        """
+        received_at = received_at or datetime.utcnow()
+        db = next(get_db())
+        try:
+            updated = db.query(Subscription).filter(
+                Subscription.repo_full_name == repo_full_name,
+                Subscription.is_active == True
+            ).update({'last_webhook_at': received_at}, synchronize_session=False)
+            db.commit()
+            return updated
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to record webhook for {repo_full_name}: {str(e)}")
+            return 0
+        finally:
+            db.close()
+    
     def update_subscription_pat(self, subscription_id: int, user_id: str, pat: str) -> Dict:
         """기존 구독에 PAT 추가/업데이트"""
         # PAT 검증
@@ -302,6 +366,8 @@ class SubscriptionService:
             'test_options': subscription.test_options,
             'base_url': subscription.base_url,
             'created_at': subscription.created_at.isoformat() if subscription.created_at else None,
-            'last_polled_at': subscription.last_polled_at.isoformat() if subscription.last_polled_at else None
+            'last_polled_at': subscription.last_polled_at.isoformat() if subscription.last_polled_at else None,
+            'next_poll_at': subscription.next_poll_at.isoformat() if subscription.next_poll_at else None,
+            'last_webhook_at': subscription.last_webhook_at.isoformat() if subscription.last_webhook_at else None
         }
 
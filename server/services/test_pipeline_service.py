@@ -4,13 +4,22 @@
 """
 import os
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from .k8s_deployer import K8sDeployer
 from .local_deployer import LocalDeployer
 from .pr_analyzer_service import PRAnalyzerService
 from .browser_executor import BrowserExecutor
+from .parallel_browser_executor import ParallelBrowserExecutor
 from .vision_validator import VisionValidator
+from .validation_pool import ValidationPool
+from .pipeline_checkpoint_service import STAGE_SCENARIOS, needs_validation
 from .slack_notifier import SlackNotifier
+from .run_registry import PipelineCancelled, PipelineTimeout
+from .stage_timer import (
+    StageTimer, STAGE_SCENARIO_GENERATION, STAGE_BROWSER_EXECUTION,
+    STAGE_VISION_VALIDATION, STAGE_SLACK_NOTIFICATION
+)
 
 class TestPipelineService:
     """테스트 파이프라인 서비스"""
@@ -18,7 +27,7 @@ class TestPipelineService:
     def __init__(self, base_url=None):
         self.base_url = base_url or os.getenv('BASE_URL', 'localhost:5173')
     
-    def run_test_pipeline(self, pr, pr_diff, branch_name, base_url=None):
+    def run_test_pipeline(self, pr, pr_diff, branch_name, base_url=None, cancel_token=None, timer=None, checkpoint=None, progress=None):
         """
         테스트 파이프라인 실행
         
@@ -27,10 +36,30 @@ class TestPipelineService:
             pr_diff: PR diff 정보
             branch_name: 브랜치 이름
             base_url: 사용하지 않음 (항상 preview-dev.oliveyoung.com 사용)
+            cancel_token: 취소 신호 (새 커밋으로 대체되면 단계 사이에서 중단하고 PipelineCancelled 발생,
+                제한 시간이 설정되어 있으면 초과 시 PipelineTimeout 발생 - 그때까지의 결과는 checkpoint에 이미 기록됨)
+            timer: 단계별 소요 시간 기록 (diff 조회 등 호출한 쪽의 단계도 함께 기록할 때 전달, 결과의 stage_timings로 반환)
+            checkpoint: PipelineCheckpointService (있으면 끝난 단계 결과를 저장하고, 같은 커밋의 재시도에서 저장된 단계를 건너뜀)
+            progress: TestProgressRecorder (있으면 시나리오가 끝날 때마다 테스트 레코드의 진행 개수를 갱신)
         """
+        timer = timer or StageTimer()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         pr_number = pr.number
         
+        def check_cancelled():
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+        
+        @contextmanager
+        def stage(name):
+            # 단계 소요 시간 기록 + 단계 제한 시간 적용
+            with timer.stage(name):
+                if not cancel_token:
+                    yield
+                    return
+                with cancel_token.stage(name):
+                    yield
+        
         try:
             # 1. PR 배포 URL 결정
             # preview 브랜치만 테스트 대상이므로 항상 preview-dev.oliveyoung.com 사용
@@ -43,57 +72,113 @@ class TestPipelineService:
             print(f"🌐 Using fixed preview URL for preview branch")
             print(f"   ✅ Generated PR URL: {pr_full_url}")
             
-            # 2. PR 분석 및 시나리오 생성
-            print("📝 Analyzing PR with Gemini...")
-            analyzer = PRAnalyzerService(base_url="preview-dev.oliveyoung.com")
-            # preview 브랜치는 항상 preview-dev.oliveyoung.com 사용
-            scenarios = analyzer.analyze_and_generate_scenarios(pr_diff, pr_url=pr_full_url)
-            
-            print(f"✓ Generated {len(scenarios)} test scenarios")
-            
-            # 3. Browser MCP를 사용하여 브라우저 테스트 실행
-            print("🌐 Executing browser tests with Browser MCP...")
-            from ..config import VIDEOS_DIR
-            os.makedirs(VIDEOS_DIR, exist_ok=True)
-            executor = BrowserExecutor(
-                video_dir=os.path.join(VIDEOS_DIR, f"test_{timestamp}"),
-                use_mcp=True,
-                base_url=self.base_url
-            )
-            test_results = []
+            # 2. PR 분석 및 시나리오 생성 (같은 커밋에서 이미 생성한 시나리오가 있으면 재사용)
+            check_cancelled()
+            scenarios = checkpoint.load(STAGE_SCENARIOS) if checkpoint else None
+            if scenarios is not None:
+                print(f"♻️ Reusing {len(scenarios)} checkpointed test scenarios")
+            else:
+                print("📝 Analyzing PR with Gemini...")
+                analyzer = PRAnalyzerService(base_url="preview-dev.oliveyoung.com")
+                with stage(STAGE_SCENARIO_GENERATION):
+                    # preview 브랜치는 항상 preview-dev.oliveyoung.com 사용
+                    scenarios = analyzer.analyze_and_generate_scenarios(pr_diff, pr_url=pr_full_url)
+                    # 응답을 기다리는 동안 제한 시간이 지났으면 결과를 저장하지 않고 중단
+                    check_cancelled()
+                if checkpoint:
+                    checkpoint.save(STAGE_SCENARIOS, scenarios)
+                
+                print(f"✓ Generated {len(scenarios)} test scenarios")
             
-            for scenario in scenarios:
-                # preview 브랜치는 항상 preview-dev.oliveyoung.com 사용
-                result = executor.execute_scenario(scenario, pr_url=pr_full_url)
-                test_results.append(result)
-            
-            # 4. Vision API로 검증
-            print("👁️ Validating with Gemini Vision...")
-            validator = VisionValidator()
-            
-            for result in test_results:
-                if result['success'] and result.get('screenshot'):
-                    validation = validator.validate_screenshot(
-                        result['screenshot'],
-                        result['expected_result']
-                    )
-                    result['validation'] = validation
+            # 3~4. 브라우저 테스트 실행 + Vision API 검증
+            # 시나리오가 끝날 때마다 스크린샷을 검증 워커에 넘겨 다음 시나리오 실행과 겹치게 처리
+            check_cancelled()
+            completed = checkpoint.load_scenario_results() if checkpoint else {}
+            pending = [(index, scenario) for index, scenario in enumerate(scenarios) if index not in completed]
+            if completed:
+                print(f"♻️ Reusing {len(completed)} checkpointed scenario result(s)")
+            if progress:
+                progress.start(len(scenarios), sum(
+                    1 for result in completed.values() if not needs_validation(result)
+                ))
             
-            executor.close()
+            validation_pool = ValidationPool()
+            positions = {id(scenario): index for index, scenario in pending}
+            
+            def submit_validation(index, scenario, result):
+                def on_validated(validated):
+                    if checkpoint:
+                        checkpoint.save_validation(index, validated['validation'])
+                    if progress:
+                        progress.record()
+                validation_pool.submit(scenario, result, on_validated=on_validated)
+            
+            def on_result(scenario, result):
+                index = positions[id(scenario)]
+                if checkpoint:
+                    checkpoint.save_execution(index, result)
+                if needs_validation(result):
+                    submit_validation(index, scenario, result)
+                elif progress:
+                    progress.record()
+            
+            try:
+                # 실행은 끝났지만 검증 전에 중단된 시나리오는 검증만 다시 수행
+                for index, result in completed.items():
+                    if needs_validation(result):
+                        submit_validation(index, scenarios[index], result)
+                
+                executed = []
+                if pending:
+                    with stage(STAGE_BROWSER_EXECUTION):
+                        # preview 브랜치는 항상 preview-dev.oliveyoung.com 사용
+                        executed = self._execute_scenarios(
+                            [scenario for _, scenario in pending], pr_full_url, f"test_{timestamp}", cancel_token,
+                            on_result=on_result
+                        )
+                print("👁️ Waiting for Gemini Vision validation...")
+                # 브라우저 실행과 겹치지 않고 남은 검증 대기 시간 (검증별 시간은 시나리오의 validation_ms)
+                with stage(STAGE_VISION_VALIDATION):
+                    validation_pool.wait(cancel_token)
+            finally:
+                validation_pool.shutdown()
+            
+            executed_by_index = dict(zip([index for index, _ in pending], executed))
+            test_results = [
+                completed[index] if index in completed else executed_by_index[index]
+                for index in range(len(scenarios))
+            ]
+            timer.record_scenarios(test_results)
             
             # 5. 리포트 생성 및 슬랙 알림
+            check_cancelled()
             print("📤 Sending Slack notification...")
-            notifier = SlackNotifier()
-            notifier.send_test_report(pr, test_results, timestamp, pr_url=pr_full_url)
+            with stage(STAGE_SLACK_NOTIFICATION):
+                notifier = SlackNotifier(timeout=cancel_token.timeout(30) if cancel_token else None)
+                notifier.send_test_report(pr, test_results, timestamp, pr_url=pr_full_url)
             
             print("✅ Test pipeline completed!")
             
             return {
                 'success': True,
                 'test_results': test_results,
-                'pr_url': pr_full_url
+                'pr_url': pr_full_url,
+                'stage_timings': timer.as_dict()
             }
             
+        except PipelineTimeout as e:
+            # 제한 시간 초과 - 호출한 쪽에서 부분 결과와 함께 'timeout'으로 기록
+            print(f"⏱️ Pipeline timed out for PR #{pr_number}: {str(e)}")
+            try:
+                # 제한 시간이 이미 지났으므로 짧은 timeout으로 알림만 시도
+                SlackNotifier(timeout=5).send_error_notification(pr, f"Timeout: {str(e)}")
+            except Exception:
+                pass
+            raise
+        except PipelineCancelled as e:
+            # 더 새로운 커밋의 테스트가 예약됨 - 결과가 의미 없으므로 알림 없이 중단
+            print(f"🛑 Pipeline cancelled for PR #{pr_number}: {str(e)}")
+            raise
         except Exception as e:
             print(f"❌ Pipeline error: {str(e)}")
             # 에러도 슬랙으로 알림
@@ -113,15 +198,59 @@ class TestPipelineService:
             
             return {
                 'success': False,
-                'error': str(e)
+                'error': str(e),
+                'stage_timings': timer.as_dict()
             }
     
-    def get_pr_diff(self, pr):
-        """PR의 변경사항 가져오기"""
+    def _execute_scenarios(self, scenarios, pr_url, run_name, cancel_token=None, on_result=None):
+        """
+        시나리오 목록을 브라우저에서 실행
+        
+        SCENARIO_CONCURRENCY가 2 이상이면 Playwright 브라우저 하나의 독립된 컨텍스트에서 병렬로 실행하고,
+        아니면 Browser MCP로 순차 실행한다. 결과는 어느 쪽이든 시나리오 순서대로 반환된다.
+        
+        Args:
+            run_name: 비디오 저장 디렉토리 이름
+            on_result: 시나리오 하나가 끝날 때마다 호출할 함수 (scenario, result) - 검증 대기열 추가 등
+        """
+        from ..config import VIDEOS_DIR, SCENARIO_CONCURRENCY
+        os.makedirs(VIDEOS_DIR, exist_ok=True)
+        video_dir = os.path.join(VIDEOS_DIR, run_name)
+        
+        if SCENARIO_CONCURRENCY > 1 and len(scenarios) > 1:
+            print(f"🌐 Executing {len(scenarios)} browser tests in parallel ({SCENARIO_CONCURRENCY} contexts)...")
+            executor = ParallelBrowserExecutor(video_dir=video_dir, concurrency=SCENARIO_CONCURRENCY)
+            return executor.run_scenarios(scenarios, pr_url=pr_url, cancel_token=cancel_token, on_result=on_result)
+        
+        print("🌐 Executing browser tests with Browser MCP...")
+        executor = BrowserExecutor(
+            video_dir=video_dir,
+            use_mcp=True,
+            base_url=self.base_url
+        )
+        try:
+            results = []
+            for scenario in scenarios:
+                result = executor.execute_scenario(scenario, pr_url=pr_url, cancel_token=cancel_token)
+                if on_result:
+                    on_result(scenario, result)
+                results.append(result)
+            return results
+        finally:
+            # 취소나 에러로 중단된 경우에도 브라우저 종료
+            try:
+                executor.close()
+            except Exception:
+                pass
+    
+    def get_pr_diff(self, pr, cancel_token=None):
+        """PR의 변경사항 가져오기 (cancel_token이 있으면 파일 목록 페이지 사이에서 취소/제한 시간 확인)"""
         files = pr.get_files()
         diff_content = []
         
         for file in files:
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
             diff_content.append({
                 'filename': file.filename,
                 'status': file.status,
@@ -171,32 +300,17 @@ class TestPipelineService:
 
     def run_existing_scenarios(self, scenarios, pr_url=None):
         """
-        이미 생성된 시나리오 목록을 순차적으로 실행
+        이미 생성된 시나리오 목록을 실행 (SCENARIO_CONCURRENCY에 따라 순차/병렬)
         """
-        from ..config import VIDEOS_DIR
-        import os
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        os.makedirs(VIDEOS_DIR, exist_ok=True)
-        
-        executor = BrowserExecutor(
-            video_dir=os.path.join(VIDEOS_DIR, f"regenerated_{timestamp}"),
-            use_mcp=True,
-            base_url=self.base_url
-        )
-        results = []
-        validator = VisionValidator()
-        
+        validation_pool = ValidationPool()
         try:
-            for scenario in scenarios:
-                result = executor.execute_scenario(scenario, pr_url=pr_url)
-                if result['success'] and result.get('screenshot'):
-                    validation = validator.validate_screenshot(
-                        result['screenshot'],
-                        scenario.get('expected_result', '')
-                    )
-                    result['validation'] = validation
-                results.append(result)
+            results = self._execute_scenarios(
+                scenarios, pr_url, f"regenerated_{timestamp}",
+                on_result=validation_pool.submit
+            )
+            validation_pool.wait()
             return results
         finally:
-            executor.close()
+            validation_pool.shutdown()
 
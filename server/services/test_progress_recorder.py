@@ -0,0 +1,69 @@
+# server/services/test_progress_recorder.py
+"""
+테스트 실행 중 진행 상황 기록
+
+파이프라인이 끝날 때까지 기다리지 않고 시나리오가 끝날 때마다(검증 포함) 진행 개수(scenarios_completed / scenarios_total)를
+갱신해 대시보드가 실행 중에도 진행 상황을 보여줄 수 있게 한다.
+시나리오 결과 자체는 파이프라인 체크포인트에 시나리오별 행(execution:<index>, validation:<index>)으로 이미 저장되므로
+Test.test_results에 다시 쓰지 않고, 실행 중인 테스트의 부분 결과는 조회할 때 체크포인트에서 만든다.
+(결과마다 test_results JSON 전체를 다시 쓰면 시나리오 수에 대해 O(n²) 쓰기가 됨)
+파이프라인이 끝나면 _finish_test가 시나리오 순서대로의 전체 결과를, 시간 초과/실패하면 체크포인트의 부분 결과를 기록한다.
+"""
+import threading
+from typing import Dict, List, Optional
+from ..models import Test, get_db
+from .pipeline_checkpoint_service import PipelineCheckpointService
+
+
+class TestProgressRecorder:
+    """테스트 하나의 진행 개수 기록 (검증 워커 스레드에서도 호출됨)"""
+    
+    def __init__(self, test_id: int):
+        self.test_id = test_id
+        self._lock = threading.Lock()
+    
+    def start(self, total: int, finished: int = 0):
+        """시나리오 수 기록 (체크포인트에서 재사용한 결과가 있으면 완료된 개수로 함께 기록)"""
+        with self._lock:
+            self._update(lambda test: self._set(test, total, finished))
+    
+    def record(self):
+        """시나리오 하나가 끝남"""
+        with self._lock:
+            self._update(lambda test: self._set(test, test.scenarios_total, (test.scenarios_completed or 0) + 1))
+    
+    def _set(self, test: Test, total: int, completed: int):
+        test.scenarios_total = total
+        test.scenarios_completed = completed
+    
+    def _update(self, apply):
+        db = next(get_db())
+        try:
+            test = db.query(Test).filter(Test.id == self.test_id).first()
+            # 이미 종료/대체된 테스트는 건드리지 않음
+            if not test or test.status not in ['pending', 'running']:
+                return
+            apply(test)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to record progress for test {self.test_id}: {str(e)}")
+        finally:
+            db.close()
+    
+    @staticmethod
+    def results_for(test: Test) -> Optional[List[Dict]]:
+        """
+        API로 반환할 테스트 결과
+        
+        결과가 기록되지 않은 실행 중인 테스트는 체크포인트에서 끝난 시나리오의 결과를 만든다.
+        (부분 결과에는 스크린샷 base64를 제외, 파일은 screenshot_path에 있음)
+        """
+        if test.test_results is not None or test.status not in ['pending', 'running'] or not test.head_sha:
+            return test.test_results
+        
+        checkpoint = PipelineCheckpointService(test.id, test.subscription_id, test.pr_number, test.head_sha)
+        return [
+            {key: value for key, value in result.items() if key != 'screenshot'}
+            for result in checkpoint.load_finished_results()
+        ]
@@ -0,0 +1,76 @@
+# server/services/validation_pool.py
+"""
+브라우저 실행과 겹쳐서 수행하는 Vision 검증 워커 풀
+
+시나리오 하나가 끝나면 스크린샷을 바로 검증 워커에 넘기고 브라우저는 다음 시나리오를 실행한다.
+LLM 호출 대기와 브라우저 실행이 겹치므로 PR당 소요 시간이 (브라우저 + 검증)에서 max(브라우저, 검증)에 가까워진다.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict
+from ..config import VISION_VALIDATION_WORKERS
+from .stage_timer import elapsed_ms
+from .vision_validator import VisionValidator
+
+
+class ValidationPool:
+    """시나리오 실행 결과의 스크린샷을 백그라운드에서 검증 (생산자: 브라우저 실행, 소비자: 검증 워커)"""
+    
+    def __init__(self, max_workers: int = None, validator: VisionValidator = None):
+        self.validator = validator or VisionValidator()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or VISION_VALIDATION_WORKERS,
+            thread_name_prefix='vision-validation'
+        )
+        self._futures = []
+        self._lock = threading.Lock()
+    
+    def submit(self, scenario: Dict, result: Dict, on_validated: Callable[[Dict], None] = None):
+        """실행이 끝난 시나리오 결과를 검증 대기열에 추가 (성공했고 스크린샷이 있는 결과만)
+        
+        검증 결과는 완료되면 result['validation']에 저장되고, on_validated가 있으면 result를 인자로 호출된다.
+        """
+        if not result['success'] or not result.get('screenshot'):
+            return
+        
+        expected_result = result.get('expected_result') or scenario.get('expected_result', '')
+        future = self._executor.submit(self._validate, result, expected_result, on_validated)
+        with self._lock:
+            self._futures.append(future)
+    
+    def wait(self, cancel_token=None):
+        """대기열의 모든 검증이 끝날 때까지 대기 (취소되면 남은 검증을 버리고 PipelineCancelled 발생)"""
+        with self._lock:
+            pending = set(self._futures)
+        
+        while pending:
+            if cancel_token and cancel_token.is_cancelled:
+                for future in pending:
+                    future.cancel()
+                cancel_token.raise_if_cancelled()
+            _, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+    
+    def shutdown(self):
+        """워커 종료 (시작되지 않은 검증은 취소)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _validate(self, result: Dict, expected_result: str, on_validated: Callable[[Dict], None] = None):
+        started = time.monotonic()
+        try:
+            result['validation'] = self.validator.validate_screenshot(result['screenshot'], expected_result)
+        except Exception as e:
+            # validate_screenshot은 자체적으로 예외를 처리하지만 모델 초기화 문제 등으로 실패해도 다른 검증은 계속
+            print(f"⚠️ Vision validation failed for {result.get('scenario_name')}: {str(e)}")
+            result['validation'] = {
+                'is_valid': False,
+                'confidence': 0.0,
+                'reason': f'검증 중 오류 발생: {str(e)}',
+                'issues': [str(e)],
+                'suggestions': []
+            }
+        finally:
+            result['validation_ms'] = elapsed_ms(started)
+        
+        if on_validated:
+            on_validated(result)
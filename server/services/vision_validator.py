@@ -17,11 +17,25 @@ class VisionValidator:
         """스크린샷이 예상 결과와 일치하는지 검증"""
         
         try:
-            # base64를 이미지 Part로 변환
-            image_data = base64.b64decode(screenshot_b64)
-            image_part = Part.from_image(image_bytes=image_data)
+            response = self.model.generate_content(self._build_contents(screenshot_b64, expected_result))
+            return self._parse_response(response.text)
+        except Exception as e:
+            return self._error_result(e)
+    
+    async def validate_screenshot_async(self, screenshot_b64, expected_result):
+        """validate_screenshot의 asyncio 버전 (이벤트 루프를 막지 않고 Vertex AI 호출)"""
+        try:
+            response = await self.model.generate_content_async(self._build_contents(screenshot_b64, expected_result))
+            return self._parse_response(response.text)
+        except Exception as e:
+            return self._error_result(e)
+    
+    def _build_contents(self, screenshot_b64, expected_result):
+        # base64를 이미지 Part로 변환
+        image_data = base64.b64decode(screenshot_b64)
+        image_part = Part.from_image(image_bytes=image_data)
 
-            prompt = f"""
+        prompt = f"""
 당신은 UI/UX 테스트 전문가입니다. 다음 스크린샷을 분석하고, 예상 결과와 일치하는지 검증해주세요.
 
 **예상 결과:**
@@ -48,27 +62,27 @@ class VisionValidator:
 JSON만 반환하세요 (마크다운 코드블록 없이).
 
 """
-            
-            response = self.model.generate_content([prompt, image_part])
-            response_text = response.text.strip()
-            
-            # 마크다운 코드블록 제거
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-            
-            validation_result = json.loads(response_text)
-            return validation_result
-            
-        except Exception as e:
-            print(f"Vision validation error: {e}")
-            return {
-                "is_valid": False,
-                "confidence": 0.0,
-                "reason": f"검증 중 오류 발생: {str(e)}",
-                "issues": [str(e)],
-                "suggestions": []
-            }
-
+        return [prompt, image_part]
+    
+    def _parse_response(self, response_text):
+        response_text = response_text.strip()
+        
+        # 마크다운 코드블록 제거
+        if response_text.startswith('```'):
+            response_text = response_text.split('```')[1]
+            if response_text.startswith('json'):
+                response_text = response_text[4:]
+            response_text = response_text.strip()
+        
+        validation_result = json.loads(response_text)
+        return validation_result
+    
+    def _error_result(self, e):
+        print(f"Vision validation error: {e}")
+        return {
+            "is_valid": False,
+            "confidence": 0.0,
+            "reason": f"검증 중 오류 발생: {str(e)}",
+            "issues": [str(e)],
+            "suggestions": []
+        }
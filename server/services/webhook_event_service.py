@@ -0,0 +1,225 @@
+# server/services/webhook_event_service.py
+"""
+GitHub Webhook 이벤트 저장 및 비동기 처리
+
+Webhook 요청 안에서 파이프라인을 실행하면 응답이 수 분 걸려 GitHub가 같은 이벤트를 재전송하므로,
+요청에서는 이벤트를 저장하고 작업 대기열에 넣은 뒤 바로 응답하고 워커가 나중에 처리한다.
+- 같은 X-GitHub-Delivery ID의 이벤트는 한 번만 저장/처리
+- 레포지토리를 구독한 사용자가 있으면 각 구독의 테스트로 예약 (Polling과 같은 테스트 기록/대기열 사용)
+- 구독이 없는 레포지토리는 기존처럼 GITHUB_TOKEN으로 파이프라인을 바로 실행
+"""
+import os
+from datetime import datetime
+from typing import Dict, Optional
+from github import Github
+from sqlalchemy.exc import IntegrityError
+from ..config import BASE_URL
+from ..models import Subscription, TestSummary, WebhookEvent, get_db
+from .k8s_deployer import K8sDeployer
+from .polling_service import PollingService
+from .pipeline_job_queue import JOB_TYPE_WEBHOOK_EVENT
+from .pipeline_worker_pool import JOB_PRIORITY_NEW, JOB_PRIORITY_UPDATE
+from .rate_limit_tracker import rate_limit_tracker
+from .run_registry import run_registry, resolve_deadlines, CancellationToken, PipelineCancelled, PipelineTimeout
+from .test_pipeline_service import TestPipelineService
+
+TEST_ACTIONS = ['opened', 'synchronize']
+CLEANUP_ACTIONS = ['closed', 'merged']
+
+
+class WebhookEventService:
+    """Webhook 이벤트 저장, 작업 대기열 추가, 워커에서의 처리"""
+    
+    def __init__(self, polling_service: PollingService = None):
+        self.polling_service = polling_service or PollingService()
+        self.subscription_service = self.polling_service.subscription_service
+        self.worker_pool = self.polling_service.worker_pool
+        self.worker_pool.register_job_handler(JOB_TYPE_WEBHOOK_EVENT, self._process_event_job)
+    
+    def accept(self, delivery_id: str, event_type: Optional[str], payload: Dict) -> Dict:
+        """이벤트 저장 후 처리가 필요하면 작업 대기열에 추가 (Webhook 요청 안에서 호출)
+        
+        Returns:
+            dict: {'status': 'queued' | 'ignored' | 'duplicate', 'event_id': int}
+        """
+        action = payload.get('action')
+        pull_request = payload.get('pull_request') or {}
+        repository = payload.get('repository') or {}
+        pr_number = pull_request.get('number')
+        
+        handled = bool(pull_request) and (action in TEST_ACTIONS or action in CLEANUP_ACTIONS)
+        
+        # 처리 대상이 아닌 이벤트나 재전송도 Webhook이 정상적으로 들어온다는 신호이므로 기록
+        if repository.get('full_name'):
+            self.subscription_service.record_webhook(repository['full_name'])
+        
+        db = next(get_db())
+        try:
+            event = WebhookEvent(
+                delivery_id=delivery_id,
+                event_type=event_type,
+                action=action,
+                repo_full_name=repository.get('full_name'),
+                pr_number=pr_number,
+                head_sha=(pull_request.get('head') or {}).get('sha'),
+                payload=payload,
+                status='queued' if handled else 'ignored',
+                processed_at=None if handled else datetime.utcnow()
+            )
+            db.add(event)
+            db.commit()
+            event_id = event.id
+        except IntegrityError:
+            # GitHub 재전송 (같은 Delivery ID) - 이미 저장된 이벤트
+            db.rollback()
+            existing = db.query(WebhookEvent).filter(WebhookEvent.delivery_id == delivery_id).first()
+            print(f"⏭️ Duplicate webhook delivery {delivery_id}, skipping")
+            return {'status': 'duplicate', 'event_id': existing.id if existing else None}
+        finally:
+            db.close()
+        
+        if not handled:
+            return {'status': 'ignored', 'event_id': event_id}
+        
+        priority = JOB_PRIORITY_UPDATE if action == 'synchronize' else JOB_PRIORITY_NEW
+        self.worker_pool.enqueue_webhook_event(event_id, pr_number, priority=priority)
+        print(f"📥 Queued webhook event {event_id} ({action}) for PR #{pr_number} in {repository.get('full_name')}")
+        return {'status': 'queued', 'event_id': event_id}
+    
+    def _process_event_job(self, job: Dict):
+        """작업 대기열에서 가져온 Webhook 이벤트 처리 (파이프라인 워커에서 실행)"""
+        event_id = job['webhook_event_id']
+        
+        db = next(get_db())
+        try:
+            event = db.query(WebhookEvent).filter(WebhookEvent.id == event_id).first()
+            if not event or event.status not in ['queued', 'processing']:
+                print(f"ℹ️ Webhook event {event_id} is no longer queued, skipping")
+                return
+            event.status = 'processing'
+            db.commit()
+            action = event.action
+            repo_full_name = event.repo_full_name
+            payload = event.payload
+        finally:
+            db.close()
+        
+        try:
+            if action in CLEANUP_ACTIONS:
+                status = self._cleanup_deployment(payload)
+            else:
+                status = self._schedule_tests(repo_full_name, payload, action, job.get('cancel_token'))
+        except PipelineTimeout as e:
+            # 다시 실행해도 같은 제한 시간에 걸리므로 재시도하지 않음
+            print(f"⏱️ Test pipeline timed out for webhook event {event_id}: {str(e)}")
+            self._finish_event(event_id, 'failed', str(e))
+            return
+        except PipelineCancelled as e:
+            print(f"🛑 Test pipeline cancelled for webhook event {event_id}: {str(e)}")
+            self._finish_event(event_id, 'processed', str(e))
+            return
+        except Exception as e:
+            print(f"❌ Webhook event {event_id} failed: {str(e)}")
+            self._finish_event(event_id, 'failed', str(e))
+            raise
+        
+        self._finish_event(event_id, status)
+    
+    def _cleanup_deployment(self, payload: Dict) -> str:
+        """PR이 닫히거나 머지될 때 배포 정리"""
+        pr_number = payload['pull_request']['number']
+        print(f"🧹 Cleaning up PR #{pr_number} deployment...")
+        
+        k8s_deployer = K8sDeployer(base_domain=BASE_URL)
+        k8s_deployer.cleanup_pr(pr_number)
+        return 'processed'
+    
+    def _schedule_tests(self, repo_full_name: str, payload: Dict, action: str, cancel_token: CancellationToken = None) -> str:
+        """PR이 열렸거나 업데이트된 이벤트 처리
+        
+        Returns:
+            str: 이벤트 최종 상태 ('processed' 또는 'ignored')
+        """
+        # Webhook payload의 pull_request는 REST 응답과 같은 형식
+        pr = self.polling_service.pr_fetcher._to_pr_dict(payload['pull_request'])
+        
+        subscriptions = self._get_subscriptions(repo_full_name)
+        if not subscriptions:
+            return self._run_unsubscribed_pipeline(repo_full_name, pr, cancel_token)
+        
+        job_priority = JOB_PRIORITY_UPDATE if action == 'synchronize' else JOB_PRIORITY_NEW
+        print(f"🔍 Scheduling PR #{pr['number']} in {repo_full_name} for {len(subscriptions)} subscription(s)")
+        # Webhook은 기존처럼 모든 브랜치의 PR을 테스트 (구독의 제외 브랜치만 적용, preview 브랜치 제한은 Polling에만 적용)
+        scheduled = [
+            self.polling_service.schedule_pr_test(subscription, pr, job_priority, preview_only=False)
+            for subscription in subscriptions
+        ]
+        return 'processed' if any(scheduled) else 'ignored'
+    
+    def _run_unsubscribed_pipeline(self, repo_full_name: str, pr: Dict, cancel_token: CancellationToken = None) -> str:
+        """구독이 없는 레포지토리는 GITHUB_TOKEN으로 파이프라인을 바로 실행 (테스트 기록 없음)"""
+        pr_number = pr['number']
+        head_sha = pr['head_sha']
+        
+        # 같은 커밋에 대한 테스트가 이미 끝났으면 스킵
+        if head_sha and self._has_finished_run(repo_full_name, pr_number, head_sha):
+            print(f"⏭️ Skipping PR #{pr_number} in {repo_full_name} (commit {head_sha[:7]} already tested)")
+            return 'ignored'
+        
+        print(f"🔍 Processing PR #{pr_number} in {repo_full_name}")
+        
+        token = os.getenv('GITHUB_TOKEN')
+        g = Github(token)
+        pull = g.get_repo(repo_full_name).get_pull(pr_number)
+        rate_limit_tracker.record_github_client(token, g)
+        
+        # 같은 PR의 이전 커밋에 대한 대기/실행 중인 테스트 취소 (Polling으로 예약된 테스트 포함)
+        run_registry.supersede(repo_full_name, pr_number, head_sha)
+        cancel_token = run_registry.register(repo_full_name, pr_number, head_sha, token=cancel_token)
+        # 구독 옵션이 없으므로 기본 제한 시간 적용
+        cancel_token.set_deadline(*resolve_deadlines())
+        try:
+            test_pipeline = TestPipelineService(base_url=BASE_URL)
+            pr_diff = test_pipeline.get_pr_diff(pull, cancel_token=cancel_token)
+            
+            test_pipeline.run_test_pipeline(pull, pr_diff, pr['branch'], cancel_token=cancel_token)
+        finally:
+            run_registry.unregister(cancel_token)
+        return 'processed'
+    
+    def _get_subscriptions(self, repo_full_name: str):
+        """레포지토리를 자동 테스트로 구독한 활성 구독"""
+        db = next(get_db())
+        try:
+            return db.query(Subscription).filter(
+                Subscription.repo_full_name == repo_full_name,
+                Subscription.is_active == True,
+                Subscription.auto_test == True
+            ).all()
+        finally:
+            db.close()
+    
+    def _has_finished_run(self, repo_full_name: str, pr_number: int, head_sha: str) -> bool:
+        """해당 커밋에 대해 끝까지 실행된 테스트 기록이 있는지 확인"""
+        db = next(get_db())
+        try:
+            return db.query(TestSummary.test_id).filter(
+                TestSummary.repo_full_name == repo_full_name,
+                TestSummary.pr_number == pr_number,
+                TestSummary.head_sha == head_sha,
+                TestSummary.finished_run == True
+            ).first() is not None
+        finally:
+            db.close()
+    
+    def _finish_event(self, event_id: int, status: str, error: Optional[str] = None):
+        db = next(get_db())
+        try:
+            event = db.query(WebhookEvent).filter(WebhookEvent.id == event_id).first()
+            if event:
+                event.status = status
+                event.error = error
+                event.processed_at = datetime.utcnow()
+                db.commit()
+        finally:
+            db.close()
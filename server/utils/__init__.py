@@ -1,5 +1,5 @@
 # Utils Package
-from .crypto import encrypt_pat, decrypt_pat, get_encryption_key
+from .crypto import encrypt_pat, decrypt_pat, get_encryption_key, get_encryption_keys, rotate_encrypted_pat
 
-__all__ = ['encrypt_pat', 'decrypt_pat', 'get_encryption_key']
+__all__ = ['encrypt_pat', 'decrypt_pat', 'get_encryption_key', 'get_encryption_keys', 'rotate_encrypted_pat']
 
@@ -1,48 +1,105 @@
 # server/utils/crypto.py
 """
 PAT 암호화/복호화 유틸리티
+
+키링(MultiFernet)은 프로세스에서 한 번만 만들어 재사용한다.
+- ENCRYPTION_KEYS: 쉼표로 구분한 키 목록 (첫 번째 키로 암호화하고 모든 키로 복호화하므로 키 교체 가능)
+- ENCRYPTION_KEY: 단일 키 (ENCRYPTION_KEYS가 없을 때 사용)
+
+키 교체: 새 키를 ENCRYPTION_KEYS 맨 앞에 추가하고 rotate_encryption_key.py로 저장된 PAT를 다시 암호화한 뒤 이전 키를 제거한다.
 """
 import os
 import base64
 import binascii
-from cryptography.fernet import Fernet
+import threading
+from typing import List
+from cryptography.fernet import Fernet, MultiFernet, InvalidToken
+
+_cipher = None
+_keys = None
+_lock = threading.Lock()
+
+def _normalize_key(key: str) -> bytes:
+    """Fernet 키 문자열 (이미 base64로 한 번 더 감싼 키도 허용)"""
+    try:
+        Fernet(key.encode())
+        return key.encode()
+    except (ValueError, binascii.Error):
+        return base64.b64decode(key)
+
+def get_encryption_keys() -> List[bytes]:
+    """
+    환경 변수에서 암호화 키 목록 가져오기 (첫 번째 키가 암호화용)
+    
+    키가 설정되지 않았으면 개발용 키를 프로세스에서 한 번만 생성한다.
+    (호출마다 새 키를 만들면 같은 프로세스에서 암호화한 PAT도 복호화할 수 없음)
+    """
+    global _keys
+    with _lock:
+        if _keys is not None:
+            return _keys
+        
+        raw_keys = [key.strip() for key in os.getenv('ENCRYPTION_KEYS', '').split(',') if key.strip()]
+        if not raw_keys and os.getenv('ENCRYPTION_KEY'):
+            raw_keys = [os.getenv('ENCRYPTION_KEY')]
+        
+        if not raw_keys:
+            print("⚠️ WARNING: ENCRYPTION_KEY not set. Generating new key for development.")
+            key = Fernet.generate_key().decode()
+            print(f"Generated key (save this to .env): {key}")
+            raw_keys = [key]
+        
+        _keys = [_normalize_key(key) for key in raw_keys]
+        return _keys
 
 def get_encryption_key():
     """
-    환경 변수에서 암호화 키 가져오기 또는 생성
+    암호화에 사용하는 키 (키 목록의 첫 번째)
     """
-    key = os.getenv('ENCRYPTION_KEY')
-    
-    if not key:
-        print("⚠️ WARNING: ENCRYPTION_KEY not set. Generating new key for development.")
-        key = Fernet.generate_key().decode()
-        print(f"Generated key (save this to .env): {key}")
-        return key.encode()
-    
-    if isinstance(key, str):
-        try:
-            Fernet(key.encode())
-            return key.encode()
-        except:
-            return base64.b64decode(key)
-    
-    return key
+    return get_encryption_keys()[0]
+
+def get_cipher() -> MultiFernet:
+    """프로세스에서 공유하는 키링"""
+    global _cipher
+    if _cipher is None:
+        cipher = MultiFernet([Fernet(key) for key in get_encryption_keys()])
+        with _lock:
+            if _cipher is None:
+                _cipher = cipher
+    return _cipher
+
+def reset_cipher():
+    """환경 변수의 키가 바뀐 경우 키링을 다시 만들도록 초기화"""
+    global _cipher, _keys
+    with _lock:
+        _cipher = None
+        _keys = None
 
 def encrypt_pat(pat: str) -> str:
     """PAT를 암호화하여 반환"""
-    key = get_encryption_key()
-    f = Fernet(key)
-    encrypted = f.encrypt(pat.encode())
+    encrypted = get_cipher().encrypt(pat.encode())
     return base64.b64encode(encrypted).decode()
 
 def decrypt_pat(encrypted_pat: str) -> str:
     """암호화된 PAT를 복호화하여 반환"""
-    key = get_encryption_key()
-    f = Fernet(key)
     try:
         encrypted_bytes = base64.b64decode(encrypted_pat.encode())
     except (binascii.Error, ValueError) as e:
         raise ValueError("Invalid encrypted PAT format") from e
-    decrypted = f.decrypt(encrypted_bytes)
+    try:
+        decrypted = get_cipher().decrypt(encrypted_bytes)
+    except InvalidToken as e:
+        raise ValueError("PAT was encrypted with an unknown key") from e
     return decrypted.decode()
 
+def rotate_encrypted_pat(encrypted_pat: str) -> str:
+    """키 목록 중 하나로 암호화된 PAT를 첫 번째 키로 다시 암호화"""
+    try:
+        encrypted_bytes = base64.b64decode(encrypted_pat.encode())
+    except (binascii.Error, ValueError) as e:
+        raise ValueError("Invalid encrypted PAT format") from e
+    try:
+        rotated = get_cipher().rotate(encrypted_bytes)
+    except InvalidToken as e:
+        raise ValueError("PAT was encrypted with an unknown key") from e
+    return base64.b64encode(rotated).decode()
@@ -0,0 +1,60 @@
+# tests/conftest.py
+"""
+테스트 공통 설정
+
+테스트마다 메모리 SQLite DB를 새로 만들어 server.models.database의 엔진/세션에 연결한다.
+(서비스는 get_db()로 세션을 열고 닫으므로, 모든 연결이 같은 메모리 DB를 보도록 StaticPool 사용)
+"""
+import os
+
+# server 패키지를 import하기 전에 설정 (config/database가 import 시점에 읽음)
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ.setdefault('ENCRYPTION_KEY', 'ZmDfcTF7_60GrrY167zsiPd67pEvs0aGOv2oasOM1Pg=')
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from server.models import database
+from server.models import Test
+
+
+@pytest.fixture(autouse=True)
+def db_engine(monkeypatch):
+    """테스트마다 빈 메모리 DB"""
+    engine = create_engine(
+        'sqlite://',
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool
+    )
+    monkeypatch.setattr(database, 'engine', engine)
+    database.SessionLocal.configure(bind=engine)
+    database.init_db()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db():
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_test(db):
+    """Test 행 생성 (기본값: 구독 1의 PR #1)"""
+    def _make_test(**values):
+        test = Test(**{
+            'subscription_id': 1,
+            'pr_number': 1,
+            'repo_full_name': 'owner/repo',
+            'status': 'pending',
+            **values
+        })
+        db.add(test)
+        db.commit()
+        return test
+    return _make_test
@@ -0,0 +1,48 @@
+# tests/test_crypto.py
+"""
+PAT 암호화 키 교체 (ENCRYPTION_KEYS 키링)
+"""
+import pytest
+from cryptography.fernet import Fernet
+
+from server.utils.crypto import decrypt_pat, encrypt_pat, reset_cipher, rotate_encrypted_pat
+
+
+@pytest.fixture
+def use_keys(monkeypatch):
+    """ENCRYPTION_KEYS를 바꾸고 키링을 다시 만들도록 초기화"""
+    def _use_keys(*keys):
+        monkeypatch.setenv('ENCRYPTION_KEYS', ','.join(keys))
+        reset_cipher()
+    yield _use_keys
+    monkeypatch.delenv('ENCRYPTION_KEYS', raising=False)
+    reset_cipher()
+
+
+def test_rotate_reencrypts_with_first_key(use_keys):
+    old_key = Fernet.generate_key().decode()
+    new_key = Fernet.generate_key().decode()
+    
+    use_keys(old_key)
+    encrypted = encrypt_pat('ghp_secret')
+    
+    use_keys(new_key, old_key)
+    rotated = rotate_encrypted_pat(encrypted)
+    assert rotated != encrypted
+    
+    # 이전 키를 제거해도 교체된 PAT는 복호화되고, 교체 전 PAT는 복호화되지 않음
+    use_keys(new_key)
+    assert decrypt_pat(rotated) == 'ghp_secret'
+    with pytest.raises(ValueError):
+        decrypt_pat(encrypted)
+
+
+def test_rotate_rejects_unknown_key_and_invalid_format(use_keys):
+    use_keys(Fernet.generate_key().decode())
+    encrypted = encrypt_pat('ghp_secret')
+    
+    use_keys(Fernet.generate_key().decode())
+    with pytest.raises(ValueError, match='unknown key'):
+        rotate_encrypted_pat(encrypted)
+    with pytest.raises(ValueError, match='Invalid encrypted PAT format'):
+        rotate_encrypted_pat('not base64!')
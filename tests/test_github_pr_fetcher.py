@@ -0,0 +1,113 @@
+# tests/test_github_pr_fetcher.py
+"""
+GitHubPRFetcher.list_open_pulls: ETag/Last-Modified 조건부 요청과 304 캐시 사용
+"""
+from datetime import datetime
+
+import pytest
+
+from server.services import github_pr_fetcher
+from server.services.github_pr_fetcher import GitHubPRFetcher
+
+ETAG = 'W/"open-pulls-v1"'
+LAST_MODIFIED = 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+        self.text = str(body)
+    
+    def json(self):
+        return self._body
+
+
+def pull(number, updated_at):
+    return {
+        'number': number,
+        'title': f'PR {number}',
+        'head': {'ref': f'feature-{number}', 'sha': f'{number}' * 40},
+        'html_url': f'https://github.com/owner/repo/pull/{number}',
+        'created_at': '2024-01-01T00:00:00Z',
+        'updated_at': updated_at
+    }
+
+
+@pytest.fixture
+def github(monkeypatch):
+    """requests.get을 응답 목록으로 대체하고 보낸 요청 헤더를 기록"""
+    calls = []
+    responses = []
+    
+    def fake_get(url, headers=None, params=None, timeout=None):
+        calls.append({'url': url, 'headers': dict(headers or {}), 'params': params})
+        return responses.pop(0)
+    
+    monkeypatch.setattr(github_pr_fetcher.requests, 'get', fake_get)
+    return calls, responses
+
+
+def test_not_modified_response_uses_cached_pulls(github):
+    calls, responses = github
+    fetcher = GitHubPRFetcher()
+    responses.append(FakeResponse(
+        200,
+        [pull(2, '2024-01-02T00:00:00Z'), pull(1, '2024-01-01T12:00:00Z')],
+        {'ETag': ETAG, 'Last-Modified': LAST_MODIFIED}
+    ))
+    responses.append(FakeResponse(304))
+    
+    first = fetcher.list_open_pulls('owner/repo', pat='ghp_token')
+    assert first['not_modified'] is False
+    assert [pr['number'] for pr in first['pulls']] == [2, 1]
+    assert 'If-None-Match' not in calls[0]['headers']
+    
+    second = fetcher.list_open_pulls('owner/repo', pat='ghp_token')
+    assert calls[1]['headers']['If-None-Match'] == ETAG
+    assert calls[1]['headers']['If-Modified-Since'] == LAST_MODIFIED
+    assert second['not_modified'] is True
+    assert second['complete'] is True
+    assert second['pulls'] == first['pulls']
+
+
+def test_cache_is_separate_per_credential(github):
+    calls, responses = github
+    fetcher = GitHubPRFetcher()
+    responses.append(FakeResponse(200, [pull(1, '2024-01-01T00:00:00Z')], {'ETag': ETAG}))
+    responses.append(FakeResponse(200, [], {'ETag': 'W/"other"'}))
+    
+    fetcher.list_open_pulls('owner/repo', pat='ghp_one', credential_id=1)
+    result = fetcher.list_open_pulls('owner/repo', pat='ghp_two', credential_id=2)
+    
+    assert 'If-None-Match' not in calls[1]['headers']
+    assert result['pulls'] == []
+
+
+def test_response_without_validators_is_not_cached(github):
+    calls, responses = github
+    fetcher = GitHubPRFetcher()
+    responses.append(FakeResponse(200, [pull(1, '2024-01-01T00:00:00Z')]))
+    responses.append(FakeResponse(200, [pull(1, '2024-01-01T00:00:00Z')]))
+    
+    fetcher.list_open_pulls('owner/repo')
+    fetcher.list_open_pulls('owner/repo')
+    
+    assert 'If-None-Match' not in calls[1]['headers']
+    assert 'If-Modified-Since' not in calls[1]['headers']
+
+
+def test_since_stops_at_older_pulls(github):
+    calls, responses = github
+    fetcher = GitHubPRFetcher()
+    responses.append(FakeResponse(
+        200,
+        [pull(3, '2024-01-03T00:00:00Z'), pull(2, '2024-01-02T00:00:00Z'), pull(1, '2024-01-01T00:00:00Z')],
+        {'ETag': ETAG}
+    ))
+    
+    result = fetcher.list_open_pulls('owner/repo', since=datetime(2024, 1, 2))
+    
+    assert [pr['number'] for pr in result['pulls']] == [3]
+    assert result['complete'] is False
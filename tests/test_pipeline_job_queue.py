@@ -0,0 +1,96 @@
+# tests/test_pipeline_job_queue.py
+"""
+PipelineJobQueue: Lease 획득/연장, 만료된 Lease 회수, 최대 시도 후 포기
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from server import models
+from server.models import PipelineJob
+from server.services.pipeline_job_queue import PipelineJobQueue, QueueFullError, JOB_TYPE_PR_TEST
+
+JOB_TYPES = [JOB_TYPE_PR_TEST]
+
+
+def expire_lease(db, job_id):
+    """워커 프로세스가 죽어 Heartbeat가 끊긴 상태"""
+    db.query(PipelineJob).filter(PipelineJob.id == job_id).update({
+        'lease_expires_at': datetime.utcnow() - timedelta(seconds=1)
+    })
+    db.commit()
+
+
+def test_enqueue_skips_active_duplicate_and_applies_backpressure(make_test):
+    queue = PipelineJobQueue()
+    first = make_test()
+    second = make_test(pr_number=2)
+    
+    job_id = queue.enqueue(first.id, 1, 1, priority=1)
+    assert job_id is not None
+    assert queue.enqueue(first.id, 1, 1, priority=1) is None
+    
+    with pytest.raises(QueueFullError):
+        queue.enqueue(second.id, 1, 2, priority=1, max_queued=1)
+
+
+def test_claim_takes_highest_priority_and_extends_lease(make_test):
+    queue = PipelineJobQueue(lease_seconds=60)
+    low = make_test()
+    high = make_test(pr_number=2)
+    queue.enqueue(low.id, 1, 1, priority=2)
+    high_job_id = queue.enqueue(high.id, 1, 2, priority=0)
+    
+    job = queue.claim('worker-1', JOB_TYPES)
+    assert job['id'] == high_job_id
+    assert job['attempt'] == 1
+    assert queue.heartbeat(job['id'], 'worker-1') is True
+    assert queue.heartbeat(job['id'], 'worker-2') is False
+    assert queue.stats()['running'] == 1
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(db, make_test):
+    queue = PipelineJobQueue(lease_seconds=60, max_attempts=3)
+    test = make_test()
+    job_id = queue.enqueue(test.id, 1, 1, priority=1)
+    
+    assert queue.claim('worker-1', JOB_TYPES)['id'] == job_id
+    # Lease가 유효한 동안에는 다른 워커가 가져가지 않음
+    assert queue.claim('worker-2', JOB_TYPES) is None
+    
+    expire_lease(db, job_id)
+    job = queue.claim('worker-2', JOB_TYPES)
+    assert job['id'] == job_id
+    assert job['attempt'] == 2
+    
+    # 이전 워커는 Lease를 잃었으므로 연장/종료 기록이 반영되지 않음
+    assert queue.heartbeat(job_id, 'worker-1') is False
+    queue.complete(job_id, 'worker-1', success=False, error='stale worker')
+    db.expire_all()
+    stored = db.get(PipelineJob, job_id)
+    assert stored.status == 'running'
+    assert stored.lease_owner == 'worker-2'
+    
+    queue.complete(job_id, 'worker-2', success=True)
+    db.expire_all()
+    assert db.get(PipelineJob, job_id).status == 'completed'
+
+
+def test_gives_up_after_max_attempts(db, make_test):
+    queue = PipelineJobQueue(lease_seconds=60, max_attempts=2)
+    test = make_test(status='running')
+    job_id = queue.enqueue(test.id, 1, 1, priority=1)
+    
+    for worker_id in ['worker-1', 'worker-2']:
+        assert queue.claim(worker_id, JOB_TYPES)['id'] == job_id
+        expire_lease(db, job_id)
+    
+    assert queue.claim('worker-3', JOB_TYPES) is None
+    
+    db.expire_all()
+    job = db.get(PipelineJob, job_id)
+    assert job.status == 'failed'
+    assert job.last_error == 'Gave up after 2 attempt(s)'
+    assert job.lease_expires_at is None
+    assert db.get(models.Test, test.id).status == 'failed'
+    assert db.get(models.TestSummary, test.id).status == 'failed'
@@ -0,0 +1,114 @@
+# tests/test_scenario_impact_service.py
+"""
+ScenarioImpactService.plan: 바뀐 파일과 관련된 시나리오만 다시 실행하고 나머지는 이전 결과를 참조
+"""
+from types import SimpleNamespace
+
+from server.services.scenario_impact_service import ScenarioImpactService
+
+BASE_SHA = 'a' * 40
+HEAD_SHA = 'b' * 40
+
+PREVIOUS_RESULTS = [
+    {
+        'scenario_name': 'Login',
+        'description': 'Log in with a valid account',
+        'expected_result': 'Dashboard is shown',
+        'actions': [{'type': 'click', 'selector': '#login'}],
+        'related_files': ['src/login.js'],
+        'success': True,
+        'screenshot': 'base64-login'
+    },
+    {
+        'scenario_name': 'Checkout',
+        'description': 'Pay for the cart',
+        'expected_result': 'Order is confirmed',
+        'actions': [{'type': 'click', 'selector': '#pay'}],
+        'related_files': ['src/checkout.js'],
+        'success': False,
+        'screenshot': 'base64-checkout',
+        'carried_forward_from': 'c' * 40
+    },
+    {
+        'scenario_name': 'Home',
+        'description': 'Open the home page',
+        'expected_result': 'Home page is shown',
+        'actions': [],
+        'success': True
+    }
+]
+
+
+def fake_pr(changed, status='ahead'):
+    comparison = SimpleNamespace(
+        status=status,
+        files=[SimpleNamespace(filename=filename, previous_filename=None) for filename in changed]
+    )
+    repo = SimpleNamespace(compare=lambda base, head: comparison)
+    return SimpleNamespace(head=SimpleNamespace(sha=HEAD_SHA, repo=repo), base=SimpleNamespace(repo=repo))
+
+
+def pr_diff(*filenames):
+    return [{'filename': filename} for filename in filenames]
+
+
+def make_baseline(make_test, **values):
+    return make_test(**{
+        'status': 'completed',
+        'head_sha': BASE_SHA,
+        'test_results': PREVIOUS_RESULTS,
+        'diff_files': ['src/login.js', 'src/checkout.js'],
+        **values
+    })
+
+
+def test_plan_carries_unaffected_scenarios_by_reference(make_test):
+    baseline = make_baseline(make_test)
+    current = make_test(head_sha=HEAD_SHA)
+    
+    plan = ScenarioImpactService(current.id, 1, 1).plan(
+        fake_pr(['src/login.js']),
+        pr_diff('src/login.js', 'src/checkout.js')
+    )
+    
+    assert plan['base_sha'] == BASE_SHA
+    assert [scenario['name'] for scenario in plan['scenarios']] == ['Login', 'Checkout', 'Home']
+    assert 'screenshot' not in plan['scenarios'][0]
+    assert plan['scenarios'][0]['related_files'] == ['src/login.js']
+    # Login은 관련 파일이 바뀌었고 Home은 related_files가 없으므로 다시 실행
+    assert plan['carried'] == {
+        1: {'test_id': baseline.id, 'index': 1, 'carried_forward_from': 'c' * 40}
+    }
+
+
+def test_plan_runs_all_when_new_file_is_added(make_test):
+    make_baseline(make_test)
+    current = make_test(head_sha=HEAD_SHA)
+    
+    plan = ScenarioImpactService(current.id, 1, 1).plan(
+        fake_pr(['src/cart.js']),
+        pr_diff('src/login.js', 'src/checkout.js', 'src/cart.js')
+    )
+    assert plan is None
+
+
+def test_plan_runs_all_after_force_push(make_test):
+    make_baseline(make_test)
+    current = make_test(head_sha=HEAD_SHA)
+    
+    plan = ScenarioImpactService(current.id, 1, 1).plan(
+        fake_pr(['src/login.js'], status='diverged'),
+        pr_diff('src/login.js', 'src/checkout.js')
+    )
+    assert plan is None
+
+
+def test_plan_ignores_unfinished_baseline(make_test):
+    make_baseline(make_test, status='failed', scenarios_total=3, scenarios_completed=1)
+    current = make_test(head_sha=HEAD_SHA)
+    
+    plan = ScenarioImpactService(current.id, 1, 1).plan(
+        fake_pr(['src/login.js']),
+        pr_diff('src/login.js', 'src/checkout.js')
+    )
+    assert plan is None
@@ -0,0 +1,71 @@
+# tests/test_test_summary.py
+"""
+TestSummary: 행 단위 변경(flush 이벤트)과 일괄 UPDATE/DELETE(do_orm_execute)에서 요약 동기화
+"""
+from server import models
+
+
+def summary_of(db, test_id):
+    db.expire_all()
+    return db.get(models.TestSummary, test_id)
+
+
+def test_insert_and_update_keep_summary_in_sync(db, make_test):
+    test = make_test(head_sha='a' * 40)
+    summary = summary_of(db, test.id)
+    assert summary.status == 'pending'
+    assert summary.head_sha == 'a' * 40
+    assert summary.finished_run is False
+    
+    test.status = 'completed'
+    test.test_results = [{'success': True}]
+    db.commit()
+    summary = summary_of(db, test.id)
+    assert summary.status == 'completed'
+    assert summary.finished_run is True
+
+
+def test_failed_run_with_partial_results_is_not_finished(db, make_test):
+    test = make_test(status='failed', test_results=[{'success': False}], scenarios_total=3, scenarios_completed=1)
+    assert summary_of(db, test.id).finished_run is False
+    
+    test.scenarios_completed = 3
+    db.commit()
+    assert summary_of(db, test.id).finished_run is True
+
+
+def test_bulk_update_syncs_matching_summaries(db, make_test):
+    first = make_test(pr_number=1)
+    second = make_test(pr_number=2)
+    other = make_test(pr_number=3, status='completed')
+    
+    updated = db.query(models.Test).filter(models.Test.status == 'pending').update(
+        {'status': 'superseded'}, synchronize_session=False
+    )
+    db.commit()
+    
+    assert updated == 2
+    assert summary_of(db, first.id).status == 'superseded'
+    assert summary_of(db, second.id).status == 'superseded'
+    assert summary_of(db, other.id).status == 'completed'
+
+
+def test_bulk_update_recomputes_finished_run(db, make_test):
+    test = make_test(status='running', test_results=[{'success': False}], scenarios_total=1, scenarios_completed=1)
+    assert summary_of(db, test.id).finished_run is False
+    
+    db.query(models.Test).filter(models.Test.id == test.id).update({'status': 'failed'}, synchronize_session=False)
+    db.commit()
+    assert summary_of(db, test.id).finished_run is True
+
+
+def test_bulk_delete_removes_summaries(db, make_test):
+    removed_id = make_test(pr_number=1).id
+    kept_id = make_test(pr_number=2).id
+    
+    db.query(models.Test).filter(models.Test.pr_number == 1).delete(synchronize_session=False)
+    db.commit()
+    
+    assert summary_of(db, removed_id) is None
+    assert summary_of(db, kept_id) is not None
+    assert db.query(models.TestSummary).count() == 1